@@ -0,0 +1,134 @@
+#!/usr/bin/python3
+import argparse
+import concurrent.futures
+import io
+import json
+import os.path
+import pickle
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import intramark
+from differential_benchmark import option_groups, write_corpus
+
+
+def create_option_sets():
+    "Create the list of command line arguments for each option set, excluding filenames, with every alternative of each option group alone and together with every alternative of every other option group. Option groups using worker processes are left out, since they are not run within threads."
+
+    import itertools
+
+    used_option_groups = [ option_group for option_group_name, option_group in option_groups.items() if option_group_name != "jobs" ]
+    option_sets = []
+    for option_group in used_option_groups:
+        option_sets.extend(option_group)
+    for first_option_group, second_option_group in itertools.combinations(used_option_groups, 2):
+        for first_option_group_alternative, second_option_group_alternative in itertools.product(first_option_group, second_option_group):
+            option_sets.append(first_option_group_alternative + second_option_group_alternative)
+    return option_sets
+
+def transform_document(document_contents, information_from_command_line_input):
+    "Transform a document held in memory with `process_document`, returning the exit status and the output document, or the name of the exception raised."
+
+    output_binary_file = io.BytesIO()
+    try:
+        exit_status = intramark.process_document(document_contents, information_from_command_line_input, output_binary_file, "document.md")
+    except Exception as exception:
+        return type(exception).__name__, b""
+    return exit_status, output_binary_file.getvalue()
+
+def modify_shared_analysis(document_contents, information_from_command_line_input, document_markup_entire, encoding_information):
+    "Modify a document with `markup_modification` using an analysis shared with other calls, returning the modified contents, or the name of the exception raised."
+
+    temporary_file = io.StringIO()
+    try:
+        intramark.markup_modification(document_contents, temporary_file, information_from_command_line_input, document_markup_entire, encoding_information)
+    except Exception as exception:
+        return type(exception).__name__
+    return temporary_file.getvalue()
+
+def concurrency_benchmark(corpus_filenames, option_sets, number_of_threads, number_of_rounds, seed):
+    """Transform every document with every option set serially, and then concurrently from a thread pool, returning a dictionary of results in the following way:
+
+    ```yaml
+    task_count: 2300                     # a numerical value indicating the number of transformations in each run
+    serial_time: 9.1                     # a numerical value indicating the wall-clock time of the serial run in seconds
+    concurrent_times: [3.2, 3.1]         # a key containing the wall-clock time of each concurrent round in seconds
+    differing_tasks: []                  # a key containing the option set and filename of each transformation whose concurrent output differs from its serial output
+    changed_analyses: []                 # a key containing the filename of each document whose shared analysis was changed by modification
+    ```
+
+    Each concurrent round transforms the documents in a different random order, both through `process_document` and through `markup_modification` with a single analysis of each document shared by every thread, so that any state shared between calls would be detected as a difference in output or a change in the shared analysis.
+    """
+
+    document_contents_by_filename = {}
+    for corpus_filename in corpus_filenames:
+        with open(corpus_filename, "rb") as opened_file:
+            document_contents_by_filename[corpus_filename] = opened_file.read()
+    # Assignments to hold the information for each option set, which is shared by every thread, and the analysis of each document, which is shared by every thread along with a copy for detecting changes
+    information_by_option_set = { tuple(option_set): intramark.initial_input(option_set + [corpus_filenames[0]]) for option_set in option_sets }
+    encoding_information_by_filename = { corpus_filename: intramark.determine_encoding_information(document_contents) for corpus_filename, document_contents in document_contents_by_filename.items() }
+    document_markup_entire_by_filename = { corpus_filename: intramark.markup_analysis(document_contents, encoding_information_by_filename[corpus_filename], keep_normalized_link_labels=True) for corpus_filename, document_contents in document_contents_by_filename.items() }
+    pickled_document_markup_entire_by_filename = { corpus_filename: pickle.dumps(document_markup_entire) for corpus_filename, document_markup_entire in document_markup_entire_by_filename.items() }
+
+    tasks = [ (option_set, corpus_filename) for option_set in information_by_option_set for corpus_filename in corpus_filenames ]
+
+    def run_task(task):
+        "Transform a document with an option set in both ways, returning the results."
+        option_set, corpus_filename = task
+        return (transform_document(document_contents_by_filename[corpus_filename], information_by_option_set[option_set]),
+                modify_shared_analysis(document_contents_by_filename[corpus_filename], information_by_option_set[option_set], document_markup_entire_by_filename[corpus_filename], encoding_information_by_filename[corpus_filename]))
+
+    start_time = time.perf_counter()
+    serial_results = { task: run_task(task) for task in tasks }
+    serial_time = time.perf_counter() - start_time
+
+    random_generator = random.Random(seed)
+    concurrent_times = []
+    differing_tasks = set()
+    for round_number in range(number_of_rounds):
+        shuffled_tasks = list(tasks)
+        random_generator.shuffle(shuffled_tasks)
+        start_time = time.perf_counter()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=number_of_threads) as executor:
+            concurrent_results = dict(zip(shuffled_tasks, executor.map(run_task, shuffled_tasks)))
+        concurrent_times.append(time.perf_counter() - start_time)
+        for task in tasks:
+            if concurrent_results[task] != serial_results[task]:
+                differing_tasks.add(task)
+
+    return {
+        "task_count": len(tasks),
+        "serial_time": round(serial_time, 3),
+        "concurrent_times": [ round(concurrent_time, 3) for concurrent_time in concurrent_times ],
+        "differing_tasks": [ {"option_set": list(option_set), "filename": os.path.basename(corpus_filename)} for option_set, corpus_filename in sorted(differing_tasks) ],
+        "changed_analyses": [ os.path.basename(corpus_filename) for corpus_filename in corpus_filenames if pickle.dumps(document_markup_entire_by_filename[corpus_filename]) != pickled_document_markup_entire_by_filename[corpus_filename] ]}
+
+def main():
+    "Run the stress test, displaying the results as JSON, and exiting with status 1 if any concurrent output differs from serial output or any shared analysis was changed."
+
+    parser = argparse.ArgumentParser(description="Stress test intramark.py within a single process, by transforming a generated and fuzzed Markdown corpus with many combinations of command line arguments from a thread pool, and checking that the output is identical to serial runs and that analyses shared between threads are left unchanged. Run it with a free-threaded build of Python, such as *python3.13t*, to test without the global interpreter lock.")
+    parser.add_argument("-t", "--threads", type=int, help="Number of threads. The default is 8.", default=8)
+    parser.add_argument("--rounds", type=int, help="Number of concurrent rounds, each in a different random order. The default is 3.", default=3)
+    parser.add_argument("--seed", type=int, help="Seed from which the corpus and the orders of the rounds are generated. The default is 0.", default=0)
+    parser.add_argument("--fuzzed-documents", type=int, help="Number of fuzzed documents in the corpus. The default is 20.", default=20)
+    parser.add_argument("--large-document-size", type=int, help="Number of fragments in the large document of the corpus. The default is 500.", default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temporary_directory_name:
+        corpus_filenames = write_corpus(temporary_directory_name, args.seed, args.fuzzed_documents, args.large_document_size)
+        benchmark_results = concurrency_benchmark(corpus_filenames, create_option_sets(), args.threads, args.rounds, args.seed)
+    # Determining if the global interpreter lock is enabled, which is only possible to disable in free-threaded builds of Python 3.13 and later
+    benchmark_results["global_interpreter_lock_enabled"] = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(json.dumps(benchmark_results, indent=4))
+
+    # Assignment to hold the exit status
+    exit_status = 0
+    if bool(benchmark_results["differing_tasks"]) == True or bool(benchmark_results["changed_analyses"]) == True:
+        exit_status = 1
+    return exit_status
+
+if __name__ == "__main__":
+    sys.exit(main())
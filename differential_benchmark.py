@@ -0,0 +1,262 @@
+#!/usr/bin/python3
+import argparse
+import itertools
+import json
+import os.path
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+# Assignment to hold the filename of the program tested against the reference, which is in the same directory as this file
+intramark_filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), "intramark.py")
+# Assignment to hold the groups of command line arguments combined to form each tested invocation, with each group containing mutually exclusive alternatives
+option_groups = {
+    "heading": [["+H", "1"], ["+H", "max"], ["-H", "1"], ["-H", "max"]],
+    "equalize_heading": [["=H"]],
+    "link": [["-k", "i"], ["-k", "ip"], ["-k", "r"], ["-k", "rs"]],
+    "footnote": [["-f", "n"], ["-f", "u"], ["-f", "e"], ["-f", "nue"]],
+    "strip": [["-s", "b"], ["-s", "H"], ["-s", "H-end"]],
+    "table_of_contents": [["--toc", "insert"]],
+    "jobs": [["-j", "4"]],
+    "spill_definitions": [["--spill-definitions", "1"]]}
+# Assignment to hold the command line arguments of invocations that are not combined with other arguments, since they display something other than the output document
+standalone_invocations = [["--toc", "display"], ["--lint", "links"], ["-A", "H"]]
+# Assignment to hold fragments of Markdown from which documents are generated, covering each kind of markup the program analyzes and the block structures in which markup is skipped
+markdown_fragments = [
+    "# Heading one\n",
+    "## Heading two ##\n",
+    "   ### Heading three with trailing space ###   \n",
+    "###### Heading six\n",
+    "####### Not a heading\n",
+    "#\n",
+    "Setext heading\n===\n",
+    "Text with a hard line break  \nand the next line.\n",
+    "Text with a backslash hard line break\\\nand the next line.\n",
+    "See [an inline link](http://example.com/inline) and [another](<http://example.com/angle brackets> \"title\").\n",
+    "See [foo], [foo][], [text][Foo] and [undefined].\n",
+    "See ![an image](image.png) and [nested [brackets]](http://example.com/nested).\n",
+    "[foo]: http://example.com/foo\n",
+    "[FOO]:   http://example.com/duplicate\n",
+    "[unused]: http://example.com/unused \"title\"\n",
+    "   [indented]: http://example.com/indented\n",
+    "A footnote[^1] and another[^note] and an undefined one[^missing].\n",
+    "[^1]: The first footnote.\n",
+    "[^note]: A footnote\n    with an indented continuation line.\n",
+    "[^unused]: An unused footnote.\n",
+    "```\n# Not a heading in fenced code\n[foo]: http://example.com/fenced\n```\n",
+    "~~~python\n[link](http://example.com/fenced)\n~~~\n",
+    "    # Not a heading in indented code\n",
+    "<div>\n# Not a heading in an HTML block\n</div>\n",
+    "<!-- toc -->\n",
+    "<!-- toc -->\n- [Stale](#stale)\n<!-- tocstop -->\n",
+    "> # Heading in a block quote\n> [quoted](http://example.com/quoted)\n",
+    "- List item with [a link](http://example.com/list)\n- Another item  \n  continued\n",
+    "Inline `code with [brackets](not-a-link)` and *emphasis*.\n",
+    "Unicode text: café, 日本語, and [ümläut](http://example.com/ü).\n",
+    "\tTab-indented text with [a link](http://example.com/tab)\n",
+    "\n",
+    "\n",
+    "\n"]
+# Assignment to hold the characters inserted when fuzzing documents, which are weighted toward characters with a meaning in Markdown
+fuzzing_characters = "[]()<>#^:!*`~\\-=\" \t\n" + "ab1é"
+
+def generate_document(random_generator, fragment_count):
+    "Generate a Markdown document from randomly chosen fragments, starting with a heading so that heading modifications have an effect."
+
+    return markdown_fragments[0] + "\n" + "".join( random_generator.choice(markdown_fragments) + "\n" for fragment_number in range(fragment_count) )
+
+def fuzz_document(random_generator, document_contents, mutation_count):
+    "Mutate a Markdown document by inserting, deleting, and duplicating characters and lines at random positions."
+
+    document_characters = list(document_contents)
+    for mutation_number in range(mutation_count):
+        mutation_kind = random_generator.choice(["insert", "delete", "duplicate_line", "swap_lines"])
+        position = random_generator.randrange(len(document_characters) + 1)
+        if mutation_kind == "insert":
+            document_characters.insert(position, random_generator.choice(fuzzing_characters))
+        elif mutation_kind == "delete" and position < len(document_characters):
+            del document_characters[position]
+        else:
+            document_lines = "".join(document_characters).splitlines(True)
+            if len(document_lines) < 2:
+                continue
+            line_number = random_generator.randrange(len(document_lines) - 1)
+            if mutation_kind == "duplicate_line":
+                document_lines.insert(line_number, document_lines[line_number])
+            else:
+                document_lines[line_number], document_lines[line_number + 1] = document_lines[line_number + 1], document_lines[line_number]
+            document_characters = list("".join(document_lines))
+    return "".join(document_characters)
+
+def write_corpus(corpus_directory_name, seed, fuzzed_document_count, large_document_fragment_count):
+    """Write the corpus of Markdown files to a directory, returning a list of their filenames.
+
+    The corpus is reproducible from the seed, and consists of one generated document containing every fragment, a number of fuzzed documents, one large generated document for measuring speed, two documents with link reference definitions but no potential link labels, one document with link reference definitions with matching link labels, and one document containing bytes that are not valid UTF-8, which is processed byte-transparently.
+    """
+
+    random_generator = random.Random(seed)
+    corpus_documents = {}
+    corpus_documents["every_fragment.md"] = "".join( markdown_fragment + "\n" for markdown_fragment in markdown_fragments ).encode("utf-8")
+    for document_number in range(fuzzed_document_count):
+        document_contents = generate_document(random_generator, random_generator.randint(5, 40))
+        corpus_documents["fuzzed_{}.md".format(document_number)] = fuzz_document(random_generator, document_contents, random_generator.randint(0, 30)).encode("utf-8")
+    corpus_documents["large.md"] = generate_document(random_generator, large_document_fragment_count).encode("utf-8")
+    # Documents with link reference definitions but no potential link labels, for which normalized link labels are not kept by the analysis
+    corpus_documents["definitions_without_link_labels.md"] = "a [x](u)\n\n[1]: http://z\n".encode("utf-8")
+    corpus_documents["definition_only.md"] = "[1]: http://z\n".encode("utf-8")
+    # Document with an inline link whose destination is that of a later link reference definition with a matching link label, which does not take precedence
+    corpus_documents["duplicate_link_labels.md"] = "See [x](u2).\n\n[a]: u1\n[a]: u2\n".encode("utf-8")
+    corpus_documents["undecodable.md"] = "# Café heading\n\nSee [café] and [x](http://example.com/café).  \nText.[^1]\n\n[café]: http://example.com/é\n[^1]: Footnote.\n".encode("latin-1")
+
+    corpus_filenames = []
+    for corpus_document_name, corpus_document_contents in corpus_documents.items():
+        corpus_filename = os.path.join(corpus_directory_name, corpus_document_name)
+        with open(corpus_filename, "wb") as opened_file:
+            opened_file.write(corpus_document_contents)
+        corpus_filenames.append(corpus_filename)
+    return corpus_filenames
+
+def create_invocations(exhaustive):
+    """Create the list of command line arguments for each tested invocation, excluding filenames.
+
+    By default, every alternative of each option group is tested alone and together with every alternative of every other option group. If `exhaustive` is true, every combination of alternatives from any number of option groups is tested instead, which takes far longer. Each invocation is tested both with and without *-d*, except for standalone invocations.
+    """
+
+    invocations = [[]]
+    if exhaustive == True:
+        for option_group_alternatives in itertools.product(*( [None] + option_group for option_group in option_groups.values() )):
+            invocation = [ command_line_argument for option_group_alternative in option_group_alternatives if option_group_alternative != None for command_line_argument in option_group_alternative ]
+            if invocation != []:
+                invocations.append(invocation)
+    else:
+        for option_group_name, option_group in option_groups.items():
+            invocations.extend(option_group)
+        for first_option_group, second_option_group in itertools.combinations(option_groups.values(), 2):
+            for first_option_group_alternative, second_option_group_alternative in itertools.product(first_option_group, second_option_group):
+                invocations.append(first_option_group_alternative + second_option_group_alternative)
+    invocations = invocations + [ ["-d"] + invocation for invocation in invocations ]
+    return invocations + standalone_invocations
+
+def run_program(program_filename, command_line_arguments):
+    "Run a program once, returning the wall-clock time in seconds, the exit status, the output, and the error output."
+
+    start_time = time.perf_counter()
+    completed_process = subprocess.run([sys.executable, program_filename] + command_line_arguments, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    wall_clock_time = time.perf_counter() - start_time
+    return wall_clock_time, completed_process.returncode, completed_process.stdout, completed_process.stderr
+
+def displays_traceback(error_output):
+    "Determine if the error output of a program contains a Python traceback, indicating that the program crashed."
+
+    return b"Traceback (most recent call last)" in error_output
+
+def differential_benchmark(reference_filename, candidate_filename, corpus_filenames, invocations, number_of_runs):
+    """Run the reference and candidate programs on the whole corpus for each invocation, returning a list of results in the following way:
+
+    ```yaml
+    - command_line_arguments: [-k, i]         # a list of the command line arguments of the invocation, excluding filenames
+      identical: true                         # a boolean value indicating whether the output, error output, and exit status of both programs are identical
+      crashed: false                          # a boolean value indicating whether either program displayed a Python traceback
+      differing_filenames: []                 # a list of the corpus files for which output, error output, or exit status differs, or for which either program crashed
+      reference_median_wall_clock_time: 0.21  # a numerical value indicating the median wall-clock time of the reference program in seconds
+      candidate_median_wall_clock_time: 0.07  # a numerical value indicating the median wall-clock time of the candidate program in seconds
+      speedup: 3.0                            # a numerical value indicating the reference time divided by the candidate time
+    ```
+
+    The output, error output, and exit status of the first run of each program are compared. Error output is compared as well as exit status, since a crash and problems found by *--lint links* both give exit status 1. If they differ, or if either program crashed, each corpus file is run separately, so that the files for which output differs or a program crashed are identified.
+    """
+
+    differential_results = []
+    for command_line_arguments in invocations:
+        reference_wall_clock_times = []
+        candidate_wall_clock_times = []
+        for run_number in range(number_of_runs):
+            # Alternating the programs, so that changes in system load affect both alike
+            reference_wall_clock_time, reference_exit_status, reference_output, reference_error_output = run_program(reference_filename, corpus_filenames + command_line_arguments)
+            candidate_wall_clock_time, candidate_exit_status, candidate_output, candidate_error_output = run_program(candidate_filename, corpus_filenames + command_line_arguments)
+            reference_wall_clock_times.append(reference_wall_clock_time)
+            candidate_wall_clock_times.append(candidate_wall_clock_time)
+            if run_number == 0:
+                identical = (reference_exit_status, reference_output, reference_error_output) == (candidate_exit_status, candidate_output, candidate_error_output)
+                crashed = displays_traceback(reference_error_output) or displays_traceback(candidate_error_output)
+
+        differing_filenames = []
+        if identical == False or crashed == True:
+            for corpus_filename in corpus_filenames:
+                reference_result = run_program(reference_filename, [corpus_filename] + command_line_arguments)
+                candidate_result = run_program(candidate_filename, [corpus_filename] + command_line_arguments)
+                if reference_result[1:] != candidate_result[1:] or displays_traceback(reference_result[3]) or displays_traceback(candidate_result[3]):
+                    differing_filenames.append(corpus_filename)
+
+        reference_median_wall_clock_time = statistics.median(reference_wall_clock_times)
+        candidate_median_wall_clock_time = statistics.median(candidate_wall_clock_times)
+        differential_results.append({
+            "command_line_arguments": command_line_arguments,
+            "identical": identical,
+            "crashed": crashed,
+            "differing_filenames": differing_filenames,
+            "reference_median_wall_clock_time": round(reference_median_wall_clock_time, 4),
+            "candidate_median_wall_clock_time": round(candidate_median_wall_clock_time, 4),
+            "speedup": round(reference_median_wall_clock_time / candidate_median_wall_clock_time, 2)})
+    return differential_results
+
+def main():
+    "Compare a candidate program with a frozen reference program, displaying one line of JSON per invocation and a summary, and exiting with status 1 if any output differs or either program crashes."
+
+    parser = argparse.ArgumentParser(description="Compare intramark.py with a frozen reference version on a generated and fuzzed Markdown corpus, checking that the output documents, *-d* JSON, error output, and exit statuses are identical and that neither program crashes for combinations of command line arguments, and reporting the speedup for each combination, so that faster implementations can be adopted without silent changes in behavior.")
+    parser.add_argument("--reference", help="Filename of the reference program, or a git revision of the repository containing this file from which intramark.py and intramark_engine.py are taken. The default is HEAD.", default="HEAD")
+    parser.add_argument("--candidate", help="Filename of the candidate program. The default is intramark.py in the same directory as this file.", default=intramark_filename)
+    parser.add_argument("--seed", type=int, help="Seed from which the corpus is generated. The default is 0.", default=0)
+    parser.add_argument("--fuzzed-documents", type=int, help="Number of fuzzed documents in the corpus. The default is 20.", default=20)
+    parser.add_argument("--large-document-size", type=int, help="Number of fragments in the large document of the corpus, which is mainly used for measuring speed. The default is 5000.", default=5000)
+    parser.add_argument("-n", "--runs", type=int, help="Number of runs of each program for each combination of command line arguments, of which the median wall-clock time is used. The default is 1.", default=1)
+    parser.add_argument("--exhaustive", help="Test every combination of command line arguments, rather than each pair of them, which takes far longer.", action="store_true")
+    parser.add_argument("--keep-corpus", metavar="DIRECTORY", help="Write the corpus to a directory and keep it, so that differing files can be examined.", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temporary_directory_name:
+        # Determining if the reference program is a file, or is taken from a git revision
+        reference_filename = args.reference
+        if os.path.isfile(reference_filename) == False:
+            # Taking the module imported by intramark.py along with it, if the git revision has one, into a directory of its own, so that the reference program imports its own module rather than that of the candidate program
+            reference_directory_name = os.path.join(temporary_directory_name, "reference")
+            os.makedirs(reference_directory_name)
+            reference_filename = os.path.join(reference_directory_name, "intramark.py")
+            for program_filename in ("intramark.py", "intramark_engine.py"):
+                completed_process = subprocess.run(["git", "show", "{}:./{}".format(args.reference, program_filename)], cwd=os.path.dirname(intramark_filename), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                if completed_process.returncode != 0:
+                    # Versions before the program was divided consist of intramark.py alone
+                    if program_filename != "intramark.py":
+                        continue
+                    print("The reference program could not be taken from the git revision *{}*: {}".format(args.reference, completed_process.stderr.decode(errors="replace").strip()))
+                    return 2
+                with open(os.path.join(reference_directory_name, program_filename), "wb") as opened_file:
+                    opened_file.write(completed_process.stdout)
+
+        corpus_directory_name = args.keep_corpus
+        if corpus_directory_name == None:
+            corpus_directory_name = os.path.join(temporary_directory_name, "corpus")
+        os.makedirs(corpus_directory_name, exist_ok=True)
+        corpus_filenames = write_corpus(corpus_directory_name, args.seed, args.fuzzed_documents, args.large_document_size)
+
+        differential_results = []
+        for differential_result in differential_benchmark(reference_filename, args.candidate, corpus_filenames, create_invocations(args.exhaustive), args.runs):
+            print(json.dumps(differential_result), flush=True)
+            differential_results.append(differential_result)
+
+    differing_invocation_count = sum( 1 for differential_result in differential_results if differential_result["identical"] == False )
+    crashed_invocation_count = sum( 1 for differential_result in differential_results if differential_result["crashed"] == True )
+    print(json.dumps({"invocation_count": len(differential_results), "differing_invocation_count": differing_invocation_count, "crashed_invocation_count": crashed_invocation_count, "median_speedup": statistics.median( differential_result["speedup"] for differential_result in differential_results )}))
+
+    # Assignment to hold the exit status
+    exit_status = 0
+    if differing_invocation_count > 0 or crashed_invocation_count > 0:
+        exit_status = 1
+    return exit_status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,4304 @@
+#!/usr/bin/python3
+from collections import defaultdict
+from collections.abc import MutableMapping
+import codecs
+import functools
+import importlib
+import io
+import os
+import os.path
+import re
+import sys
+import time
+# Other modules are imported within the functions that use them, so that startup is not slowed by modules needed only for some command line arguments
+
+
+# Assignment to hold the name of the module used to read and write each kind of compressed stream, by filename extension
+compression_modules = {".gz": "gzip", ".bz2": "bz2", ".xz": "lzma"}
+# Assignment to hold the format and the compression, if any, of each kind of archive, by filename extension
+archive_formats = {".tar": ("tar", ""), ".tar.gz": ("tar", "gz"), ".tgz": ("tar", "gz"), ".tar.bz2": ("tar", "bz2"), ".tbz2": ("tar", "bz2"), ".tar.xz": ("tar", "xz"), ".txz": ("tar", "xz"), ".zip": ("zip", "")}
+# Assignment to hold the filename extensions of archive members that are processed as Markdown
+markdown_filename_extensions = (".md", ".markdown", ".mdown", ".mkd")
+# Assignment to hold the version of the corpus index database schema, which is increased whenever the schema or the information stored in it changes, so that older corpus index databases are rebuilt
+corpus_index_schema_version = 1
+# Assignment to hold the corpus index database schema, with an index for each kind of corpus-wide question and for deleting the rows of a file
+corpus_index_schema = """
+CREATE TABLE IF NOT EXISTS files (
+    file_id INTEGER PRIMARY KEY,
+    filename TEXT NOT NULL UNIQUE,
+    modification_time_ns INTEGER NOT NULL,
+    file_size INTEGER NOT NULL,
+    content_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS headings (
+    file_id INTEGER NOT NULL REFERENCES files (file_id) ON DELETE CASCADE,
+    line_number INTEGER NOT NULL,
+    heading_level INTEGER NOT NULL,
+    heading_content TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS hard_line_breaks (
+    file_id INTEGER NOT NULL REFERENCES files (file_id) ON DELETE CASCADE,
+    line_number INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS inline_links (
+    file_id INTEGER NOT NULL REFERENCES files (file_id) ON DELETE CASCADE,
+    line_number INTEGER NOT NULL,
+    column_number INTEGER NOT NULL,
+    link_text TEXT NOT NULL,
+    link_destination TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS link_reference_definitions (
+    file_id INTEGER NOT NULL REFERENCES files (file_id) ON DELETE CASCADE,
+    line_number INTEGER NOT NULL,
+    column_number INTEGER NOT NULL,
+    link_label TEXT NOT NULL,
+    normalized_link_label TEXT NOT NULL,
+    link_destination TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS footnote_link_labels (
+    file_id INTEGER NOT NULL REFERENCES files (file_id) ON DELETE CASCADE,
+    line_number INTEGER NOT NULL,
+    column_number INTEGER NOT NULL,
+    link_label TEXT NOT NULL,
+    normalized_link_label TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS footnote_link_reference_definitions (
+    file_id INTEGER NOT NULL REFERENCES files (file_id) ON DELETE CASCADE,
+    line_number INTEGER NOT NULL,
+    column_number INTEGER NOT NULL,
+    link_label TEXT NOT NULL,
+    normalized_link_label TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS headings_by_heading_level ON headings (heading_level);
+CREATE INDEX IF NOT EXISTS headings_by_file_id ON headings (file_id);
+CREATE INDEX IF NOT EXISTS hard_line_breaks_by_file_id ON hard_line_breaks (file_id);
+CREATE INDEX IF NOT EXISTS inline_links_by_link_destination ON inline_links (link_destination);
+CREATE INDEX IF NOT EXISTS inline_links_by_file_id ON inline_links (file_id);
+CREATE INDEX IF NOT EXISTS link_reference_definitions_by_normalized_link_label ON link_reference_definitions (normalized_link_label);
+CREATE INDEX IF NOT EXISTS link_reference_definitions_by_link_destination ON link_reference_definitions (link_destination);
+CREATE INDEX IF NOT EXISTS link_reference_definitions_by_file_id ON link_reference_definitions (file_id);
+CREATE INDEX IF NOT EXISTS footnote_link_labels_by_normalized_link_label ON footnote_link_labels (normalized_link_label);
+CREATE INDEX IF NOT EXISTS footnote_link_labels_by_file_id ON footnote_link_labels (file_id);
+CREATE INDEX IF NOT EXISTS footnote_link_reference_definitions_by_normalized_link_label ON footnote_link_reference_definitions (normalized_link_label);
+CREATE INDEX IF NOT EXISTS footnote_link_reference_definitions_by_file_id ON footnote_link_reference_definitions (file_id);
+"""
+# Assignment to hold the tables of the corpus index database holding rows for each file, in the order in which they are created
+corpus_index_row_tables = ("headings", "hard_line_breaks", "inline_links", "link_reference_definitions", "footnote_link_labels", "footnote_link_reference_definitions")
+
+class ResourceLimitError(Exception):
+    "Raised when a file exceeds a resource limit specified with command line input (see `create_resource_limits`), so that processing of that file alone is stopped."
+
+class SpillingDictionary(MutableMapping):
+    """A dictionary holding at most a number of items in memory, and storing any further items in a private temporary SQLite database on disk, which SQLite deletes once the dictionary is no longer used. Keys are numbers or strings, and values are pickled.
+    
+    A value read from disk is a copy, so changes to it are not kept. Items beyond those held in memory are therefore written to disk in batches, only when a later item is added, so that the most recently added value can still be changed in place, as is done while a line is analyzed. Items are kept in order of addition.
+    
+    The database is used under a lock, so that a finished analysis holding the dictionary can be read from multiple threads at once.
+    """
+    
+    def __init__(self, maximum_item_count_in_memory, batch_size=1000):
+        import threading
+        self.maximum_item_count_in_memory = maximum_item_count_in_memory
+        self.batch_size = batch_size
+        # Assignments to hold the items kept in memory, and the items waiting to be written to disk
+        self.items_in_memory = {}
+        self.items_to_be_spilled = {}
+        # Assignments to hold the database connection, which is only created once items are written to disk, and the number of items on disk
+        self.database_connection = None
+        self.database_lock = threading.Lock()
+        self.spilled_item_count = 0
+    
+    def spill_items(self):
+        "Write the items waiting to be written to disk, creating the database if it does not exist."
+        import pickle
+        if self.database_connection == None:
+            import sqlite3
+            # An empty filename creates a private temporary database on disk, which is deleted when the connection is closed
+            self.database_connection = sqlite3.connect("", check_same_thread=False)
+            self.database_connection.execute("CREATE TABLE items (item_key PRIMARY KEY, item_value BLOB NOT NULL)")
+        with self.database_lock:
+            self.database_connection.executemany("INSERT INTO items (item_key, item_value) VALUES (?, ?)", [ (item_key, pickle.dumps(item_value, pickle.HIGHEST_PROTOCOL)) for item_key, item_value in self.items_to_be_spilled.items() ])
+        self.spilled_item_count += len(self.items_to_be_spilled)
+        self.items_to_be_spilled = {}
+    
+    def __getitem__(self, item_key):
+        if item_key in self.items_in_memory:
+            return self.items_in_memory[item_key]
+        if item_key in self.items_to_be_spilled:
+            return self.items_to_be_spilled[item_key]
+        if self.database_connection != None:
+            with self.database_lock:
+                database_row = self.database_connection.execute("SELECT item_value FROM items WHERE item_key = ?", (item_key,)).fetchone()
+            if database_row != None:
+                import pickle
+                return pickle.loads(database_row[0])
+        raise KeyError(item_key)
+    
+    def __contains__(self, item_key):
+        if item_key in self.items_in_memory or item_key in self.items_to_be_spilled:
+            return True
+        if self.database_connection != None:
+            with self.database_lock:
+                return self.database_connection.execute("SELECT 1 FROM items WHERE item_key = ?", (item_key,)).fetchone() != None
+        return False
+    
+    def __setitem__(self, item_key, item_value):
+        if item_key in self.items_in_memory:
+            self.items_in_memory[item_key] = item_value
+        elif item_key in self.items_to_be_spilled:
+            self.items_to_be_spilled[item_key] = item_value
+        elif self.database_connection != None and item_key in self:
+            import pickle
+            with self.database_lock:
+                self.database_connection.execute("UPDATE items SET item_value = ? WHERE item_key = ?", (pickle.dumps(item_value, pickle.HIGHEST_PROTOCOL), item_key))
+        elif len(self.items_in_memory) < self.maximum_item_count_in_memory and self.database_connection == None and bool(self.items_to_be_spilled) == False:
+            self.items_in_memory[item_key] = item_value
+        else:
+            if len(self.items_to_be_spilled) >= self.batch_size:
+                self.spill_items()
+            self.items_to_be_spilled[item_key] = item_value
+    
+    def __delitem__(self, item_key):
+        if item_key in self.items_in_memory:
+            del self.items_in_memory[item_key]
+        elif item_key in self.items_to_be_spilled:
+            del self.items_to_be_spilled[item_key]
+        elif self.database_connection != None and self.delete_spilled_item(item_key) == True:
+            self.spilled_item_count -= 1
+        else:
+            raise KeyError(item_key)
+    
+    def delete_spilled_item(self, item_key):
+        "Delete an item from disk, returning true if it was found."
+        with self.database_lock:
+            return self.database_connection.execute("DELETE FROM items WHERE item_key = ?", (item_key,)).rowcount == 1
+    
+    def __iter__(self):
+        yield from list(self.items_in_memory)
+        if self.database_connection != None:
+            # Reading keys from disk in batches, so that the lock is not held while the caller uses each key
+            last_row_id = 0
+            while True:
+                with self.database_lock:
+                    database_rows = self.database_connection.execute("SELECT rowid, item_key FROM items WHERE rowid > ? ORDER BY rowid LIMIT ?", (last_row_id, self.batch_size)).fetchall()
+                if bool(database_rows) == False:
+                    break
+                for last_row_id, item_key in database_rows:
+                    yield item_key
+        yield from list(self.items_to_be_spilled)
+    
+    def __len__(self):
+        return len(self.items_in_memory) + self.spilled_item_count + len(self.items_to_be_spilled)
+
+def create_resource_limits(information_from_command_line_input):
+    """Create a dictionary holding the resource limits for processing a single file, as specified with command line input, in the following way:
+    
+    ```yaml
+    maximum_line_length: 100000      # an item with a numerical value indicating the maximum length of a line in characters, or in bytes for files processed byte-transparently, or null
+    maximum_link_count: 10000        # an item with a numerical value indicating the maximum number of potential link labels in the file, including link texts, footnotes, and link reference definitions, or null
+    timeout: 10.0                    # an item with a numerical value indicating the number of seconds allowed for analyzing and modifying the file, or null
+    deadline: 5021.7                 # an item with a numerical value indicating the value of `time.monotonic()` at which the time allowed ends, or null
+    maximum_link_reference_definition_count_in_memory: 100000   # an item with a numerical value indicating the number of link reference definitions held in memory, beyond which they are stored on disk (see `SpillingDictionary`), or null
+    ```
+    
+    The deadline is set when this function is called, so the dictionary is created once per file, immediately before the file is processed. `None` is returned if no resource limits are specified, so that nothing needs to be checked.
+    """
+    
+    if (information_from_command_line_input["maximum_line_length"] == None and
+            information_from_command_line_input["maximum_link_count"] == None and
+            information_from_command_line_input["timeout"] == None and
+            information_from_command_line_input["maximum_link_reference_definition_count_in_memory"] == None):
+        return None
+    
+    resource_limits = {}
+    resource_limits["maximum_line_length"] = information_from_command_line_input["maximum_line_length"]
+    resource_limits["maximum_link_count"] = information_from_command_line_input["maximum_link_count"]
+    resource_limits["timeout"] = information_from_command_line_input["timeout"]
+    resource_limits["maximum_link_reference_definition_count_in_memory"] = information_from_command_line_input["maximum_link_reference_definition_count_in_memory"]
+    resource_limits["deadline"] = None
+    if information_from_command_line_input["timeout"] != None:
+        resource_limits["deadline"] = time.monotonic() + information_from_command_line_input["timeout"]
+    return resource_limits
+
+def check_resource_limits(resource_limits, current_line_string=None):
+    "Raise a `ResourceLimitError` if the time allowed for processing a file has ended, or if a line is longer than allowed."
+    
+    if resource_limits["deadline"] != None and time.monotonic() > resource_limits["deadline"]:
+        raise ResourceLimitError("it was not processed within {:g} seconds".format(resource_limits["timeout"]))
+    if current_line_string != None and resource_limits["maximum_line_length"] != None and len(current_line_string) > resource_limits["maximum_line_length"]:
+        raise ResourceLimitError("it contains a line longer than {} characters".format(resource_limits["maximum_line_length"]))
+
+def create_memory_report(information_from_command_line_input):
+    """Create a dictionary to hold a memory report on processing a file, if one is specified with command line input, starting to trace memory allocations with `tracemalloc` if they are not traced already.
+    
+    The dictionary is completed by `record_memory_report_phase` and displayed by `display_memory_report`. `None` is returned if no memory report is specified, so that nothing needs to be measured. The source lines of `record_memory_report_phase` are found before tracing begins, so that the memory allocated by them can be left out of the memory report.
+    """
+    
+    if information_from_command_line_input["memory_report"] == False:
+        return None
+    
+    import tracemalloc
+    memory_report = {}
+    # Assignment to hold the code of `record_memory_report_phase` and of the functions defined within it
+    bookkeeping_codes = [record_memory_report_phase.__code__] + [ constant for constant in record_memory_report_phase.__code__.co_consts if isinstance(constant, type(record_memory_report_phase.__code__)) ]
+    memory_report["bookkeeping_line_numbers"] = frozenset( line_number for bookkeeping_code in bookkeeping_codes for _, _, line_number in bookkeeping_code.co_lines() if line_number != None )
+    if tracemalloc.is_tracing() == False:
+        tracemalloc.start()
+    memory_report["starting_traced_memory"] = tracemalloc.get_traced_memory()[0]
+    # Assignment to hold the memory allocated by `record_memory_report_phase` and still held, which is left out of the peak memory of each phase
+    memory_report["bookkeeping_memory"] = 0
+    memory_report["phases"] = {}
+    memory_report["current_phase"] = None
+    return memory_report
+
+def record_memory_report_phase(memory_report, phase_name=None):
+    """End the phase of processing a file being measured for a memory report, if any, recording its results, and begin measuring the next phase, if any.
+    
+    Phases follow one another without nesting, so that each phase is begun with a single call wherever it begins. The peak memory of a phase is measured from the memory traced when processing the file began, so that it includes information retained from earlier phases, such as `document_markup_entire`. The top allocation sites of a phase are the source lines that allocated the most memory still held at the end of the phase, found by comparing the memory allocated by each source line in snapshots taken at the beginning and end of the phase, with the snapshot ending one phase used to begin the next. Nothing is measured if the memory report is `None`.
+    
+    The memory report does not measure its own bookkeeping: the traced memory of a phase is read before any snapshot is taken at its end and after the snapshot beginning it is taken, the memory still held by this function between those readings is left out of the peak memory of later phases, and the source lines of this function and of `tracemalloc` are left out of the top allocation sites.
+    """
+    
+    if memory_report == None:
+        return
+    
+    import tracemalloc
+    
+    def allocations_by_source_line():
+        "Take a snapshot of traced memory allocations, returning a dictionary mapping each source line, as a `(filename, line_number)` tuple, to the size and number of the memory blocks it allocated, leaving out allocations made by tracemalloc itself and by this function."
+        allocations = {}
+        for statistic in tracemalloc.take_snapshot().statistics("lineno"):
+            source_line = (statistic.traceback[0].filename, statistic.traceback[0].lineno)
+            if source_line[0] == tracemalloc.__file__ or (source_line[0] == __file__ and source_line[1] in memory_report["bookkeeping_line_numbers"]):
+                continue
+            allocations[source_line] = (statistic.size, statistic.count)
+        return allocations
+    
+    def determine_top_allocation_sites(starting_allocations, ending_allocations):
+        "Determine the five source lines whose allocated memory increased the most between two snapshots."
+        allocation_differences = []
+        for source_line, (allocated_size, allocated_count) in ending_allocations.items():
+            starting_allocated_size, starting_allocated_count = starting_allocations.get(source_line, (0, 0))
+            if allocated_size > starting_allocated_size:
+                allocation_differences.append((allocated_size - starting_allocated_size, allocated_count - starting_allocated_count, source_line))
+        allocation_differences.sort(reverse=True)
+        return [ {"allocation_site": "{}:{}".format(os.path.basename(source_line[0]), source_line[1]), "size_difference": size_difference, "count_difference": count_difference} for size_difference, count_difference, source_line in allocation_differences[:5] ]
+    
+    # Assignment to hold the memory traced before any bookkeeping is done by this call
+    traced_memory, peak_traced_memory = tracemalloc.get_traced_memory()
+    ending_allocations = None
+    if memory_report["current_phase"] != None:
+        ending_allocations = allocations_by_source_line()
+        memory_report["phases"][memory_report["current_phase"]["phase_name"]] = {
+            "peak_memory": max(peak_traced_memory - memory_report["starting_traced_memory"] - memory_report["bookkeeping_memory"], 0),
+            "retained_memory": traced_memory - memory_report["current_phase"]["starting_traced_memory"],
+            "top_allocation_sites": determine_top_allocation_sites(memory_report["current_phase"]["starting_allocations"], ending_allocations)}
+        memory_report["current_phase"] = None
+    
+    if phase_name != None:
+        if ending_allocations == None:
+            ending_allocations = allocations_by_source_line()
+        memory_report["current_phase"] = {"phase_name": phase_name, "starting_allocations": ending_allocations}
+        memory_report["current_phase"]["starting_traced_memory"] = tracemalloc.get_traced_memory()[0]
+        # Adding the memory allocated by this call and still held, such as the snapshot beginning the phase, and subtracting the memory it released, such as the snapshot beginning the previous phase
+        memory_report["bookkeeping_memory"] += memory_report["current_phase"]["starting_traced_memory"] - traced_memory
+        tracemalloc.reset_peak()
+
+def display_memory_report(memory_report, input_filename, displayed_input_filename, encoding_information):
+    """End the phase being measured for a memory report, and display the memory report as a line of JSON on standard error, so that it is kept apart from the contents of the file. The memory report is displayed in the following way:
+    
+    ```yaml
+    input_filename: README.md           # an item with a string value indicating the input filename
+    line_count: 1200                    # an item with a numerical value indicating the number of lines in the input file
+    peak_memory: 1843200                # an item with a numerical value indicating the peak memory of all phases, in bytes
+    peak_memory_per_line: 1536.0        # an item with a numerical value indicating the peak memory of all phases, in bytes per input line
+    phases:                             # a key containing information on each phase, in the order in which the phases were measured
+      analysis:                         # a key with an identifier indicating the phase: analysis, reference_resolution, footnote_index, rewrite, output, diagnostic, table_of_contents, or lint
+        peak_memory: 1843200            # an item with a numerical value indicating the peak memory, in bytes
+        peak_memory_per_line: 1536.0    # an item with a numerical value indicating the peak memory, in bytes per input line
+        retained_memory: 1048576        # an item with a numerical value indicating the memory allocated and still held at the end of the phase, in bytes
+        top_allocation_sites:           # a list containing the source lines that allocated the most memory still held at the end of the phase
+          - allocation_site: intramark_engine.py:1460
+            size_difference: 524288
+            count_difference: 4096
+    ```
+    
+    Memory allocated by worker processes is not traced, so a file analyzed in chunks with *-j* is reported as if it were only merged.
+    """
+    
+    if memory_report == None:
+        return
+    
+    import json
+    
+    record_memory_report_phase(memory_report)
+    # Counting the lines of the input file outside of any phase, so that counting them is not measured
+    with open_input_file(input_filename, encoding_information) as opened_file:
+        line_count = sum( 1 for current_line_string in opened_file )
+    displayed_memory_report = {"input_filename": displayed_input_filename, "line_count": line_count}
+    displayed_memory_report["peak_memory"] = max( [ phase_memory_report["peak_memory"] for phase_memory_report in memory_report["phases"].values() ] + [0] )
+    displayed_memory_report["peak_memory_per_line"] = round(displayed_memory_report["peak_memory"] / max(line_count, 1), 1)
+    displayed_memory_report["phases"] = {}
+    for phase_name, phase_memory_report in memory_report["phases"].items():
+        displayed_memory_report["phases"][phase_name] = {"peak_memory": phase_memory_report["peak_memory"], "peak_memory_per_line": round(phase_memory_report["peak_memory"] / max(line_count, 1), 1), "retained_memory": phase_memory_report["retained_memory"], "top_allocation_sites": phase_memory_report["top_allocation_sites"]}
+    print(json.dumps(displayed_memory_report), file=sys.stderr)
+
+def determine_code_span_ranges(current_line_string):
+    """Determine the ranges of a line within inline code spans, returning a list of `(start_index, end_index)` tuples in order, where the start index is that of the opening backtick string and the end index is just past the closing backtick string.
+    
+    As in CommonMark, a code span begins with a string of backticks and ends with the next string of backticks of equal length. A backtick string without a matching closing backtick string is left as text. Code spans continuing onto another line are not found.
+    
+    The ranges are found in linear time: the next backtick string of equal length is determined for every backtick string in a single pass from the end of the line, using a hash map from each length to the position of the most recent backtick string of that length, and the code spans are then found in a single pass from the beginning of the line.
+    """
+    
+    backtick_string_matches = list(re.finditer(r'`+', current_line_string))
+    # Assignment to hold the index of the next backtick string of equal length for each backtick string, or `None` if there is none
+    closing_backtick_string_indexes = [None] * len(backtick_string_matches)
+    # Assignment to hold the index of the backtick string of each length nearest to the end of the line among those already passed
+    backtick_string_indexes_by_length = {}
+    for backtick_string_index in range(len(backtick_string_matches) - 1, -1, -1):
+        backtick_string_length = backtick_string_matches[backtick_string_index].end() - backtick_string_matches[backtick_string_index].start()
+        closing_backtick_string_indexes[backtick_string_index] = backtick_string_indexes_by_length.get(backtick_string_length)
+        backtick_string_indexes_by_length[backtick_string_length] = backtick_string_index
+    
+    code_span_ranges = []
+    backtick_string_index = 0
+    while backtick_string_index < len(backtick_string_matches):
+        closing_backtick_string_index = closing_backtick_string_indexes[backtick_string_index]
+        if closing_backtick_string_index != None:
+            code_span_ranges.append((backtick_string_matches[backtick_string_index].start(), backtick_string_matches[closing_backtick_string_index].end()))
+            backtick_string_index = closing_backtick_string_index
+        backtick_string_index += 1
+    return code_span_ranges
+
+def index_is_within_code_spans(current_index, code_span_ranges):
+    "Determine if a position in a line is within one of the inline code spans found by `determine_code_span_ranges`, with a binary search of the ranges, which are in order and do not overlap."
+    
+    import bisect
+    
+    code_span_index = bisect.bisect_right(code_span_ranges, (current_index, float("inf"))) - 1
+    return code_span_index >= 0 and current_index < code_span_ranges[code_span_index][1]
+
+def get_link_label_position(dictionary_key_string):
+    """Get the position of a reference-style link label from a dictionary-key string, returning the position in list format.
+    
+    The link label's position is stored with 3 comma-separated numbers that indicate a link label's *line number*, *left bracket index*, and *right bracket index*. The numbers are stored in the following way: ["1,2,3"]
+    
+    The key is stored as a string instead of a list or a tuple because:
+    
+    1. Python does not support lists as dictionary keys.
+    2. JSON does not support tuples as dictionary keys.
+    """
+    
+    link_label_position = [ int(list_item) for list_item in dictionary_key_string.split(',') ]
+    return link_label_position
+
+def determine_encoding_information(input_filename, specified_encoding=None):
+    """Determine how the contents of an input file are decoded for processing and encoded for output, returning a dictionary. The input file may be any input source accepted by `open_binary_input_file`.
+    
+    A byte order mark at the beginning of the file is detected and determines the encoding when no encoding is specified, or when a Unicode encoding is specified. The byte order mark is skipped during processing and restored when writing output. Files without a byte order mark are assumed to use UTF-8 unless another encoding is specified.
+    
+    UTF-8 and ASCII input is processed *byte-transparently*: the file is read and written using the `latin-1` codec, which maps each byte one-to-one onto a code point, so that UTF-8 sequences are neither validated, decoded, nor re-encoded. All markup recognized by this program is ASCII, and no byte of a multi-byte UTF-8 sequence is ASCII, so markup is found at the same positions and slicing around it never divides a character. Text that is displayed separately from the document, such as diagnostic information, is decoded only when needed with `decode_markup_text`. Other encodings are decoded and encoded normally.
+    
+    The `encoding_information` dictionary holds encoding-related information in the following way:
+    
+    ```yaml
+    encoding: utf-8                       # a string value indicating the encoding of the file's contents
+    byte_order_mark: !!binary 77u/        # a bytes value holding the byte order mark at the beginning of the file, if any
+    processing_encoding: latin-1          # a string value indicating the encoding used for reading and writing during processing
+    byte_transparent: true                # an item with a boolean value indicating if the file's contents are processed byte-transparently
+    line_aligned_chunks_possible: true    # an item with a boolean value indicating if a newline is encoded as a single newline byte, allowing the file to be divided into line-aligned chunks
+    regular_expression_flags: 256         # a numerical value indicating the flags used for regular expressions, restricting `\s` to ASCII whitespace when processing byte-transparently
+    ```
+    """
+    
+    # Byte order marks are listed with the longest first, since the UTF-32 little-endian byte order mark begins with the UTF-16 little-endian byte order mark
+    byte_order_marks = [(codecs.BOM_UTF32_LE, "utf-32-le"), (codecs.BOM_UTF32_BE, "utf-32-be"), (codecs.BOM_UTF8, "utf-8"), (codecs.BOM_UTF16_LE, "utf-16-le"), (codecs.BOM_UTF16_BE, "utf-16-be")]
+    
+    encoding = "utf-8"
+    if specified_encoding != None:
+        encoding = codecs.lookup(specified_encoding).name
+    
+    byte_order_mark = b""
+    if encoding in ("utf-8", "utf-8-sig", "utf-16", "utf-16-le", "utf-16-be", "utf-32", "utf-32-le", "utf-32-be"):
+        with open_binary_input_file(input_filename) as opened_file:
+            beginning_of_file = opened_file.read(4)
+        for current_byte_order_mark, byte_order_mark_encoding in byte_order_marks:
+            if beginning_of_file.startswith(current_byte_order_mark):
+                byte_order_mark = current_byte_order_mark
+                encoding = byte_order_mark_encoding
+                break
+    # Without a byte order mark, the generic Unicode codecs are given their default byte order
+    if encoding == "utf-8-sig":
+        encoding = "utf-8"
+    elif encoding == "utf-16":
+        encoding = "utf-16-le"
+    elif encoding == "utf-32":
+        encoding = "utf-32-le"
+    
+    encoding_information = {}
+    encoding_information["encoding"] = encoding
+    encoding_information["byte_order_mark"] = byte_order_mark
+    if encoding in ("utf-8", "ascii"):
+        encoding_information["processing_encoding"] = "latin-1"
+        encoding_information["byte_transparent"] = True
+        encoding_information["regular_expression_flags"] = re.ASCII
+    else:
+        encoding_information["processing_encoding"] = encoding
+        encoding_information["byte_transparent"] = False
+        encoding_information["regular_expression_flags"] = 0
+    encoding_information["line_aligned_chunks_possible"] = "\n".encode(encoding_information["processing_encoding"]) == b"\n"
+    
+    return encoding_information
+
+def decode_markup_text(markup_text, encoding_information):
+    "Decode text taken from a byte-transparently processed file, such as heading content or a link label, so that it can be displayed apart from the document. Text from other files is returned unchanged."
+    
+    if encoding_information["byte_transparent"] == True:
+        markup_text = markup_text.encode("latin-1").decode(encoding_information["encoding"], errors="replace")
+    return markup_text
+
+@functools.lru_cache(maxsize=65536)
+def normalize_link_label(link_label, encoding, byte_transparent):
+    """Normalize a link label according to the CommonMark spec, so that matching link labels have identical normalized link labels.
+    
+    Leading and trailing whitespace is stripped, consecutive internal whitespace (spaces, tabs, and line endings) is collapsed to a single space, and Unicode case folding is performed. Link labels from a byte-transparently processed file are decoded before normalization and encoded afterward, so that the normalized link label uses the same representation as the rest of the file's text. Undecodable bytes are preserved.
+    
+    The results are memoized, since the same link labels tend to be repeated many times in a document.
+    """
+    
+    if byte_transparent == True:
+        link_label = link_label.encode("latin-1").decode(encoding, errors="surrogateescape")
+    normalized_link_label = re.sub(r'[ \t\n\x0b\x0c\r]+', ' ', link_label).strip(' ').casefold()
+    if byte_transparent == True:
+        normalized_link_label = normalized_link_label.encode(encoding, errors="surrogateescape").decode("latin-1")
+    return normalized_link_label
+
+def generate_heading_slug(heading_text, encoding, byte_transparent):
+    """Generate the anchor that GitHub gives a heading, known as a slug, without any suffix needed to make it unique.
+    
+    The heading text is lowercased, every character other than a letter, number, underscore, hyphen, or space is removed, and each space is replaced with a hyphen. Heading text from a byte-transparently processed file is decoded before and encoded after, in the same way as in `normalize_link_label`.
+    """
+    
+    if byte_transparent == True:
+        heading_text = heading_text.encode("latin-1").decode(encoding, errors="surrogateescape")
+    heading_slug = re.sub(r'[^\w\- ]', '', heading_text.lower()).replace(" ", "-")
+    if byte_transparent == True:
+        heading_slug = heading_slug.encode(encoding, errors="surrogateescape").decode("latin-1")
+    return heading_slug
+
+def determine_compression_module(filename):
+    "Determine the module used to read and write a compressed stream from the extension of a filename, importing it if needed, and returning `None` if the file is not compressed."
+    
+    compression_module_name = compression_modules.get(os.path.splitext(filename)[1].lower())
+    if compression_module_name == None:
+        return None
+    return importlib.import_module(compression_module_name)
+
+def determine_archive_format(filename):
+    "Determine the format and compression of an archive from the extension of a filename, returning a `(archive_format, archive_compression)` tuple, or `None` if the file is not an archive."
+    
+    for archive_filename_extension in archive_formats:
+        if filename.lower().endswith(archive_filename_extension):
+            return archive_formats[archive_filename_extension]
+    return None
+
+def open_binary_input_file(input_source):
+    """Open an input source for reading in binary mode.
+    
+    An input source is either a filename or a bytes value holding the contents of an archive member. Files compressed with gzip, bzip2, or xz, as determined by filename extension, are decompressed as they are read, so that the rest of the program sees only their uncompressed contents.
+    """
+    
+    if isinstance(input_source, bytes):
+        return io.BytesIO(input_source)
+    compression_module = determine_compression_module(input_source)
+    if compression_module != None:
+        return compression_module.open(input_source, "rb")
+    return open(input_source, "rb")
+
+def open_binary_output_file(output_filename):
+    "Open an output file for writing in binary mode, compressing its contents with gzip, bzip2, or xz as determined by filename extension."
+    
+    compression_module = determine_compression_module(output_filename)
+    if compression_module != None:
+        return compression_module.open(output_filename, "wb")
+    return open(output_filename, "wb")
+
+def open_input_file(input_filename, encoding_information):
+    "Open an input source accepted by `open_binary_input_file` for reading lines in text mode using the processing encoding, skipping any byte order mark."
+    
+    opened_binary_file = open_binary_input_file(input_filename)
+    opened_binary_file.read(len(encoding_information["byte_order_mark"]))
+    return io.TextIOWrapper(opened_binary_file, encoding=encoding_information["processing_encoding"])
+
+def rewind_input_file(opened_file, encoding_information):
+    "Reset the position of a file opened with `open_input_file` to the beginning of its contents, skipping any byte order mark."
+    
+    opened_file.seek(0)
+    opened_file.read(len(encoding_information["byte_order_mark"].decode(encoding_information["processing_encoding"])))
+
+def open_output_file(output_binary_file, encoding_information):
+    "Wrap a file opened in binary mode for writing text using the processing encoding, beginning with any byte order mark found in the input file."
+    
+    output_binary_file.write(encoding_information["byte_order_mark"])
+    return io.TextIOWrapper(output_binary_file, encoding=encoding_information["processing_encoding"], write_through=True)
+
+def initial_input(command_line_arguments=None):
+    """Get user input in the form of command line arguments, storing provided information in a dictionary. The command line arguments of the program are used unless others are given, such as those following a command.
+    
+    The `cli_ctrlflw` dictionary holds command-line-related information in the following way:
+    
+    ```yaml
+    decrease_overall_heading_level_maximally: false                        # an item with a boolean value indicating if the overall heading level should be decreased maximally
+    decrease_overall_heading_level_numerically: false                      # an item with a boolean value indicating if the overall heading level should be decreased by a numerical amount
+    number_of_heading_levels_to_decrease_numerically: 0                    # an item with a numerical value indicating the number of heading levels to decrease numerically
+    increase_overall_heading_level_numerically: false                      # an item with a boolean value indicating if the overall heading level should be increased by a numerical amount
+    number_of_heading_levels_to_increase_numerically: 0                    # an item with a numerical value indicating the number of heading levels to increase numerically
+    modification_to_be_made: false                                         # an item with a boolean value indicating if changes should be made to the contents of the file
+    encoding: null                                                         # an item with a string value indicating the encoding of the input file, if specified
+    number_of_worker_processes: 1                                          # an item with a numerical value indicating the number of worker processes used to analyze the file in line-aligned chunks
+    lint_links: false                                                      # an item with a boolean value indicating if problems with links should be reported instead of displaying the contents of the file
+    input_filenames: [foo.bar]                                             # an item with a list value indicating the filenames of the files to be used for input, including the Markdown files within any directories given
+    input_directory_names: []                                              # an item with a list value indicating the directories given for input
+    polling_interval: 1.0                                                  # an item with a numerical value indicating the number of seconds between checks for changed files when watching directories without inotify
+    debounce_interval: 0.5                                                 # an item with a numerical value indicating the number of seconds without further changes to wait before processing changed files when watching directories
+    definitions_filenames: []                                              # an item with a list value indicating the filenames of files containing shared link reference definitions
+    maximum_line_length: null                                              # an item with a numerical value indicating the maximum length of a line in each file, if specified
+    maximum_link_count: null                                               # an item with a numerical value indicating the maximum number of potential link labels in each file, if specified
+    timeout: null                                                          # an item with a numerical value indicating the number of seconds allowed for analyzing and modifying each file, if specified
+    changed_line_ranges: null                                              # an item with a dictionary value mapping the absolute filename of each changed file to a list of `(first_line_number, last_line_number)` tuples indicating its changed lines, if problems should only be reported on changed lines
+    output_filename: null                                                  # an item with a string value indicating the filename of the file to be used for output, if specified
+    strip_trailing_number_signs_from_headings: false                       # an item with a boolean value indicating if the heading trailing number sign count should be equalized with heading level
+    equalize_heading_trailing_number_sign_count_with_heading_level: false  # an item with a boolean value indicating if trailing number signs should be stripped from headings
+    strip_all_heading_markup: false                                        # an item with a boolean value indicating if all heading markup text should be stripped
+    strip_all_line_breaks: false                                           # an item with a boolean value indicating if all line break markup text should be stripped
+    make_all_links_inline_style: false                                     # an item with a boolean value indicating if reference-style links should be made inline-style
+    preserve_reference_style_links: false                                  # an item with a boolean value indicating if link reference definitions should be preserved when making links inline-style
+    make_all_links_reference_style: false                                  # an item with a boolean value indicating if inline links should be made reference-style
+    place_link_reference_definitions_per_section: false                    # an item with a boolean value indicating if generated link reference definitions should be added at the end of each section instead of the end of the document
+    modification_to_be_made_to_heading: false                              # an item with a boolean value indicating if changes should be made to a heading
+    modification_to_be_made_to_line_break: false                           # an item with a boolean value indicating if changes should be made to a line break
+    ```
+    """
+    
+    def specify_arguments():
+        "Specify allowed command-line arguments using *argparse* module."
+        
+        import argparse
+        import textwrap
+        
+        parser = argparse.ArgumentParser(description="Analyze and modify Markdown-formatted text on the level of Markdown elements to make widespread changes to the text.",prefix_chars='-+=', formatter_class=argparse.RawTextHelpFormatter)
+        parser.add_argument("filenames", nargs="+", metavar="filename", help=textwrap.dedent("""\
+                                        Filenames for input, processed one after another. For a directory, every Markdown file within it and its subdirectories is processed.
+                                        - Files ending in *.gz*, *.bz2*, or *.xz* are decompressed as they are read.
+                                        - For tar and zip archives, every Markdown member is processed."""), default=None)
+        parser.add_argument("-d", "--diagnostic", help="Display diagnostic information on the provided input instead of providing output.", action="store_true")
+        parser.add_argument("-w", "--write-in-place", help="Overwrite input file.", action="store_true")
+        parser.add_argument("-o", "--output", help=textwrap.dedent("""\
+                                        Write output to a file instead of displaying it.
+                                        - Files ending in *.gz*, *.bz2*, or *.xz* are compressed as they are written.
+                                        - For archive input, a new archive of the same format is written."""), default=None)
+        parser.add_argument("--lint", help=textwrap.dedent("""\
+                                        Report problems as JSON Lines instead of providing output, exiting with status 1 if any problems are found.
+                                        - Use *links* to report undefined link labels, unused and duplicate link reference definitions, and undefined and unused footnotes."""), default=None)
+        parser.add_argument("--toc", help=textwrap.dedent("""\
+                                        Generate a nested table of contents from the headings, linking to each heading with a GitHub-style anchor.
+                                        - Use *display* to display the table of contents instead of providing output.
+                                        - Use *insert* to insert the table of contents after each *<!-- toc -->* line, replacing any table of contents ending at a following *<!-- tocstop -->* line."""), default=None)
+        parser.add_argument("--split-at", metavar="N", help=textwrap.dedent("""\
+                                        Split each input file into one file per section, beginning a section at each heading with a heading level from 1 to N, instead of providing output.
+                                        - Sections are written to the directory given with *-o/--output*, or else to the directory containing the input file, with filenames made from the input filename, the section number, and the heading.
+                                        - Link reference definitions used by a section but found outside it are copied to the end of the section.
+                                        - Use *-H max* to decrease the heading level of each section so that it begins at level 1."""), default=None)
+        parser.add_argument("--encoding", help="Encoding of the input file, which is otherwise determined from a byte order mark or assumed to be UTF-8.", default=None)
+        parser.add_argument("--definitions", action="append", metavar="FILE", help="File containing link reference definitions shared by the input files, which are loaded once and used to resolve link labels for *-k i* and *--lint links*. Can be given more than once.", default=None)
+        parser.add_argument("--changed-since", metavar="REVISION", help=textwrap.dedent("""\
+                                        Process only the input files changed since a revision of the git repository containing the current directory, according to *git diff*, so that the time taken is proportional to the size of the change.
+                                        - Use *-* to read the filenames of changed files from standard input instead, one per line. Relative filenames are relative to the top-level directory of the git repository containing the current directory, as printed by *git diff --name-only*, or to the current directory outside of a git repository."""), default=None)
+        parser.add_argument("--changed-lines-only", help="With *--changed-since* and *--lint links*, report only problems on lines changed since the revision.", action="store_true")
+        parser.add_argument("--max-line-length", metavar="N", help="Skip any input file containing a line longer than N characters, continuing with the other input files.", default=None)
+        parser.add_argument("--max-links", metavar="N", help="Skip any input file containing more than N potential link labels, continuing with the other input files.", default=None)
+        parser.add_argument("--timeout", metavar="SECONDS", help="Skip any input file that is not analyzed and modified within a number of seconds, continuing with the other input files.", default=None)
+        parser.add_argument("--spill-definitions", metavar="N", help="Hold at most N link reference definitions of each input file in memory, storing the rest in a temporary database on disk, so that memory use stays bounded for documents with very many link reference definitions at the cost of slower processing. Each input file is then analyzed in a single pass.", default=None)
+        parser.add_argument("--memory-report", help="Report the peak memory and top allocation sites of each phase of processing each input file, traced with *tracemalloc*, as a line of JSON on standard error. Processing is considerably slower while memory is traced.", action="store_true")
+        parser.add_argument("-j", "--jobs", help=textwrap.dedent("""\
+                                                Analyze a single input file in line-aligned chunks using multiple worker processes, which is useful for very large files, or process multiple input files concurrently. Use either:
+                                                - a number of worker processes from 1 upward, or
+                                                - *max* for one worker process per processor core."""), default=None)
+        modification_group = parser.add_argument_group('modification arguments', 'By default, the relative hierarchical differences between headings will be preserved.')
+        modification_group.add_argument("-A", "--annotate", help=textwrap.dedent("""\
+                                                            Display explanatory text about markup instead of displaying the markup itself.
+                                                            - Use *H* to affect headings."""), default=None)
+        modification_group.add_argument("+H", dest="plus_H", help=textwrap.dedent("""\
+                                                            Increase overall heading level by either:
+                                                            - a numerical amount from 1 to 5, or
+                                                            - *max* for maximum allowable amount"""), default=None)
+        modification_group.add_argument("-H", dest="minus_H", help=textwrap.dedent("""\
+                                                            Decrease overall heading level by either:
+                                                            - a numerical amount from 1 to 5, or
+                                                            - *max* for maximum allowable amount."""), default=None)
+        modification_group.add_argument("=H", dest="equals_H", help="Equalize heading trailing number sign count with heading level.", action="store_true")
+        modification_group.add_argument("-k", "--link", help=textwrap.dedent("""\
+                                                        Modify links.
+                                                        - Use *i* to make all links inline-style. Link reference definitions are removed by default, but this behavior can be suppressed by adding *p* to preserve them.
+                                                        - Use *r* to make all inline links reference-style, with one link reference definition for each distinct link destination. Link reference definitions are added at the end of the document by default, but can instead be added at the end of each section by adding *s*."""), default=None)
+        modification_group.add_argument("-f", "--footnote", help=textwrap.dedent("""\
+                                                        Modify footnotes, using any combination of the following:
+                                                        - Use *n* to renumber footnotes sequentially in order of first use, followed by any unused footnote definitions.
+                                                        - Use *u* to remove unused and duplicate footnote definitions.
+                                                        - Use *e* to move footnote definitions to the end of the document."""), default=None)
+        modification_group.add_argument("--plugin", action="append", metavar="PLUGIN", help="Python file or importable module providing transforms for the text of headings, hard line breaks, links, link reference definitions, or footnote definitions, which are applied along with any other modification arguments. Can be given more than once, with transforms applied in the order in which the plugins are given.", default=None)
+        modification_group.add_argument("-s", "--strip", help=textwrap.dedent("""\
+                                                        Strip away markup text.
+                                                        - Use *b* to strip line breaks.
+                                                        - Use *H* to strip all heading markup text.
+                                                        - Use *H-end* to strip only trailing number signs and spaces from headings."""), default=None)
+        modification_group.add_argument("--section", metavar="HEADING", help=textwrap.dedent("""\
+                                                        Apply heading and line break modifications, and *--toc display*, only within each section beginning at a heading with matching heading content, up to the next heading with the same or a higher heading level. Maximum amounts are determined by the headings within those sections.
+                                                        - Use a heading path such as *"Guide > API Reference"* to match only a section directly within another section.
+                                                        - Heading content is matched ignoring case and consecutive whitespace, in the same way as link labels."""), default=None)
+        watch_group = parser.add_argument_group('watch arguments', 'Used with *intramark.py watch DIRECTORY*, which applies modification arguments to each Markdown file in a directory whenever it changes.')
+        watch_group.add_argument("--poll-interval", help="Seconds between checks for changed files when inotify is unavailable. The default is 1.", default=None)
+        watch_group.add_argument("--debounce", help="Seconds without further changes to wait before processing changed files, so that a burst of saves is processed once. The default is 0.5.", default=None)
+        mutually_exclusive_modification_group = modification_group.add_mutually_exclusive_group()
+        mutually_exclusive_modification_group.add_argument("--heading-decrease-max", help="Decrease overall heading level by maximum allowable amount.", action="store_true")
+        mutually_exclusive_modification_group.add_argument("--heading-increase-max", help="Increase overall heading level by maximum allowable amount.", action="store_true")
+        args = parser.parse_args(command_line_arguments)
+        return args, parser
+    
+    args, parser = specify_arguments()
+
+    def assess_arguments(args, parser):
+        "Determine if values provided by the user are valid, and assign values to control-variables, whether provided by the user or not."
+        
+        cli_ctrlflw = {} # dictionary to hold command-line-related, control-flow-affecting information
+
+        # Assignments to hold default values for maximizing output consistency
+        cli_ctrlflw["modification_to_be_made"] = False
+        cli_ctrlflw["modification_to_be_made_to_heading"] = False
+        cli_ctrlflw["modification_to_be_made_to_line_break"] = False
+        cli_ctrlflw["modification_to_be_made_to_link"] = False
+        cli_ctrlflw["modification_to_be_made_to_footnote"] = False
+
+        def diagnostic_choice(args):
+            "Affect control flow to display diagnostic information in place of file contents if the '--diagnostic' argument is provided."
+            
+            display_file_contents = True
+            if args.diagnostic == True:
+                diagnostic = True
+                display_file_contents = False
+            else:
+                diagnostic = False
+            return diagnostic, display_file_contents
+        
+        cli_ctrlflw["diagnostic"], cli_ctrlflw["display_file_contents"] = diagnostic_choice(args)
+
+        def lint_choice(args, parser, display_file_contents):
+            "Affect control flow to report problems in place of file contents if the '--lint' argument is provided, also performing data validation to ensure acceptable values are used."
+            
+            lint_links = False
+            if args.lint == "links":
+                lint_links = True
+                display_file_contents = False
+            elif args.lint != None:
+                print("\nInvalid input:".upper(),"the only acceptable value for *--lint* is *links*.\n")
+                parser.print_help()
+                exit()
+            return lint_links, display_file_contents
+        
+        cli_ctrlflw["lint_links"], cli_ctrlflw["display_file_contents"] = lint_choice(args, parser, cli_ctrlflw["display_file_contents"])
+
+        def table_of_contents_choice(args, parser, cli_ctrlflw):
+            "Affect control flow to display a table of contents in place of file contents, or to insert a table of contents into the file contents, if the '--toc' argument is provided, also performing data validation to ensure acceptable values are used."
+            
+            display_table_of_contents = False
+            insert_table_of_contents = False
+            display_file_contents = cli_ctrlflw["display_file_contents"]
+            if args.toc == "display":
+                if cli_ctrlflw["diagnostic"] == True or cli_ctrlflw["lint_links"] == True:
+                    print("\nInvalid input:".upper(),"*--toc display* cannot be combined with *--diagnostic* or *--lint*.\n")
+                    parser.print_help()
+                    exit()
+                display_table_of_contents = True
+                display_file_contents = False
+            elif args.toc == "insert":
+                insert_table_of_contents = True
+            elif args.toc != None:
+                print("\nInvalid input:".upper(),"the only acceptable values for *--toc* are *display* and *insert*.\n")
+                parser.print_help()
+                exit()
+            return display_table_of_contents, insert_table_of_contents, display_file_contents
+        
+        cli_ctrlflw["display_table_of_contents"], cli_ctrlflw["insert_table_of_contents"], cli_ctrlflw["display_file_contents"] = table_of_contents_choice(args, parser, cli_ctrlflw)
+
+        def write_in_place_choice(args):
+            "Affect control flow to overwrite input file if the '--write-in-place' argument is provided."
+            
+            if args.write_in_place == True:
+                write_in_place = True
+            else:
+                write_in_place = False
+            return write_in_place
+        
+        cli_ctrlflw["write_in_place"] = write_in_place_choice(args)
+
+        def jobs_choice(args, parser):
+            """Affect control flow to analyze the input file in line-aligned chunks using multiple worker processes if the '--jobs' argument is provided.
+            
+            A string specifying the number of worker processes is received from user input, converted to an integer value, and validated. The default of 1 analyzes the file in a single pass without a process pool.
+            """
+            
+            number_of_worker_processes = 1
+            if args.jobs == "max":
+                number_of_worker_processes = os.cpu_count() or 1
+            elif args.jobs != None:
+                if args.jobs.isdigit() and int(args.jobs) >= 1:
+                    number_of_worker_processes = int(args.jobs)
+                else:
+                    print("\nInvalid input:".upper(),"acceptable values for *-j/--jobs* are *max* or a number from *1* upward.\n")
+                    parser.print_help()
+                    exit()
+            return number_of_worker_processes
+        
+        cli_ctrlflw["number_of_worker_processes"] = jobs_choice(args, parser)
+
+        def encoding_choice(args, parser):
+            "Affect control flow to decode and encode the input file using a specified encoding if the '--encoding' argument is provided, also performing data validation to ensure a known encoding is used."
+            
+            encoding = None
+            if args.encoding != None:
+                try:
+                    encoding = codecs.lookup(args.encoding).name
+                except LookupError:
+                    encoding = None
+                if encoding == None:
+                    print("\nInvalid input:".upper(),"*--encoding* must be the name of an encoding known to Python, such as *utf-8* or *cp1252*.\n")
+                    parser.print_help()
+                    exit()
+            return encoding
+        
+        cli_ctrlflw["encoding"] = encoding_choice(args, parser)
+
+        def resource_limit_choice(args, parser):
+            "Affect control flow to skip input files that exceed resource limits, and to store link reference definitions on disk beyond a number held in memory, also performing data validation to ensure a positive whole number is used for each count and a positive number of seconds for the timeout."
+            
+            maximum_line_length = None
+            maximum_link_count = None
+            timeout = None
+            maximum_link_reference_definition_count_in_memory = None
+            for argument_name, argument_value in (("--max-line-length", args.max_line_length), ("--max-links", args.max_links), ("--spill-definitions", args.spill_definitions)):
+                if argument_value != None:
+                    if argument_value.strip().isdigit() == False or int(argument_value) < 1:
+                        print("\nInvalid input:".upper(),"*{}* must be a whole number from 1 upward.\n".format(argument_name))
+                        parser.print_help()
+                        exit()
+                    if argument_name == "--max-line-length":
+                        maximum_line_length = int(argument_value)
+                    elif argument_name == "--max-links":
+                        maximum_link_count = int(argument_value)
+                    else:
+                        maximum_link_reference_definition_count_in_memory = int(argument_value)
+            if args.timeout != None:
+                try:
+                    timeout = float(args.timeout)
+                except ValueError:
+                    timeout = -1.0
+                if timeout <= 0 or timeout != timeout or timeout == float("inf"):
+                    print("\nInvalid input:".upper(),"*--timeout* must be a positive number of seconds.\n")
+                    parser.print_help()
+                    exit()
+            return maximum_line_length, maximum_link_count, timeout, maximum_link_reference_definition_count_in_memory
+        
+        cli_ctrlflw["maximum_line_length"], cli_ctrlflw["maximum_link_count"], cli_ctrlflw["timeout"], cli_ctrlflw["maximum_link_reference_definition_count_in_memory"] = resource_limit_choice(args, parser)
+
+        def memory_report_choice(args):
+            "Affect control flow to report memory use for each input file if the '--memory-report' argument is provided."
+            
+            if args.memory_report == True:
+                memory_report = True
+            else:
+                memory_report = False
+            return memory_report
+        
+        cli_ctrlflw["memory_report"] = memory_report_choice(args)
+
+        def annotation_choice(args, parser):
+            "Affect control flow to display explanatory text about an element instead of the element itself if the '--annotate' argument is provided, also performing data validation to ensure acceptable values are used."
+            
+            annotate_headings = False
+            if args.annotate == "H":
+                annotate_headings = True
+            elif args.annotate != None:
+                print("\nInvalid input:".upper(),"the only acceptable value for *-A/--annotate* is *H*.\n")
+                parser.print_help()
+                exit()
+            return annotate_headings
+        
+        cli_ctrlflw["annotate_headings"] = annotation_choice(args, parser)
+        
+        def heading_increase_choice(args, parser):
+            """Affect control flow to increase overall heading level.
+            
+            Heading can be increased maximally or numerically. If increased numerically, a string specifying the number of heading levels to be increased is received from user input, converted to an integer value, and validated.
+            """
+            
+            if args.heading_increase_max == True or args.plus_H == "max":
+                increase_overall_heading_level_maximally = True
+            else:
+                increase_overall_heading_level_maximally = False
+
+            if args.plus_H != None and args.plus_H != "max":
+                if args.plus_H.isdigit() and int(args.plus_H) >= 1 and int(args.plus_H) <= 5:
+                    increase_overall_heading_level_numerically = True
+                    number_of_heading_levels_to_increase_numerically = int(args.plus_H)
+                else:
+                    print("\nInvalid input:".upper(),"acceptable values for *+H* are *max* or *1-5*.\n")
+                    parser.print_help()
+                    exit()
+            else:
+                increase_overall_heading_level_numerically = False
+                number_of_heading_levels_to_increase_numerically = 0
+            
+            return increase_overall_heading_level_maximally, increase_overall_heading_level_numerically, number_of_heading_levels_to_increase_numerically
+        
+        cli_ctrlflw["increase_overall_heading_level_maximally"], cli_ctrlflw["increase_overall_heading_level_numerically"], cli_ctrlflw["number_of_heading_levels_to_increase_numerically"] = heading_increase_choice(args, parser)
+
+        def heading_decrease_choice(args, parser):
+            """Affect control flow to decrease overall heading level.
+            
+            Heading can be decreased maximally or numerically. If decreased numerically, a string specifying the number of heading levels to be decreased is received from user input, converted to an integer value, and validated.
+            """
+            
+            if args.heading_decrease_max == True or args.minus_H == "max":
+                decrease_overall_heading_level_maximally = True
+            else:
+                decrease_overall_heading_level_maximally = False
+            
+            if args.minus_H != None and args.minus_H != "max":
+                if args.minus_H.isdigit() and int(args.minus_H) >= 1 and int(args.minus_H) <= 5:
+                    decrease_overall_heading_level_numerically = True
+                    number_of_heading_levels_to_decrease_numerically = int(args.minus_H)
+                else:
+                    print("\nInvalid input:".upper(),"acceptable values for *-H* are *max* or *1-5*.\n")
+                    parser.print_help()
+                    exit()
+            else:
+                decrease_overall_heading_level_numerically = False
+                number_of_heading_levels_to_decrease_numerically = 0
+            
+            return decrease_overall_heading_level_maximally, decrease_overall_heading_level_numerically, number_of_heading_levels_to_decrease_numerically
+        
+        cli_ctrlflw["decrease_overall_heading_level_maximally"], cli_ctrlflw["decrease_overall_heading_level_numerically"], cli_ctrlflw["number_of_heading_levels_to_decrease_numerically"] = heading_decrease_choice(args, parser)
+
+        def heading_equalize_choice(args, parser):
+            "Affect control flow to equalize heading trailing number sign count with heading level."
+            
+            if args.equals_H == True:
+                equalize_heading_trailing_number_sign_count_with_heading_level = True
+            else:
+                equalize_heading_trailing_number_sign_count_with_heading_level = False
+            return equalize_heading_trailing_number_sign_count_with_heading_level
+        
+        cli_ctrlflw["equalize_heading_trailing_number_sign_count_with_heading_level"] = heading_equalize_choice(args, parser)
+        
+        def strip_choice(args, parser):
+            """Affect control flow to strip away markup text in one of any of the following ways:
+            
+            - Strip line breaks.
+            - Strip all heading markup text.
+            - Strip only trailing number signs and spaces from headings.
+            
+            Validation is performed.
+            """
+            
+            strip_all_line_breaks = False
+            strip_all_heading_markup = False
+            strip_trailing_number_signs_from_headings = False
+            
+            if args.strip != None:
+                if args.strip == "b":
+                    strip_all_line_breaks = True
+                elif args.strip == "H":
+                    strip_all_heading_markup = True
+                elif args.strip == "H-end":
+                    strip_trailing_number_signs_from_headings = True
+                else:
+                    print("\nInvalid input:".upper(),"the only acceptable values for *-s/--strip* are *b*, *H*, and *H-end*.\n")
+                    parser.print_help()
+                    exit()
+            
+            return strip_trailing_number_signs_from_headings, strip_all_heading_markup, strip_all_line_breaks
+        
+        cli_ctrlflw["strip_trailing_number_signs_from_headings"], cli_ctrlflw["strip_all_heading_markup"], cli_ctrlflw["strip_all_line_breaks"] = strip_choice(args, parser)
+
+        def link_choice(args, parser):
+            """Affect control flow to modify links in one of any of the following ways:
+            
+            - Make all links inline-style and remove link reference definitions.
+            - Make all links inline-style and preserve link reference definitions.
+            - Make all inline links reference-style, adding link reference definitions at the end of the document.
+            - Make all inline links reference-style, adding link reference definitions at the end of each section.
+            
+            Validation is performed.
+            """
+            
+            make_all_links_inline_style = False
+            preserve_reference_style_links = False
+            make_all_links_reference_style = False
+            place_link_reference_definitions_per_section = False
+            
+            if args.link != None:
+                if len(args.link) == 1 and args.link == "i":
+                    make_all_links_inline_style = True
+                elif len(args.link) == 2 and "i" in args.link and "p" in args.link:
+                    make_all_links_inline_style = True
+                    preserve_reference_style_links = True
+                elif len(args.link) == 1 and args.link == "r":
+                    make_all_links_reference_style = True
+                elif len(args.link) == 2 and "r" in args.link and "s" in args.link:
+                    make_all_links_reference_style = True
+                    place_link_reference_definitions_per_section = True
+                else:
+                    # In this situation, an invalid value has been provided
+                    print("\nInvalid input:".upper(),"the only acceptable values for *-k/--link* are *i* alone, *i* and *p*, *r* alone, or *r* and *s*.\n")
+                    parser.print_help()
+                    exit()
+            
+            return make_all_links_inline_style, preserve_reference_style_links, make_all_links_reference_style, place_link_reference_definitions_per_section
+        
+        cli_ctrlflw["make_all_links_inline_style"], cli_ctrlflw["preserve_reference_style_links"], cli_ctrlflw["make_all_links_reference_style"], cli_ctrlflw["place_link_reference_definitions_per_section"] = link_choice(args, parser)
+        
+        def footnote_choice(args, parser):
+            """Affect control flow to modify footnotes in any combination of the following ways:
+            
+            - Renumber footnotes sequentially in order of first use.
+            - Remove unused and duplicate footnote definitions.
+            - Move footnote definitions to the end of the document.
+            
+            Validation is performed.
+            """
+            
+            renumber_footnotes = False
+            remove_unused_footnote_definitions = False
+            move_footnote_definitions_to_end = False
+            
+            if args.footnote != None:
+                if len(args.footnote) > 0 and set(args.footnote).issubset({"n", "u", "e"}) == True and len(set(args.footnote)) == len(args.footnote):
+                    if "n" in args.footnote:
+                        renumber_footnotes = True
+                    if "u" in args.footnote:
+                        remove_unused_footnote_definitions = True
+                    if "e" in args.footnote:
+                        move_footnote_definitions_to_end = True
+                else:
+                    # In this situation, an invalid value has been provided
+                    print("\nInvalid input:".upper(),"the only acceptable values for *-f/--footnote* are any combination of *n*, *u*, and *e*.\n")
+                    parser.print_help()
+                    exit()
+            
+            return renumber_footnotes, remove_unused_footnote_definitions, move_footnote_definitions_to_end
+        
+        cli_ctrlflw["renumber_footnotes"], cli_ctrlflw["remove_unused_footnote_definitions"], cli_ctrlflw["move_footnote_definitions_to_end"] = footnote_choice(args, parser)
+        
+        def plugin_choice(args, parser):
+            """Affect control flow to apply transforms provided by plugins if the '--plugin' argument is provided.
+            
+            Validation is performed by loading each plugin, which registers its transforms (see `load_transform_plugins`).
+            """
+            
+            plugin_names = []
+            if args.plugin != None:
+                plugin_names = [ plugin_name.strip(" ") for plugin_name in args.plugin ]
+                try:
+                    load_transform_plugins(tuple(plugin_names))
+                except (ImportError, OSError, SyntaxError, ValueError) as plugin_error:
+                    print("\nInvalid input:".upper(),"a plugin given with *--plugin* could not be loaded: {}\n".format(plugin_error))
+                    parser.print_help()
+                    exit()
+            return plugin_names
+        
+        cli_ctrlflw["plugin_names"] = plugin_choice(args, parser)
+        
+        def control_generalization(cli_ctrlflw):
+            """Create generalized control-variables based on truthiness of existing control-variables. Depends on inclusion of all control-variables from earlier functions to work correctly.
+            
+            Validation is performed to make sure write-in-place is combined with at least one modification option.
+            """
+            
+            if (cli_ctrlflw["decrease_overall_heading_level_maximally"] == True or
+                    cli_ctrlflw["increase_overall_heading_level_maximally"] == True or
+                    cli_ctrlflw["decrease_overall_heading_level_numerically"] == True or
+                    cli_ctrlflw["increase_overall_heading_level_numerically"] == True or
+                    cli_ctrlflw["strip_trailing_number_signs_from_headings"] == True or
+                    cli_ctrlflw["equalize_heading_trailing_number_sign_count_with_heading_level"] == True or
+                    cli_ctrlflw["strip_all_heading_markup"] == True or
+                    cli_ctrlflw["annotate_headings"] == True):
+                modification_to_be_made_to_heading = True
+            else:
+                modification_to_be_made_to_heading = False
+            
+            if cli_ctrlflw["strip_all_line_breaks"] == True:
+                modification_to_be_made_to_line_break = True
+            else:
+                modification_to_be_made_to_line_break = False
+                
+            if cli_ctrlflw["make_all_links_inline_style"] == True or cli_ctrlflw["make_all_links_reference_style"] == True:
+                modification_to_be_made_to_link = True
+            else:
+                modification_to_be_made_to_link = False
+            
+            if (cli_ctrlflw["renumber_footnotes"] == True or
+                    cli_ctrlflw["remove_unused_footnote_definitions"] == True or
+                    cli_ctrlflw["move_footnote_definitions_to_end"] == True):
+                modification_to_be_made_to_footnote = True
+            else:
+                modification_to_be_made_to_footnote = False
+            
+            if (modification_to_be_made_to_heading == True or
+                modification_to_be_made_to_line_break == True or
+                modification_to_be_made_to_link == True or
+                modification_to_be_made_to_footnote == True or
+                bool(cli_ctrlflw["plugin_names"]) == True or
+                cli_ctrlflw["insert_table_of_contents"] == True):
+                modification_to_be_made = True
+            else:
+                modification_to_be_made = False
+            
+            if cli_ctrlflw["write_in_place"] == True and modification_to_be_made == False:
+                    print("\nInvalid input:".upper(),"at least one modification argument is required in order to overwrite the input file.\n")
+                    parser.print_help()
+                    exit()
+            
+            return modification_to_be_made_to_heading, modification_to_be_made_to_line_break, modification_to_be_made_to_link, modification_to_be_made_to_footnote, modification_to_be_made
+        
+        cli_ctrlflw["modification_to_be_made_to_heading"], cli_ctrlflw["modification_to_be_made_to_line_break"], cli_ctrlflw["modification_to_be_made_to_link"], cli_ctrlflw["modification_to_be_made_to_footnote"], cli_ctrlflw["modification_to_be_made"] = control_generalization(cli_ctrlflw)
+
+        def section_choice(args, parser, cli_ctrlflw):
+            """Affect control flow to restrict modifications to matching sections if the '--section' argument is provided, dividing a heading path into the heading content of each heading.
+            
+            Validation is performed to make sure each heading in the heading path has heading content, and that sections are only combined with heading and line break modifications or with displaying a table of contents.
+            """
+            
+            section_heading_path = None
+            if args.section != None:
+                section_heading_path = [ section_heading_content.strip(" \t") for section_heading_content in args.section.split(">") ]
+                if "" in section_heading_path:
+                    print("\nInvalid input:".upper(),"each heading in the heading path given with *--section* must have heading content.\n")
+                    parser.print_help()
+                    exit()
+                if ((cli_ctrlflw["modification_to_be_made_to_heading"] == False and cli_ctrlflw["modification_to_be_made_to_line_break"] == False and cli_ctrlflw["display_table_of_contents"] == False) or
+                        cli_ctrlflw["modification_to_be_made_to_link"] == True or
+                        cli_ctrlflw["modification_to_be_made_to_footnote"] == True or
+                        bool(cli_ctrlflw["plugin_names"]) == True or
+                        cli_ctrlflw["insert_table_of_contents"] == True or
+                        args.split_at != None):
+                    print("\nInvalid input:".upper(),"*--section* can only be used with heading modification arguments, *-s b*, or *--toc display*.\n")
+                    parser.print_help()
+                    exit()
+            return section_heading_path
+        
+        cli_ctrlflw["section_heading_path"] = section_choice(args, parser, cli_ctrlflw)
+        
+        def assess_file(input_filename):
+            """Assess information related to file and filename.
+            
+            Strip filename of leading and trailing spaces. Confirm that file or directory exists, prompting user to enter another filename if the program is running from a terminal, and exiting if not.
+            """
+            
+            input_filename = input_filename.strip(" ")
+            file_exists = os.path.isfile(input_filename) or os.path.isdir(input_filename)
+            
+            if sys.stdin.isatty():
+                executing_from_terminal = True
+            else:
+                executing_from_terminal = False
+            
+            if executing_from_terminal == True:
+                while file_exists == False:
+                    input_filename = input("The specified file does not exist. Enter a filename:")
+                    input_filename = input_filename.strip(" ")
+                    file_exists = os.path.isfile(input_filename) or os.path.isdir(input_filename)
+            elif executing_from_terminal == False and file_exists == False:
+                print("File does not exist. Exiting.")
+                exit()
+            
+            return input_filename
+        
+        cli_ctrlflw["input_filenames"] = []
+        cli_ctrlflw["input_directory_names"] = []
+        for input_filename in args.filenames:
+            input_filename = assess_file(input_filename)
+            # Replacing a directory with the Markdown files within it
+            if os.path.isdir(input_filename):
+                cli_ctrlflw["input_directory_names"].append(input_filename)
+                cli_ctrlflw["input_filenames"].extend(find_markdown_files(input_filename))
+            else:
+                cli_ctrlflw["input_filenames"].append(input_filename)
+
+        def watch_interval_choice(args, parser):
+            "Affect control flow to change how often changed files are checked for and processed when watching directories, also performing data validation to ensure positive numbers of seconds are used."
+            
+            polling_interval = 1.0
+            debounce_interval = 0.5
+            for argument_name, argument_value in (("--poll-interval", args.poll_interval), ("--debounce", args.debounce)):
+                if argument_value != None:
+                    try:
+                        interval = float(argument_value)
+                    except ValueError:
+                        interval = -1.0
+                    if interval < 0 or interval != interval or interval == float("inf"):
+                        print("\nInvalid input:".upper(),"*{}* must be a number of seconds from 0 upward.\n".format(argument_name))
+                        parser.print_help()
+                        exit()
+                    if argument_name == "--poll-interval":
+                        polling_interval = interval
+                    else:
+                        debounce_interval = interval
+            return polling_interval, debounce_interval
+        
+        cli_ctrlflw["polling_interval"], cli_ctrlflw["debounce_interval"] = watch_interval_choice(args, parser)
+
+        def output_choice(args, parser, cli_ctrlflw):
+            """Affect control flow to write output to a file instead of displaying it if the '--output' argument is provided.
+            
+            Validation is performed to make sure the output file is not combined with write-in-place or multiple input files, and that archive input is written to an archive of the same format.
+            """
+            
+            output_filename = None
+            if args.output != None:
+                output_filename = args.output.strip(" ")
+                input_archive_format = determine_archive_format(cli_ctrlflw["input_filenames"][0])
+                output_archive_format = determine_archive_format(output_filename)
+                if cli_ctrlflw["write_in_place"] == True:
+                    print("\nInvalid input:".upper(),"*-o/--output* cannot be combined with *-w/--write-in-place*.\n")
+                    parser.print_help()
+                    exit()
+                elif len(cli_ctrlflw["input_filenames"]) > 1:
+                    print("\nInvalid input:".upper(),"*-o/--output* can only be used with a single input file.\n")
+                    parser.print_help()
+                    exit()
+                elif (input_archive_format == None) != (output_archive_format == None) or (input_archive_format != None and input_archive_format[0] != output_archive_format[0]):
+                    print("\nInvalid input:".upper(),"*-o/--output* must be an archive of the same format as the input file if, and only if, the input file is an archive.\n")
+                    parser.print_help()
+                    exit()
+            return output_filename
+        
+        cli_ctrlflw["output_filename"] = output_choice(args, parser, cli_ctrlflw)
+
+        def split_choice(args, parser, cli_ctrlflw):
+            """Affect control flow to split each input file into one file per section if the '--split-at' argument is provided, also performing data validation to ensure a heading level from 1 to 6 is used.
+            
+            Validation is performed to make sure splitting is not combined with displaying or overwriting the input file, that the only modification combined with it is decreasing the overall heading level maximally, that no input file is an archive, and that any output is a directory.
+            """
+            
+            split_heading_level = None
+            if args.split_at != None:
+                if args.split_at.strip().isdigit() == False or int(args.split_at) < 1 or int(args.split_at) > 6:
+                    print("\nInvalid input:".upper(),"*--split-at* must be a heading level from 1 to 6.\n")
+                    parser.print_help()
+                    exit()
+                if cli_ctrlflw["diagnostic"] == True or cli_ctrlflw["lint_links"] == True or cli_ctrlflw["display_table_of_contents"] == True or cli_ctrlflw["write_in_place"] == True:
+                    print("\nInvalid input:".upper(),"*--split-at* cannot be combined with *--diagnostic*, *--lint*, *--toc display*, or *-w/--write-in-place*.\n")
+                    parser.print_help()
+                    exit()
+                if cli_ctrlflw["modification_to_be_made"] == True and (cli_ctrlflw["decrease_overall_heading_level_maximally"] == False or
+                        cli_ctrlflw["equalize_heading_trailing_number_sign_count_with_heading_level"] == True or
+                        cli_ctrlflw["strip_trailing_number_signs_from_headings"] == True or
+                        cli_ctrlflw["strip_all_heading_markup"] == True or
+                        cli_ctrlflw["annotate_headings"] == True or
+                        cli_ctrlflw["modification_to_be_made_to_line_break"] == True or
+                        cli_ctrlflw["modification_to_be_made_to_link"] == True or
+                        cli_ctrlflw["modification_to_be_made_to_footnote"] == True or
+                        bool(cli_ctrlflw["plugin_names"]) == True or
+                        cli_ctrlflw["insert_table_of_contents"] == True):
+                    print("\nInvalid input:".upper(),"the only modification argument that can be combined with *--split-at* is *-H max*.\n")
+                    parser.print_help()
+                    exit()
+                if any( determine_archive_format(input_filename) != None for input_filename in cli_ctrlflw["input_filenames"] ):
+                    print("\nInvalid input:".upper(),"*--split-at* cannot be used with archive input files.\n")
+                    parser.print_help()
+                    exit()
+                if cli_ctrlflw["output_filename"] != None and os.path.exists(cli_ctrlflw["output_filename"]) == True and os.path.isdir(cli_ctrlflw["output_filename"]) == False:
+                    print("\nInvalid input:".upper(),"with *--split-at*, *-o/--output* must be a directory.\n")
+                    parser.print_help()
+                    exit()
+                split_heading_level = int(args.split_at)
+            return split_heading_level
+        
+        cli_ctrlflw["split_heading_level"] = split_choice(args, parser, cli_ctrlflw)
+
+        def definitions_choice(args, parser, cli_ctrlflw):
+            """Affect control flow to resolve link labels with shared link reference definitions if the '--definitions' argument is provided.
+            
+            Validation is performed to make sure each file exists, and that shared link reference definitions are combined with making links inline-style or linting links.
+            """
+            
+            definitions_filenames = []
+            if args.definitions != None:
+                definitions_filenames = [ definitions_filename.strip(" ") for definitions_filename in args.definitions ]
+                if cli_ctrlflw["make_all_links_inline_style"] == False and cli_ctrlflw["lint_links"] == False:
+                    print("\nInvalid input:".upper(),"*--definitions* can only be used with *-k i* or *--lint links*.\n")
+                    parser.print_help()
+                    exit()
+                for definitions_filename in definitions_filenames:
+                    if os.path.isfile(definitions_filename) == False:
+                        print("\nInvalid input:".upper(),"the file *{}* given with *--definitions* does not exist.\n".format(definitions_filename))
+                        parser.print_help()
+                        exit()
+            return definitions_filenames
+        
+        cli_ctrlflw["definitions_filenames"] = definitions_choice(args, parser, cli_ctrlflw)
+
+        def changed_since_choice(args, parser, cli_ctrlflw):
+            """Affect control flow to process only changed input files if the '--changed-since' argument is provided, and to report only problems on changed lines if the '--changed-lines-only' argument is also provided.
+            
+            Validation is performed to make sure changed files can be determined with git, and that changed lines are only used when linting links with a revision.
+            """
+            
+            input_filenames = cli_ctrlflw["input_filenames"]
+            changed_line_ranges = None
+            if args.changed_lines_only == True and (args.changed_since == None or args.changed_since == "-" or cli_ctrlflw["lint_links"] == False):
+                print("\nInvalid input:".upper(),"*--changed-lines-only* can only be used with *--changed-since REVISION* and *--lint links*.\n")
+                parser.print_help()
+                exit()
+            if args.changed_since != None:
+                if args.changed_since == "-":
+                    import subprocess
+                    # Determining the directory that relative filenames are relative to, which is the top-level directory of the git repository, if any, since *git diff --name-only* prints filenames relative to it
+                    completed_process = subprocess.run(["git", "rev-parse", "--show-toplevel"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+                    base_directory_name = os.getcwd()
+                    if completed_process.returncode == 0:
+                        base_directory_name = os.fsdecode(completed_process.stdout.rstrip(b"\n"))
+                    changed_filenames = { os.path.abspath(os.path.join(base_directory_name, changed_filename.strip("\r"))) for changed_filename in sys.stdin.read().split("\n") if changed_filename.strip(" \r") != "" }
+                else:
+                    try:
+                        changed_filenames = determine_changed_files(args.changed_since, args.changed_lines_only)
+                    except (OSError, ValueError) as error:
+                        print("\nInvalid input:".upper(),"changed files could not be determined with *--changed-since*: {}\n".format(str(error).strip()))
+                        parser.print_help()
+                        # Exiting with a status other than 0, so that a continuous integration job does not pass without checking any file
+                        sys.exit(2)
+                    if args.changed_lines_only == True:
+                        changed_line_ranges = changed_filenames
+                input_filenames = [ input_filename for input_filename in input_filenames if os.path.abspath(input_filename) in changed_filenames ]
+            return input_filenames, changed_line_ranges
+        
+        cli_ctrlflw["input_filenames"], cli_ctrlflw["changed_line_ranges"] = changed_since_choice(args, parser, cli_ctrlflw)
+
+        return cli_ctrlflw
+    
+    cli_ctrlflw = assess_arguments(args, parser)
+    
+    return cli_ctrlflw
+
+
+def create_document_markup_entire(maximum_link_reference_definition_count_in_memory=None):
+    """Create an empty dictionary to hold markup-related information, with the structure described in the `markup_analysis` docstring.
+    
+    If a maximum number of link reference definitions held in memory is given, link reference definitions beyond that number are stored on disk (see `SpillingDictionary`).
+    """
+    
+    # Creating a dictionary to hold markup-related information
+    document_markup_entire = {}
+    document_markup_entire["break"] = {}
+    document_markup_entire["break"]["line_numbers_containing_hard_line_breaks"] = {}
+    document_markup_entire["heading"] = {}
+    document_markup_entire["heading"]["line_numbers_containing_headings"] = {}
+    document_markup_entire["heading"]["table_of_contents_marker_lines"] = {}
+    document_markup_entire["link"] = {}
+    document_markup_entire["link"]["potential_link_label_lines"] = {}
+    document_markup_entire["link"]["potential_footnote_link_label_lines"] = {}
+    document_markup_entire["link"]["footnote_link_reference_definition_lines"] = {}
+    document_markup_entire["link"]["inline_link_lines"] = {}
+    document_markup_entire["link"]["link_reference_definition_lines"] = {}
+    if maximum_link_reference_definition_count_in_memory != None:
+        document_markup_entire["link"]["link_reference_definition_lines"] = SpillingDictionary(maximum_link_reference_definition_count_in_memory)
+
+    return document_markup_entire
+
+# Assignment to hold the tag names that begin an HTML block ending at a blank line, as listed for the sixth kind of HTML block in the CommonMark spec
+html_block_tag_names = {"address", "article", "aside", "base", "basefont", "blockquote", "body", "caption", "center", "col", "colgroup", "dd", "details", "dialog", "dir", "div", "dl", "dt", "fieldset", "figcaption", "figure", "footer", "form", "frame", "frameset", "h1", "h2", "h3", "h4", "h5", "h6", "head", "header", "hr", "html", "iframe", "legend", "li", "link", "main", "menu", "menuitem", "nav", "noframes", "ol", "optgroup", "option", "p", "param", "section", "source", "summary", "table", "tbody", "td", "tfoot", "th", "thead", "title", "tr", "track", "ul"}
+
+# Assignment to hold the characters that can begin a line that is blank, indented, a code fence, the beginning of an HTML block, or the beginning of a list item, along with an empty string for an empty line
+block_structure_leading_characters = frozenset([""] + list(" \t`~<-+*0123456789"))
+# Assignment to hold a regular expression matching the number signs beginning an ATX heading, which are followed by a space, a tab, or the end of the line
+atx_heading_marker_regular_expression = re.compile(r'#{1,6}([ \t]|$)')
+# Assignment to hold a regular expression matching the list marker of a list item along with the spaces following it
+list_marker_regular_expression = re.compile(r'[ \t]*([-+*]|[0-9]{1,9}[.)])( {1,4}|\t|$)')
+
+def create_block_structure_state():
+    """Create a dictionary to hold the block structure state used by `classify_line_block_structure` in the following way:
+    
+    ```yaml
+    fence_character: null                         # a string value indicating the character (` or ~) of the code fence of an unclosed fenced code block, if any
+    fence_length: 0                               # a numerical value indicating the length of the code fence of an unclosed fenced code block
+    html_block_end_condition: null                # a string value indicating the text that ends an unclosed HTML block, or an empty string for an HTML block ending at a blank line
+    paragraph_continuation_possible: false        # an item with a boolean value indicating if the previous line could be continued by an indented line, which then cannot begin an indented code block
+    previous_line_is_blank: true                  # an item with a boolean value indicating if the previous line is blank
+    list_item_content_indentation: null           # a numerical value indicating the indentation of the content of the most recent list item, if any
+    ```
+    """
+    
+    block_structure_state = {}
+    block_structure_state["fence_character"] = None
+    block_structure_state["fence_length"] = 0
+    block_structure_state["html_block_end_condition"] = None
+    block_structure_state["paragraph_continuation_possible"] = False
+    block_structure_state["previous_line_is_blank"] = True
+    block_structure_state["list_item_content_indentation"] = None
+    return block_structure_state
+
+def classify_line_block_structure(current_line_string, block_structure_state):
+    """Classify a line by the block structure containing it, returning a string if the line should be skipped by the heading, line break, and link scanners, or `None` if it should be scanned. The block structure state is updated for the next line.
+    
+    This is a cheap first stage of analysis, using only string comparisons. The following strings are returned:
+    
+    - `blank_line`: the line contains only space or tab characters.
+    - `fenced_code`: the line is a code fence or is within a fenced code block. An unclosed fenced code block continues to the end of the document.
+    - `indented_code`: the line is indented by 4 or more spaces beyond the content of any list item, and does not continue a paragraph.
+    - `html_block`: the line is within one of the first six kinds of HTML block described in the CommonMark spec.
+    
+    Warning: this does not follow CommonMark spec for container blocks. List items are only tracked by the indentation of their content, and block quotes are not tracked.
+    """
+    
+    # Determining if the line is within a fenced code block, and if it closes the fenced code block
+    if block_structure_state["fence_character"] != None:
+        unindented_line_string = current_line_string.lstrip(" ")
+        if (len(current_line_string) - len(unindented_line_string) <= 3 + (block_structure_state["list_item_content_indentation"] or 0) and
+                unindented_line_string.startswith(block_structure_state["fence_character"] * block_structure_state["fence_length"]) and
+                unindented_line_string.rstrip(" \t").strip(block_structure_state["fence_character"]) == ""):
+            block_structure_state["fence_character"] = None
+            block_structure_state["paragraph_continuation_possible"] = False
+        block_structure_state["previous_line_is_blank"] = False
+        return "fenced_code"
+    
+    # Determining if the line begins with a character that cannot begin any block structure examined below, which is true of most lines, so that such lines are classified with as little work as possible
+    if current_line_string[:1] not in block_structure_leading_characters and block_structure_state["html_block_end_condition"] == None:
+        if block_structure_state["list_item_content_indentation"] != None and block_structure_state["previous_line_is_blank"] == True:
+            block_structure_state["list_item_content_indentation"] = None
+        block_structure_state["previous_line_is_blank"] = False
+        # An ATX heading cannot be continued by an indented line, while any other line can be
+        block_structure_state["paragraph_continuation_possible"] = atx_heading_marker_regular_expression.match(current_line_string) == None
+        return None
+    
+    # Determining if the line is blank
+    if current_line_string.strip(" \t") == "":
+        if block_structure_state["html_block_end_condition"] == "":
+            block_structure_state["html_block_end_condition"] = None
+        block_structure_state["paragraph_continuation_possible"] = False
+        block_structure_state["previous_line_is_blank"] = True
+        return "blank_line"
+    
+    # Determining if the line is within an HTML block, and if it ends the HTML block
+    if block_structure_state["html_block_end_condition"] != None:
+        if block_structure_state["html_block_end_condition"] != "" and block_structure_state["html_block_end_condition"] in current_line_string.lower():
+            block_structure_state["html_block_end_condition"] = None
+        block_structure_state["previous_line_is_blank"] = False
+        return "html_block"
+    
+    # Determining the indentation of the line, counting a tab character as 4 spaces
+    unindented_line_string = current_line_string.lstrip(" \t")
+    indentation = len(current_line_string[:len(current_line_string) - len(unindented_line_string)].expandtabs(4))
+    # Determining if the line is still within the most recent list item, which ends at a less-indented line following a blank line
+    if block_structure_state["list_item_content_indentation"] != None and indentation < block_structure_state["list_item_content_indentation"] and block_structure_state["previous_line_is_blank"] == True:
+        block_structure_state["list_item_content_indentation"] = None
+    # Assignment to hold the indentation relative to the content of the most recent list item
+    relative_indentation = indentation
+    if block_structure_state["list_item_content_indentation"] != None and indentation >= block_structure_state["list_item_content_indentation"]:
+        relative_indentation = indentation - block_structure_state["list_item_content_indentation"]
+    block_structure_state["previous_line_is_blank"] = False
+    
+    # Determining if the line is within an indented code block, which cannot interrupt a paragraph
+    if relative_indentation >= 4 and block_structure_state["paragraph_continuation_possible"] == False:
+        return "indented_code"
+    
+    if relative_indentation <= 3:
+        # Determining if the line opens a fenced code block with 3 or more backticks or tildes, where a backtick code fence cannot be followed by backticks
+        for fence_character in ("`", "~"):
+            if unindented_line_string.startswith(fence_character * 3):
+                fence_length = len(unindented_line_string) - len(unindented_line_string.lstrip(fence_character))
+                if fence_character == "~" or "`" not in unindented_line_string[fence_length:]:
+                    block_structure_state["fence_character"] = fence_character
+                    block_structure_state["fence_length"] = fence_length
+                    block_structure_state["paragraph_continuation_possible"] = False
+                    return "fenced_code"
+        # Determining if the line begins an HTML block
+        if unindented_line_string.startswith("<"):
+            lowercase_line_string = unindented_line_string.lower()
+            html_block_end_condition = None
+            for html_tag_name in ("script", "pre", "style", "textarea"):
+                if lowercase_line_string.startswith("<" + html_tag_name) and lowercase_line_string[len(html_tag_name) + 1:len(html_tag_name) + 2] in ("", " ", "\t", ">"):
+                    html_block_end_condition = "</" + html_tag_name + ">"
+            if lowercase_line_string.startswith("<!--"):
+                html_block_end_condition = "-->"
+            elif lowercase_line_string.startswith("<?"):
+                html_block_end_condition = "?>"
+            elif lowercase_line_string.startswith("<![cdata["):
+                html_block_end_condition = "]]>"
+            elif lowercase_line_string.startswith("<!") and lowercase_line_string[2:3].isalpha():
+                html_block_end_condition = ">"
+            elif html_block_end_condition == None:
+                html_tag_name = lowercase_line_string[2:] if lowercase_line_string.startswith("</") else lowercase_line_string[1:]
+                html_tag_name_length = len(html_tag_name) - len(html_tag_name.lstrip("abcdefghijklmnopqrstuvwxyz0123456789"))
+                if html_tag_name[:html_tag_name_length] in html_block_tag_names and html_tag_name[html_tag_name_length:html_tag_name_length + 1] in ("", " ", "\t", ">", "/"):
+                    html_block_end_condition = ""
+            if html_block_end_condition != None:
+                # Determining if the HTML block ends on the same line that begins it
+                if html_block_end_condition == "" or html_block_end_condition not in lowercase_line_string[2:]:
+                    block_structure_state["html_block_end_condition"] = html_block_end_condition
+                block_structure_state["paragraph_continuation_possible"] = False
+                return "html_block"
+    
+    # Determining if the line begins a list item, recording the indentation of its content
+    list_marker_regex_match_object = list_marker_regular_expression.match(current_line_string)
+    if list_marker_regex_match_object != None:
+        block_structure_state["list_item_content_indentation"] = len(list_marker_regex_match_object.group(0).expandtabs(4))
+    # An ATX heading cannot be continued by an indented line, while any other line can be, including an indented line continuing a paragraph, which is never a heading
+    block_structure_state["paragraph_continuation_possible"] = relative_indentation >= 4 or atx_heading_marker_regular_expression.match(unindented_line_string) == None
+    return None
+
+def determine_block_structure_states(input_filename, encoding_information, chunk_positions):
+    """Determine the block structure state at the beginning of each line-aligned chunk, returning a list of block structure states in the same order as the chunk positions.
+    
+    This is done by classifying every line of the file in a single sequential pass, which is much cheaper than the analysis performed for each chunk, so that a chunk beginning within a fenced code block or HTML block is classified correctly.
+    """
+    
+    block_structure_states = []
+    block_structure_state = create_block_structure_state()
+    with open_binary_input_file(input_filename) as opened_file:
+        for chunk_input_filename, chunk_encoding_information, chunk_start_byte_index, chunk_end_byte_index in chunk_positions:
+            block_structure_states.append(dict(block_structure_state))
+            opened_file.seek(chunk_start_byte_index)
+            chunk_lines = io.StringIO(opened_file.read(chunk_end_byte_index - chunk_start_byte_index).decode(encoding_information["processing_encoding"]), newline=None)
+            for current_line_string in chunk_lines:
+                classify_line_block_structure(current_line_string.rstrip('\n'), block_structure_state)
+    return block_structure_states
+
+# Assignment to hold the HTML comments marking where a table of contents begins and ends, which are the markers used by common table of contents generators
+table_of_contents_markers = {"<!-- toc -->": "start", "<!-- tocstop -->": "stop"}
+
+def markup_analysis_of_lines(lines, encoding_information, block_structure_state=None, resource_limits=None):
+    """Analyze an iterable of lines for any markup-related information, numbering lines relative to the first line of the iterable.
+    
+    This is the *map* step of `markup_analysis`, and is performed once for the whole file or once for each line-aligned chunk of the file. The returned `document_markup_entire` dictionary holds the same line-level information described in the `markup_analysis` docstring, while document-level information is instead stored in a separate `chunk_summary` dictionary so that it can be combined across chunks in the following way:
+    
+    ```yaml
+    line_count: 7                                                   # an item with a numerical value indicating the number of lines analyzed
+    at_least_one_heading_exists: true                               # an item with a boolean value indicating the presence of a heading
+    at_least_one_hard_line_break_exists: false                      # an item with a boolean value indicating the presence of a hard line break
+    at_least_one_footnote_link_reference_definition_exists: false   # an item with a boolean value indicating the presence of a footnote link reference definition
+    at_least_one_inline_link_exists: false                          # an item with a boolean value indicating the presence of an inline link
+    at_least_one_link_reference_definition_exists: true             # an item with a boolean value indicating the presence of a link reference definition
+    total_heading_count: 2                                          # an item with a numerical value indicating the total heading count
+    highest_heading_number: 2                                       # an item with a numerical value indicating the highest heading number, or null
+    lowest_heading_number: 1                                        # an item with a numerical value indicating the lowest heading number, or null
+    potential_link_label_count: 3                                   # an item with a numerical value indicating the number of potential link labels found, including link texts, footnotes, and link reference definitions
+    skipped_line_counts:                                            # a key containing the number of lines skipped for each kind of block structure
+      blank_line: 2
+      fenced_code: 0
+      indented_code: 0
+      html_block: 0
+    ```
+    
+    Normalized link labels (see `normalize_link_label`) and URIs are extracted during the same pass, since whether or not they are needed can only be known once every chunk has been analyzed.
+    
+    Each line is first classified with `classify_line_block_structure`, beginning with the provided block structure state if the lines do not begin the document. Lines within fenced code blocks, indented code blocks, and HTML blocks, as well as blank lines, are counted in the `skipped_line_counts` item of `chunk_summary` and are not examined further.
+    
+    Every scanner examines each character of a line a bounded number of times, so that the time taken is proportional to the length of the line even for pathological input, such as a long line of left brackets. Resource limits, if given (see `create_resource_limits`), are checked for each line, raising a `ResourceLimitError` as soon as one is exceeded.
+    """
+    
+    if resource_limits != None:
+        document_markup_entire = create_document_markup_entire(resource_limits["maximum_link_reference_definition_count_in_memory"])
+    else:
+        document_markup_entire = create_document_markup_entire()
+    # Assignment to hold the flags used for regular expressions
+    regular_expression_flags = encoding_information["regular_expression_flags"]
+    # Assignments to hold the block structure state and the number of lines skipped for each kind of block structure
+    if block_structure_state == None:
+        block_structure_state = create_block_structure_state()
+    skipped_line_counts = {"blank_line": 0, "fenced_code": 0, "indented_code": 0, "html_block": 0}
+
+    # Assignment to hold the current line number
+    current_line_number = 0
+    # Assignment to indicate that there are no headings
+    at_least_one_heading_exists = False
+    # Assignment to indicate that there are no hard line breaks
+    at_least_one_hard_line_break_exists = False
+    # Assignment to indicate that there are no potential link labels
+    at_least_one_potential_link_label_exists = False
+    # Assignment to indicate that there are no footnote link reference definitions
+    at_least_one_footnote_link_reference_definition_exists = False
+    # Assignment to indicate that there are no inline links
+    at_least_one_inline_link_exists = False
+    # Assignment to indicate that there are no link reference definitions
+    at_least_one_link_reference_definition_exists = False
+    # Assignment to hold the highest and lowest heading numbers
+    highest_heading_number = None
+    lowest_heading_number = None
+    calculation_started = False
+    # Assignment to hold the total heading count
+    total_heading_count = 0
+    # Assignment to hold the number of potential link labels found in all lines
+    potential_link_label_count_of_lines = 0
+    for current_line_string in lines:
+        # Stripping newlines
+        current_line_string = current_line_string.rstrip('\n')
+        # Incrementing to keep track of the current line number
+        current_line_number += 1
+        if resource_limits != None:
+            check_resource_limits(resource_limits, current_line_string)
+        # Skipping lines that cannot contain headings, line breaks, or links, such as lines within code blocks
+        line_block_structure = classify_line_block_structure(current_line_string, block_structure_state)
+        if line_block_structure != None:
+            skipped_line_counts[line_block_structure] += 1
+            # Determining if the current line is an HTML comment marking where a table of contents begins or ends
+            if line_block_structure == "html_block" and current_line_string.strip(" \t") in table_of_contents_markers:
+                document_markup_entire["heading"]["table_of_contents_marker_lines"][current_line_number] = {}
+                document_markup_entire["heading"]["table_of_contents_marker_lines"][current_line_number]["table_of_contents_marker"] = table_of_contents_markers[current_line_string.strip(" \t")]
+            continue
+        # Assignment to hold the potential link label count
+        potential_link_label_count = 0
+        # Assignment to hold the total hard line break count
+        total_hard_line_break_count = 0
+        # Assignment to hold the total potential link label count
+        total_potential_link_label_count = 0
+        # Assignment to hold the total inline link count
+        inline_link_count = 0
+
+        # Determining if the current line contains any potential link labels according to the CommonMark speficication
+        # Assignment to hold the current bracket character index
+        current_bracket_character_index = 0
+        # Assignment to hold the left bracket index
+        # This is set to the full length of the string to prevent a false positive in a later evaluation comparing its value with the right bracket index.
+        left_bracket_index = len(current_line_string)
+        # Assignment to hold the right bracket index
+        right_bracket_index = 0
+        # Assignment to hold the right parenthesis index
+        right_parenthesis_index = 0
+        # Assignment to hold the index of the most recent non-space character before the current character
+        last_non_space_character_index = -1
+        # Assignment to hold the index of the most recent non-space character before the right bracket
+        right_bracket_last_non_space_character_index = -1
+        # Determining the positions of potential link labels.
+        # This is done by examining each individual character for a left-bracket (`[`) or right-bracket (`]`). When both are found, they are compared to see if the right bracket index is greater than the left bracket index. If neither the left-bracket or right-bracket is immediately preceded by a backslash (`\`), a link label is identified, and the index numbers of the brackets are recorded in a dictionary. If multiple unclosed left-brackets are encountered before encountering a right-bracket, the left-bracket closest to the right-bracket will be used. Anything between the brackets is an unbracketed potential link label.
+        # Each character is examined once, and the characters between the brackets are never examined again, so that the time taken is proportional to the length of the line.
+        for current_character in current_line_string:
+            if current_character == "]" and current_bracket_character_index > 0 and current_line_string[current_bracket_character_index - 1] != "\\":
+                right_bracket_index = current_bracket_character_index
+                right_bracket_last_non_space_character_index = last_non_space_character_index
+            if current_character == "[" and current_bracket_character_index == 0:
+                left_bracket_index = current_bracket_character_index
+            elif current_character == "[" and current_bracket_character_index > 0 and current_line_string[current_bracket_character_index - 1] != "\\":
+                left_bracket_index = current_bracket_character_index
+            # Determining if at least one character exists between the brackets, and no more than 999 characters exist between the brackets
+            if (right_bracket_index - left_bracket_index) > 1 and (right_bracket_index - left_bracket_index - 1) <= 999:
+                # Determining if at least one non-space character exists between the brackets, which is the case if the most recent non-space character before the right bracket follows the left bracket
+                if right_bracket_last_non_space_character_index > left_bracket_index:
+                    potential_link_label_count += 1
+                    # Creating multiple dictionaries to hold potential-link-label-related information on the current line number, if none exist.
+                    # This code should only be executed once per line.
+                    if current_line_number not in document_markup_entire["link"]["potential_link_label_lines"]:
+                        document_markup_entire["link"]["potential_link_label_lines"][current_line_number] = defaultdict(list)
+                        document_markup_entire["link"]["potential_link_label_lines"][current_line_number]["potential_link_label_indexes"]
+                    # Each potential link label is only found once, since both bracket indexes are reset afterward, so the indexes are stored without searching the list for them
+                    document_markup_entire["link"]["potential_link_label_lines"][current_line_number]["potential_link_label_indexes"].append({"left_bracket_index": left_bracket_index, "right_bracket_index": right_bracket_index})
+                    left_bracket_index = len(current_line_string)
+                    right_bracket_index = 0
+                    # Checking if the file has more potential link labels than allowed
+                    if resource_limits != None and resource_limits["maximum_link_count"] != None and potential_link_label_count_of_lines + potential_link_label_count > resource_limits["maximum_link_count"]:
+                        raise ResourceLimitError("more than {} potential link labels were found".format(resource_limits["maximum_link_count"]))
+            if current_character != " ":
+                last_non_space_character_index = current_bracket_character_index
+            current_bracket_character_index += 1
+        potential_link_label_count_of_lines += potential_link_label_count
+        # Determining if any of the potential-link-label positions indicate potential footnote link labels.
+        # This is done by examining the character immediately following the left bracket index of each potential link label. If it is a circumflex (`^`), this indicates a potential footnote link label.
+        if current_line_number in document_markup_entire["link"]["potential_link_label_lines"]:
+            # Dividing the list of potential-link-label positions in a single pass, since removing items from a list one at a time takes time proportional to the length of the list for each item
+            potential_link_label_indexes_of_line = []
+            for potential_footnote_link_label_index in document_markup_entire["link"]["potential_link_label_lines"][current_line_number]["potential_link_label_indexes"]:
+                if current_line_string[potential_footnote_link_label_index["left_bracket_index"] + 1] == "^":
+                    # Creating multiple dictionaries to hold potential-footnote-link-label-related information on the current line number, if none exist.
+                    # This code should only be executed once per line.
+                    if current_line_number not in document_markup_entire["link"]["potential_footnote_link_label_lines"]:
+                        document_markup_entire["link"]["potential_footnote_link_label_lines"][current_line_number] = defaultdict(list)
+                        document_markup_entire["link"]["potential_footnote_link_label_lines"][current_line_number]["potential_footnote_link_label_indexes"]
+                    # Copying potential footnote link label indexes from list of potential-link-label positions to list of potential-footnote-link-label positions
+                    document_markup_entire["link"]["potential_footnote_link_label_lines"][current_line_number]["potential_footnote_link_label_indexes"].append(potential_footnote_link_label_index)
+                else:
+                    potential_link_label_indexes_of_line.append(potential_footnote_link_label_index)
+            # Keeping only the values that were not copied in the list of potential-link-label positions
+            document_markup_entire["link"]["potential_link_label_lines"][current_line_number]["potential_link_label_indexes"] = potential_link_label_indexes_of_line
+        # Determining if any of the potential-footnote-link-label positions indicate footnote link reference definitions.
+        # This is done by examining the character immediately following the right bracket index of each potential link label. If it is a colon (`:`), and this character is followed by one or more characters, this indicates a footnote body.
+        # Warning: this code is partially reused for link reference definitions
+        # Assignment to hold the post-colon character count
+        post_colon_character_count = 0
+        # Determining if the current line contains only one potential footnote link label
+        if current_line_number in document_markup_entire["link"]["potential_footnote_link_label_lines"] and len(document_markup_entire["link"]["potential_footnote_link_label_lines"][current_line_number]["potential_footnote_link_label_indexes"]) == 1 and document_markup_entire["link"]["potential_footnote_link_label_lines"][current_line_number]["potential_footnote_link_label_indexes"][0]["left_bracket_index"] == 0:
+            # Determining if the right bracket index is immediately followed by a colon
+            colon_index = document_markup_entire["link"]["potential_footnote_link_label_lines"][current_line_number]["potential_footnote_link_label_indexes"][0]["right_bracket_index"] + 1
+            if colon_index < len(current_line_string) and current_line_string[colon_index] == ":":
+                # Determining if the colon is followed by one or more characters
+                for current_character in current_line_string[colon_index + 1:]:
+                    post_colon_character_count += 1
+                if post_colon_character_count != 0:
+                    at_least_one_footnote_link_reference_definition_exists = True
+                    footnote_body_start_index = colon_index + 1
+                    footnote_body_end_index = len(current_line_string)
+                    # Creating a dictionary to hold potential-footnote-link-reference-definition-related information on the current line number
+                    document_markup_entire["link"]["footnote_link_reference_definition_lines"][current_line_number] = {}
+                    document_markup_entire["link"]["footnote_link_reference_definition_lines"][current_line_number]["footnote_link_reference_definition_indexes"] = {}
+                    # Copying footnote link reference definition index from list of potential-link-label positions to dictionary of footnote-link-reference-definition positions
+                    document_markup_entire["link"]["footnote_link_reference_definition_lines"][current_line_number]["footnote_link_reference_definition_indexes"] = {"left_bracket_index": 0, "right_bracket_index": document_markup_entire["link"]["potential_footnote_link_label_lines"][current_line_number]["potential_footnote_link_label_indexes"][0]["right_bracket_index"], "footnote_body_start_index": footnote_body_start_index, "footnote_body_end_index": footnote_body_end_index}
+                    # Removing now-empty sub-dictionary from dictionary of potential footnote link label lines
+                    del document_markup_entire["link"]["potential_footnote_link_label_lines"][current_line_number]
+        # Determining if any of the potential-link-label positions indicate inline links.
+        # This is done by examining the character immediately following the right bracket index of each potential link label, so long as the right bracket index is not at the end of the line. If it is a left parenthesis (`(`), and this character is followed by zero or more characters and a right parenthesis (`)`), this indicates an inline link text followed by an inline link destination.
+        # Warning: this does not follow CommonMark spec
+        if current_line_number in document_markup_entire["link"]["potential_link_label_lines"]:
+            # Dividing the list of potential-link-label positions in a single pass, as for potential footnote link labels
+            potential_link_label_indexes_of_line = []
+            # Assignment to indicate that no right parenthesis follows the most recent left parenthesis searched from, and therefore none follows any later left parenthesis
+            right_parenthesis_search_exhausted = False
+            for inline_link_text_index in document_markup_entire["link"]["potential_link_label_lines"][current_line_number]["potential_link_label_indexes"]:
+                left_parenthesis_index = inline_link_text_index["right_bracket_index"] + 1
+                if left_parenthesis_index < len(current_line_string) and current_line_string[left_parenthesis_index] == "(":
+                    # Searching for the first right parenthesis following the left parenthesis, unless the right parenthesis found for an earlier left parenthesis also follows this one. Potential link labels are in order of position, so each part of the line is searched at most once.
+                    if right_parenthesis_search_exhausted == False and right_parenthesis_index <= left_parenthesis_index:
+                        right_parenthesis_index = current_line_string.find(")", left_parenthesis_index + 1)
+                        if right_parenthesis_index == -1:
+                            right_parenthesis_search_exhausted = True
+                    # Determining if this potential link label is followed by an inline link destination, independently of any earlier lines so that chunks can be analyzed separately
+                    if right_parenthesis_index > left_parenthesis_index:
+                        at_least_one_inline_link_exists = True
+                        inline_link_count += 1
+                        # Creating multiple dictionaries to hold inline-link-related information on the current line number, if none exist.
+                        # This code should only be executed once per line.
+                        if current_line_number not in document_markup_entire["link"]["inline_link_lines"]:
+                            document_markup_entire["link"]["inline_link_lines"][current_line_number] = defaultdict(list)
+                            document_markup_entire["link"]["inline_link_lines"][current_line_number]["inline_link_indexes"]
+                        # Copying inline link indexes from list of potential-link-label positions to list of inline-link positions
+                        document_markup_entire["link"]["inline_link_lines"][current_line_number]["inline_link_indexes"].append({"left_bracket_index": inline_link_text_index["left_bracket_index"], "right_bracket_index": inline_link_text_index["right_bracket_index"], "left_parenthesis_index": left_parenthesis_index, "right_parenthesis_index": right_parenthesis_index})
+                        continue
+                potential_link_label_indexes_of_line.append(inline_link_text_index)
+            # Keeping only the values that were not copied in the list of potential-link-label positions
+            document_markup_entire["link"]["potential_link_label_lines"][current_line_number]["potential_link_label_indexes"] = potential_link_label_indexes_of_line
+        # Determining if any of the potential-link-label positions indicate link reference definitions.
+        # This is done by examining the character immediately following the right bracket index of each potential link label. If it is a colon (`:`), and this character is followed by zero or more optional space characters and a URI, this indicates a link label followed by a link destination.
+        # Warning: this does not follow CommonMark spec, and uses CommonMark terminology differently than CommonMark itself does
+        # Warning: this code is partially reused for footnote link reference definitions
+        # Assignment to hold the total link reference definition count
+        link_reference_definition_count = 0
+        # Assignment to hold the inter-colon-URI space character count
+        inter_colon_uri_space_character_count = 0
+        # Assignment to hold the current inter-colon-URI space character count
+        current_inter_colon_uri_space_character_count = 0
+        # Assignment to hold the URI start index
+        uri_start_index = 0
+        # Determining if the current line contains only one potential link label
+        if current_line_number in document_markup_entire["link"]["potential_link_label_lines"] and len(document_markup_entire["link"]["potential_link_label_lines"][current_line_number]["potential_link_label_indexes"]) == 1 and document_markup_entire["link"]["potential_link_label_lines"][current_line_number]["potential_link_label_indexes"][0]["left_bracket_index"] == 0:
+            # Determining if the right bracket index is immediately followed by a colon
+            colon_index = document_markup_entire["link"]["potential_link_label_lines"][current_line_number]["potential_link_label_indexes"][0]["right_bracket_index"] + 1
+            if colon_index < len(current_line_string) and current_line_string[colon_index] == ":":
+                # Determining if the colon is followed by zero or more optional space characters
+                for current_character in current_line_string[colon_index + 1:]:
+                    if current_character != " ":
+                        inter_colon_uri_space_character_count = current_inter_colon_uri_space_character_count
+                        break
+                    current_inter_colon_uri_space_character_count += 1
+                if inter_colon_uri_space_character_count != 0:
+                    uri_start_index = colon_index + inter_colon_uri_space_character_count + 1
+                else:
+                    uri_start_index = colon_index + 1
+                # Determining if the zero or more optional space characters are followed by a valid URI
+                current_uri_end_index = uri_start_index
+                # Assignment to indicate that a URI exists
+                uri_exists = True
+                for current_character in current_line_string[uri_start_index + 1:]:
+                    if current_character == " ":
+                        # In this situation, a non-space character is followed by a space character, and a URI does not exist
+                        uri_exists = False
+                        break
+                    current_uri_end_index += 1
+                if uri_exists == True:
+                    uri_end_index = current_uri_end_index
+                    link_reference_definition_count += 1
+                    at_least_one_link_reference_definition_exists = True
+                    # Creating a dictionary to hold link-reference-definition-related information on the current line number
+                    document_markup_entire["link"]["link_reference_definition_lines"][current_line_number] = {}
+                    document_markup_entire["link"]["link_reference_definition_lines"][current_line_number]["link_reference_definition_indexes"] = {}
+                    # Copying link reference definition indexes from dictionary of potential-link-label positions to dictionary of link-reference-definition positions
+                    document_markup_entire["link"]["link_reference_definition_lines"][current_line_number]["link_reference_definition_indexes"] = {"left_bracket_index": 0, "right_bracket_index": document_markup_entire["link"]["potential_link_label_lines"][current_line_number]["potential_link_label_indexes"][0]["right_bracket_index"]}
+                    # Removing now-empty sub-dictionary from dictionary of potential link label lines
+                    del document_markup_entire["link"]["potential_link_label_lines"][current_line_number]
+                    if inter_colon_uri_space_character_count != 0:
+                        document_markup_entire["link"]["link_reference_definition_lines"][current_line_number]["link_reference_definition_indexes"]["inter_colon_uri_space_character_count"] = 0
+                        document_markup_entire["link"]["link_reference_definition_lines"][current_line_number]["link_reference_definition_indexes"]["inter_colon_uri_space_character_count"] = inter_colon_uri_space_character_count
+                    document_markup_entire["link"]["link_reference_definition_lines"][current_line_number]["link_reference_definition_indexes"]["uri_start_index"] = 0
+                    document_markup_entire["link"]["link_reference_definition_lines"][current_line_number]["link_reference_definition_indexes"]["uri_end_index"] = 0
+                    document_markup_entire["link"]["link_reference_definition_lines"][current_line_number]["link_reference_definition_indexes"]["uri_start_index"] = uri_start_index
+                    document_markup_entire["link"]["link_reference_definition_lines"][current_line_number]["link_reference_definition_indexes"]["uri_end_index"] = uri_end_index
+        # Warning: the if-constructs below this point depend on data from one another
+        # Determining with a regular expression (explained in the docstring) if the current line contains a heading according to the CommonMark speficication
+        current_line_string_heading_regex_match_object = re.search(r'^(?P<leading_space_character_group>(?P<space_character_1>\s)(?P=space_character_1){0,2})?(?P<leading_heading_number_sign_group>(?P<number_sign_1>#)(?P=number_sign_1){0,5})($|\s)(?P<heading_content>.*?)(\s(?P<trailing_number_sign_group>(?P<number_sign_2>#)(?P=number_sign_2){0,})(?P<trailing_space_character_group>(?P<space_character_2>\s)(?P=space_character_2){0,})?)?$', current_line_string, regular_expression_flags)
+        if current_line_string_heading_regex_match_object != None:
+            # Assignment to indicate that at least one heading exists
+            at_least_one_heading_exists = True
+            total_heading_count += 1
+            # Determining how many number signs exist consecutively at the *beginning* of the line
+            total_consecutive_number_signs_at_beginning_of_line = len(current_line_string_heading_regex_match_object.group("leading_heading_number_sign_group"))
+            # Appending this line's number to a dictionary, indicating that the current line contains a heading
+            document_markup_entire["heading"]["line_numbers_containing_headings"][current_line_number] = {}
+            # Appending this line's total number of consecutive number signs at the *beginning* of the line to a dictionary containing this information for all relevant lines
+            document_markup_entire["heading"]["line_numbers_containing_headings"][current_line_number]["line_beginning_number_sign_count"] = total_consecutive_number_signs_at_beginning_of_line
+            # Determining how many pre-number-sign space characters (if any) exist consecutively at the *beginning* of the line
+            if current_line_string_heading_regex_match_object.group("leading_space_character_group") != None:
+                document_markup_entire["heading"]["line_numbers_containing_headings"][current_line_number]["line_beginning_space_character_count"] = len(current_line_string_heading_regex_match_object.group("leading_space_character_group"))
+            # Determining if any heading content exists for the line
+            if current_line_string_heading_regex_match_object.group("heading_content") != None:
+                document_markup_entire["heading"]["line_numbers_containing_headings"][current_line_number]["heading_content"] = current_line_string_heading_regex_match_object.group("heading_content")
+            # Determining how many optional number signs (if any) exist consecutively at the *end* of the line
+            if current_line_string_heading_regex_match_object.group("trailing_number_sign_group") != None:
+                document_markup_entire["heading"]["line_numbers_containing_headings"][current_line_number]["line_ending_number_sign_count"] = len(current_line_string_heading_regex_match_object.group("trailing_number_sign_group"))
+            # Determining how many optional post-number-sign space characters (if any) exist consecutively at the *end* of the line
+            if current_line_string_heading_regex_match_object.group("trailing_space_character_group") != None:
+                document_markup_entire["heading"]["line_numbers_containing_headings"][current_line_number]["line_ending_space_character_count"] = len(current_line_string_heading_regex_match_object.group("trailing_space_character_group"))
+            # Determining the highest and lowest heading numbers
+            if calculation_started == False:
+                highest_heading_number = total_consecutive_number_signs_at_beginning_of_line
+                lowest_heading_number = total_consecutive_number_signs_at_beginning_of_line
+                calculation_started = True
+            if total_consecutive_number_signs_at_beginning_of_line > highest_heading_number and total_consecutive_number_signs_at_beginning_of_line <= 6:
+                highest_heading_number = total_consecutive_number_signs_at_beginning_of_line
+            if total_consecutive_number_signs_at_beginning_of_line < lowest_heading_number:
+                lowest_heading_number = total_consecutive_number_signs_at_beginning_of_line
+        # Determining with a regular expression if the current line ends with a hard line break
+        current_line_string_line_break_with_two_or_more_space_characters_regex_match_object = re.search(r'\S(?P<two_or_more_consecutive_trailing_space_characters>(?P<space_character>\s)(?P=space_character){1,})$', current_line_string, regular_expression_flags)
+        # Checking if the regular expression was matched, and also preventing potential conflict with headings, which cannot contain line breaks
+        if current_line_string_line_break_with_two_or_more_space_characters_regex_match_object != None and current_line_number not in document_markup_entire["heading"]["line_numbers_containing_headings"]:
+            # Assignment to indicate that at least one hard line break exists
+            at_least_one_hard_line_break_exists = True
+            total_hard_line_break_count += 1
+            # Appending this line's number to a dictionary, indicating that the current line contains a hard line break
+            document_markup_entire["break"]["line_numbers_containing_hard_line_breaks"][current_line_number] = {}
+            # Appending this line's total number of trailing space characters to a dictionary containing this information for all relevant lines
+            document_markup_entire["break"]["line_numbers_containing_hard_line_breaks"][current_line_number]["consecutive_trailing_space_character_count"] = len(current_line_string_line_break_with_two_or_more_space_characters_regex_match_object.group("two_or_more_consecutive_trailing_space_characters"))
+        # Extracting normalized link labels and URIs, potentially for later use in comparing potential link labels with links labels found within link reference definitions
+        # Warning: this uses CommonMark terminology differently than CommonMark itself does
+        # Determining if the current line has any potential link labels
+        if current_line_number in document_markup_entire["link"]["potential_link_label_lines"]:
+            # Extracting normalized potential link label
+            for potential_link_label_indexes in document_markup_entire["link"]["potential_link_label_lines"][current_line_number]["potential_link_label_indexes"]:
+                potential_link_label_indexes["normalized_potential_link_label"] = normalize_link_label(current_line_string[potential_link_label_indexes["left_bracket_index"] + 1:potential_link_label_indexes["right_bracket_index"]], encoding_information["encoding"], encoding_information["byte_transparent"])
+        # Determining if the current line has any link reference definitions
+        elif current_line_number in document_markup_entire["link"]["link_reference_definition_lines"]:
+            link_reference_definition_indexes = document_markup_entire["link"]["link_reference_definition_lines"][current_line_number]["link_reference_definition_indexes"]
+            # Extracting normalized link label
+            link_reference_definition_indexes["normalized_link_label"] = normalize_link_label(current_line_string[link_reference_definition_indexes["left_bracket_index"] + 1:link_reference_definition_indexes["right_bracket_index"]], encoding_information["encoding"], encoding_information["byte_transparent"])
+            # Extracting URI
+            link_reference_definition_indexes["uri"] = current_line_string[link_reference_definition_indexes["uri_start_index"]:link_reference_definition_indexes["uri_end_index"] + 1]
+    # Removing any empty lists in “potential link label lines” dictionary
+    # A dictionary is copied to a list for the duration of the loop in order to allow removal of dictionary items *during* the loop
+    for potential_link_label_line in list(document_markup_entire["link"]["potential_link_label_lines"]):
+        # Removing any lines that contain no potential link label indexes
+        if not document_markup_entire["link"]["potential_link_label_lines"][potential_link_label_line]["potential_link_label_indexes"]:
+            del document_markup_entire["link"]["potential_link_label_lines"][potential_link_label_line]
+
+    chunk_summary = {}
+    chunk_summary["line_count"] = current_line_number
+    chunk_summary["at_least_one_heading_exists"] = at_least_one_heading_exists
+    chunk_summary["at_least_one_hard_line_break_exists"] = at_least_one_hard_line_break_exists
+    chunk_summary["at_least_one_footnote_link_reference_definition_exists"] = at_least_one_footnote_link_reference_definition_exists
+    chunk_summary["at_least_one_inline_link_exists"] = at_least_one_inline_link_exists
+    chunk_summary["at_least_one_link_reference_definition_exists"] = at_least_one_link_reference_definition_exists
+    chunk_summary["total_heading_count"] = total_heading_count
+    chunk_summary["highest_heading_number"] = highest_heading_number
+    chunk_summary["lowest_heading_number"] = lowest_heading_number
+    chunk_summary["potential_link_label_count"] = potential_link_label_count_of_lines
+    chunk_summary["skipped_line_counts"] = skipped_line_counts
+
+    return document_markup_entire, chunk_summary
+
+def determine_line_aligned_chunk_positions(input_filename, encoding_information, number_of_chunks):
+    """Determine the positions of line-aligned chunks of a file, returning a list of `(input_filename, encoding_information, chunk_start_byte_index, chunk_end_byte_index)` tuples.
+    
+    The file, excluding any byte order mark, is divided into roughly equal-sized byte ranges, and each boundary is moved forward to the beginning of the next line, so that no line is divided between two chunks. Fewer chunks than requested are returned for files with fewer lines than chunks.
+    """
+    
+    file_size = os.path.getsize(input_filename)
+    chunk_boundary_byte_indexes = [len(encoding_information["byte_order_mark"])]
+    with open(input_filename, "rb") as opened_file:
+        for chunk_number in range(1, number_of_chunks):
+            approximate_chunk_boundary_byte_index = file_size * chunk_number // number_of_chunks
+            # Skipping a boundary that has already been passed by the end of a long line
+            if approximate_chunk_boundary_byte_index <= chunk_boundary_byte_indexes[-1]:
+                continue
+            # Moving the boundary to the beginning of the next line, which is the boundary itself if the preceding byte is a newline
+            opened_file.seek(approximate_chunk_boundary_byte_index - 1)
+            opened_file.readline()
+            chunk_boundary_byte_index = opened_file.tell()
+            if chunk_boundary_byte_index > chunk_boundary_byte_indexes[-1] and chunk_boundary_byte_index < file_size:
+                chunk_boundary_byte_indexes.append(chunk_boundary_byte_index)
+    chunk_boundary_byte_indexes.append(file_size)
+    
+    chunk_positions = [ (input_filename, encoding_information, chunk_boundary_byte_indexes[chunk_index], chunk_boundary_byte_indexes[chunk_index + 1]) for chunk_index in range(len(chunk_boundary_byte_indexes) - 1) ]
+    return chunk_positions
+
+def markup_analysis_of_line_aligned_chunk(chunk_position):
+    """Analyze a single line-aligned chunk of a file in a worker process, returning the result of `markup_analysis_of_lines` for the chunk. The chunk position is extended with the block structure state at the beginning of the chunk and the resource limits for the file.
+    
+    The chunk is read as bytes and decoded using the same processing encoding and newline handling used by `open_input_file`, so that line contents are identical to those seen when analyzing the file as a whole.
+    """
+    
+    input_filename, encoding_information, chunk_start_byte_index, chunk_end_byte_index, block_structure_state, resource_limits = chunk_position
+    with open(input_filename, "rb") as opened_file:
+        opened_file.seek(chunk_start_byte_index)
+        chunk_bytes = opened_file.read(chunk_end_byte_index - chunk_start_byte_index)
+    chunk_lines = io.StringIO(chunk_bytes.decode(encoding_information["processing_encoding"]), newline=None)
+    return markup_analysis_of_lines(chunk_lines, encoding_information, block_structure_state, resource_limits)
+
+def merge_chunk_markup_analyses(chunk_markup_analyses, keep_normalized_link_labels=False):
+    """Combine the results of `markup_analysis_of_lines` for consecutive chunks into a single `document_markup_entire` dictionary.
+    
+    This is the *reduce* step of `markup_analysis`. Chunk-relative line numbers are made absolute by adding the line count of all preceding chunks, document-level information is combined, and normalized link labels and URIs are kept only if at least one potential link label and at least one link reference definition exist anywhere in the document, so that reference-style links are resolved across chunk boundaries. Normalized link labels and URIs are always kept if `keep_normalized_link_labels` is true, which is needed when link labels are resolved using link reference definitions from other files.
+    """
+    
+    document_markup_entire = create_document_markup_entire()
+    # Assignment to hold the number of lines preceding the current chunk
+    line_number_offset = 0
+    # Assignments to hold document-level information
+    at_least_one_heading_exists = False
+    at_least_one_hard_line_break_exists = False
+    at_least_one_footnote_link_reference_definition_exists = False
+    at_least_one_inline_link_exists = False
+    at_least_one_link_reference_definition_exists = False
+    total_heading_count = 0
+    highest_heading_number = None
+    lowest_heading_number = None
+    skipped_line_counts = {"blank_line": 0, "fenced_code": 0, "indented_code": 0, "html_block": 0}
+    for chunk_document_markup_entire, chunk_summary in chunk_markup_analyses:
+        # Copying line-level information, adjusting each chunk-relative line number
+        for element_type in chunk_document_markup_entire:
+            for line_level_dictionary_key in chunk_document_markup_entire[element_type]:
+                # Using the line-level information of a single chunk as it is, which avoids copying it, and keeps any link reference definitions stored on disk there
+                if len(chunk_markup_analyses) == 1:
+                    document_markup_entire[element_type][line_level_dictionary_key] = chunk_document_markup_entire[element_type][line_level_dictionary_key]
+                    continue
+                for chunk_line_number, line_level_information in chunk_document_markup_entire[element_type][line_level_dictionary_key].items():
+                    document_markup_entire[element_type][line_level_dictionary_key][chunk_line_number + line_number_offset] = line_level_information
+        line_number_offset += chunk_summary["line_count"]
+        # Combining document-level information
+        at_least_one_heading_exists = at_least_one_heading_exists or chunk_summary["at_least_one_heading_exists"]
+        at_least_one_hard_line_break_exists = at_least_one_hard_line_break_exists or chunk_summary["at_least_one_hard_line_break_exists"]
+        at_least_one_footnote_link_reference_definition_exists = at_least_one_footnote_link_reference_definition_exists or chunk_summary["at_least_one_footnote_link_reference_definition_exists"]
+        at_least_one_inline_link_exists = at_least_one_inline_link_exists or chunk_summary["at_least_one_inline_link_exists"]
+        at_least_one_link_reference_definition_exists = at_least_one_link_reference_definition_exists or chunk_summary["at_least_one_link_reference_definition_exists"]
+        total_heading_count += chunk_summary["total_heading_count"]
+        for line_block_structure in skipped_line_counts:
+            skipped_line_counts[line_block_structure] += chunk_summary["skipped_line_counts"][line_block_structure]
+        # Determining the highest and lowest heading numbers
+        if chunk_summary["highest_heading_number"] != None and (highest_heading_number == None or chunk_summary["highest_heading_number"] > highest_heading_number):
+            highest_heading_number = chunk_summary["highest_heading_number"]
+        if chunk_summary["lowest_heading_number"] != None and (lowest_heading_number == None or chunk_summary["lowest_heading_number"] < lowest_heading_number):
+            lowest_heading_number = chunk_summary["lowest_heading_number"]
+
+    # Removing extracted normalized link labels and URIs unless at least one potential link label exists and at least one link reference definition exists
+    if keep_normalized_link_labels == False and (bool(document_markup_entire["link"]["potential_link_label_lines"]) == False or bool(document_markup_entire["link"]["link_reference_definition_lines"]) == False):
+        for potential_link_label_line in document_markup_entire["link"]["potential_link_label_lines"]:
+            for potential_link_label_indexes in document_markup_entire["link"]["potential_link_label_lines"][potential_link_label_line]["potential_link_label_indexes"]:
+                del potential_link_label_indexes["normalized_potential_link_label"]
+        for link_reference_definition_line in document_markup_entire["link"]["link_reference_definition_lines"]:
+            # A link reference definition stored on disk is read as a copy, so the changed line-level information is assigned again
+            line_level_information = document_markup_entire["link"]["link_reference_definition_lines"][link_reference_definition_line]
+            del line_level_information["link_reference_definition_indexes"]["normalized_link_label"]
+            del line_level_information["link_reference_definition_indexes"]["uri"]
+            document_markup_entire["link"]["link_reference_definition_lines"][link_reference_definition_line] = line_level_information
+
+    # Appending information on the number of lines skipped for each kind of block structure to a dictionary
+    document_markup_entire["block"] = {}
+    document_markup_entire["block"]["skipped_line_counts"] = skipped_line_counts
+    # Appending information on whether or not at least one hard line break exists to a dictionary
+    document_markup_entire["break"]["at_least_one_hard_line_break_exists"] = at_least_one_hard_line_break_exists
+    # Appending information on whether or not at least one heading exists to a dictionary
+    document_markup_entire["heading"]["at_least_one_heading_exists"] = at_least_one_heading_exists
+    # Appending information on whether or not at least one footnote link reference definition exists to a dictionary
+    document_markup_entire["link"]["footnote_link_reference_definition_lines"]["at_least_one_footnote_link_reference_definition_exists"] = at_least_one_footnote_link_reference_definition_exists
+    # Appending information on whether or not at least one link exists to a dictionary
+    if at_least_one_inline_link_exists == True or at_least_one_link_reference_definition_exists == True:
+        document_markup_entire["link"]["at_least_one_link_exists"] = True
+    else:
+        document_markup_entire["link"]["at_least_one_link_exists"] = False
+    
+    # Appending additional information only if at least one heading exists
+    if at_least_one_heading_exists == True:
+        # Appending information on the highest and lowest heading numbers to a dictionary
+        document_markup_entire["heading"]["total_heading_count"] = total_heading_count
+        document_markup_entire["heading"]["highest_heading_number"] = highest_heading_number
+        document_markup_entire["heading"]["lowest_heading_number"] = lowest_heading_number
+
+    return document_markup_entire
+
+def markup_analysis(input_filename, encoding_information, number_of_worker_processes=1, keep_normalized_link_labels=False, resource_limits=None):
+    """Analyze the contents of an input file for any markup-related information.
+    
+    The following things are determined for the contents of the file:
+    
+    - if a heading exists:
+        - total heading count
+        - highest heading number
+        - lowest heading number
+    
+    The following things are determined for each line containing a heading:
+    
+    - beginning number sign count
+    - beginning space character count (if present)
+    - ending number sign count (if present)
+    - ending space character count (if present)
+
+    The `document_markup_entire` dictionary holds markup-related information in the following way:
+    
+    ```yaml
+    block:                                               # a key containing block-structure-related information
+      skipped_line_counts:                               # a key containing the number of lines skipped by the heading, line break, and link scanners for each kind of block structure
+        blank_line: 1                                    # a numerical value indicating the number of blank lines
+        fenced_code: 3                                   # a numerical value indicating the number of lines within fenced code blocks, including code fences
+        indented_code: 0                                 # a numerical value indicating the number of lines within indented code blocks
+        html_block: 0                                    # a numerical value indicating the number of lines within HTML blocks
+    break:                                               # a key containing line-break-related information
+      line_numbers_containing_hard_line_breaks:          # a key containing hard-line-break-related information on the level of individual lines
+        1:                                               # a key with an identifier indicating the line number of a line containing a line break
+          consecutive_trailing_space_character_count: 2  # a numerical value indicating the space character count (0+) for the end of a line
+      at_least_one_hard_line_break_exists: true          # an item with a boolean value indicating the presence of a hard line break
+    heading:                                             # a key containing heading-related information
+      line_numbers_containing_headings:                  # a key containing heading-related information on the level of individual lines
+        1:                                               # a key with an identifier indicating the line number of a line containing a heading
+          line_beginning_number_sign_count: 2            # a numerical value indicating the number sign count (1-6) for the beginning of a line
+          heading_content: foo bar                       # a string value indicating the heading content
+        2:                                               # a key with an identifier indicating the line number of a line containing a heading
+          line_beginning_space_character_count: 1        # a numerical value indicating the space character count (0-3) for the beginning of a line
+          line_beginning_number_sign_count: 1            # a numerical value indicating the number sign count (1-6) for the beginning of a line
+          line_ending_number_sign_count: 3               # a numerical value indicating the number sign count (0+) for the end of a line
+          line_ending_space_character_count: 1           # a numerical value indicating the space character count (0+) for the end of a line
+          heading_content: bar baz                       # a string value indicating the heading content
+      table_of_contents_marker_lines:                    # a key containing information on lines marking where a table of contents begins or ends
+        4:                                               # a key with an identifier indicating the line number of a line containing a marker
+          table_of_contents_marker: start                # a string value indicating either *start* for a `<!-- toc -->` line or *stop* for a `<!-- tocstop -->` line
+      at_least_one_heading_exists: true                  # an item with a boolean value indicating the presence of a heading
+      total_heading_count: 2                             # an item with a numerical value indicating the total heading count
+      highest_heading_number: 2                          # an item with a numerical value indicating the highest heading number
+      lowest_heading_number: 1                           # an item with a numerical value indicating the lowest heading number
+    ```
+    
+    Using a regular expression, a line is determined to contain a heading *if the following is true*:
+    
+    `^(?P<leading_space_character_group>(?P<space_character_1>\s)(?P=space_character_1){0,2})?`
+    : The line *optionally* starts with up to 3 space characters...
+    
+    `(?P<leading_heading_number_sign_group>(?P<number_sign_1>#)(?P=number_sign_1){0,5})`
+    : ...followed by between 1 and 6 number signs...
+    
+    `($|\s)`
+    : ...followed by the end of the line *or* by a space character...
+    
+    `(?P<heading_content>.*?)`
+    : ...followed *optionally* by the heading content...
+    
+    `(\s(?P<trailing_number_sign_group>(?P<number_sign_2>#)(?P=number_sign_2){0,})(?P<trailing_space_character_group>(?P<space_character_2>\s)(?P=space_character_2){0,})?)?$`
+    : ...followed *optionally* by a single space and a group of number signs with no upper limit, and *optionally* by a group of space characters with no upper limit.
+    
+    If more than one worker process is requested, the file is divided into line-aligned chunks that are analyzed concurrently in a process pool, with each chunk using chunk-relative line numbers. The results are then merged, including the highest and lowest heading numbers and the normalized link labels needed for reference-style links to be resolved across chunk boundaries. Files using an encoding in which a newline is not a single newline byte, such as UTF-16, compressed files, archive members, and files whose link reference definitions are stored on disk beyond a number held in memory are always analyzed in a single pass.
+    
+    When a file is processed byte-transparently (see `determine_encoding_information`), indexes are byte indexes within a line, and text such as heading content is stored undecoded.
+    
+    Resource limits, if given (see `create_resource_limits`), are checked by each chunk as it is analyzed, and the potential link label count is checked again for the whole file, raising a `ResourceLimitError` if any limit is exceeded.
+    """
+    
+    # Determining if the input file can be divided into chunks, which requires an uncompressed file on disk
+    input_file_seekable = isinstance(input_filename, str) and determine_compression_module(input_filename) == None
+    
+    # Determining if link reference definitions are stored on disk beyond a number held in memory, which requires a single store for the file
+    link_reference_definitions_spilled = resource_limits != None and resource_limits["maximum_link_reference_definition_count_in_memory"] != None
+    
+    if number_of_worker_processes > 1 and encoding_information["line_aligned_chunks_possible"] == True and input_file_seekable == True and link_reference_definitions_spilled == False:
+        chunk_positions = determine_line_aligned_chunk_positions(input_filename, encoding_information, number_of_worker_processes)
+        block_structure_states = determine_block_structure_states(input_filename, encoding_information, chunk_positions)
+        chunk_positions = [ chunk_position + (block_structure_state, resource_limits) for chunk_position, block_structure_state in zip(chunk_positions, block_structure_states) ]
+        import concurrent.futures
+        with concurrent.futures.ProcessPoolExecutor(max_workers=len(chunk_positions)) as executor:
+            chunk_markup_analyses = list(executor.map(markup_analysis_of_line_aligned_chunk, chunk_positions))
+    else:
+        with open_input_file(input_filename, encoding_information) as opened_file:
+            chunk_markup_analyses = [markup_analysis_of_lines(opened_file, encoding_information, None, resource_limits)]
+    
+    # Checking if the file has more potential link labels than allowed, which each chunk can only check for itself
+    if resource_limits != None and resource_limits["maximum_link_count"] != None and sum( chunk_summary["potential_link_label_count"] for chunk_document_markup_entire, chunk_summary in chunk_markup_analyses ) > resource_limits["maximum_link_count"]:
+        raise ResourceLimitError("more than {} potential link labels were found".format(resource_limits["maximum_link_count"]))
+    
+    document_markup_entire = merge_chunk_markup_analyses(chunk_markup_analyses, keep_normalized_link_labels)
+    
+    return document_markup_entire
+
+def load_shared_link_reference_definitions(definitions_filenames, specified_encoding=None):
+    """Load link reference definitions from files whose link reference definitions are shared by other files, returning a dictionary mapping each normalized link label to a link destination.
+    
+    The files are analyzed once, and the resulting dictionary is used to resolve link labels in every file processed afterward. As within a single file, the first of multiple link reference definitions with matching link labels takes precedence, with files considered in the order given. Normalized link labels and link destinations are stored as Unicode strings, with any undecodable bytes preserved as surrogate escapes, so that they can be converted to the representation used for any input file with `convert_shared_link_reference_definition_text`.
+    """
+    
+    shared_link_reference_definitions = {}
+    for definitions_filename in definitions_filenames:
+        encoding_information = determine_encoding_information(definitions_filename, specified_encoding)
+        document_markup_entire = markup_analysis(definitions_filename, encoding_information, keep_normalized_link_labels=True)
+        for link_reference_definition_line in sorted(document_markup_entire["link"]["link_reference_definition_lines"]):
+            link_reference_definition_indexes = document_markup_entire["link"]["link_reference_definition_lines"][link_reference_definition_line]["link_reference_definition_indexes"]
+            normalized_link_label = convert_shared_link_reference_definition_text(link_reference_definition_indexes["normalized_link_label"], encoding_information, True)
+            shared_link_reference_definitions.setdefault(normalized_link_label, convert_shared_link_reference_definition_text(link_reference_definition_indexes["uri"], encoding_information, True))
+    return shared_link_reference_definitions
+
+def convert_shared_link_reference_definition_text(markup_text, encoding_information, to_unicode):
+    "Convert text between the representation used for a file processed byte-transparently and the Unicode representation used for shared link reference definitions and transforms, converting to Unicode if `to_unicode` is true. Text from other files is returned unchanged, except that undecodable bytes preserved as surrogate escapes are replaced when converting from Unicode, since they cannot be encoded."
+    
+    if encoding_information["byte_transparent"] == True:
+        if to_unicode == True:
+            markup_text = markup_text.encode("latin-1").decode(encoding_information["encoding"], errors="surrogateescape")
+        else:
+            markup_text = markup_text.encode(encoding_information["encoding"], errors="surrogateescape").decode("latin-1")
+    elif to_unicode == False:
+        markup_text = markup_text.encode("utf-8", errors="surrogateescape").decode("utf-8", errors="replace")
+    return markup_text
+
+# Assignment to hold the element types that transforms can be registered for, in the order in which transforms are applied to a line, along with the keys of the line-level information on each element type in `document_markup_entire`. A transform for each element type is given the following text:
+# - `link`: the link destination of an inline link, including a link made inline-style or reference-style with *-k*
+# - `link_reference_definition`: the link destination of a link reference definition, whether used or unused, including the link destination taken from it when a reference-style link is made inline-style with *-k i*, which the `link` transforms are then given
+# - `footnote`: the body of a footnote link reference definition, without leading space characters
+# - `heading`: the heading content
+# - `hard_line_break`: the space characters making up a hard line break
+transform_element_types = {"link": ("link", "inline_link_lines"), "link_reference_definition": ("link", "link_reference_definition_lines"), "footnote": ("link", "footnote_link_reference_definition_lines"), "heading": ("heading", "line_numbers_containing_headings"), "hard_line_break": ("break", "line_numbers_containing_hard_line_breaks")}
+
+@functools.lru_cache(maxsize=None)
+def load_transform_plugins(plugin_names):
+    """Load plugins providing transforms, returning a dictionary mapping each element type in `transform_element_types` to the list of transforms registered for it, in order of registration. Element types without transforms are left out.
+    
+    Each plugin is either the filename of a Python file or the name of an importable module, and must define a `register_transforms` function, which is called with a `register_transform(element_type, transform)` function. A transform is called with the text of an element as a string, and returns the text to be written in its place. For example, a plugin rewriting link destinations for an internal mirror could contain:
+    
+    ```python
+    def register_transforms(register_transform):
+        register_transform("link", lambda link_destination: link_destination.replace("https://example.com/", "https://mirror.example.com/"))
+    ```
+    
+    The plugins are given as a tuple, and are loaded once per process, since the results are memoized. A `ValueError` is raised for a plugin without a `register_transforms` function, or for a transform registered for an unknown element type.
+    """
+    
+    import importlib.util
+    
+    transform_handlers = {}
+    
+    def register_transform(element_type, transform):
+        "Register a transform for an element type."
+        if element_type not in transform_element_types:
+            raise ValueError("*{}* is not an element type, which must be one of {}".format(element_type, ", ".join( "*{}*".format(transform_element_type) for transform_element_type in transform_element_types )))
+        transform_handlers.setdefault(element_type, []).append(transform)
+    
+    for plugin_name in plugin_names:
+        if plugin_name.endswith(".py") or os.path.isfile(plugin_name):
+            module_specification = importlib.util.spec_from_file_location("intramark_plugin_" + os.path.splitext(os.path.basename(plugin_name))[0], plugin_name)
+            plugin_module = importlib.util.module_from_spec(module_specification)
+            module_specification.loader.exec_module(plugin_module)
+        else:
+            plugin_module = importlib.import_module(plugin_name)
+        if hasattr(plugin_module, "register_transforms") == False:
+            raise ValueError("*{}* does not define a *register_transforms* function".format(plugin_name))
+        plugin_module.register_transforms(register_transform)
+    
+    # Ordering element types in the order in which transforms are applied
+    return { element_type: transform_handlers[element_type] for element_type in transform_element_types if element_type in transform_handlers }
+
+def create_heading_interval_index(document_markup_entire, encoding_information):
+    """Create a heading-interval index mapping the line number of each heading to information on the section beginning at it, in the following way:
+    
+    ```yaml
+    12:                                    # a key with an identifier indicating the line number of a line containing a heading
+      section_end_line_number: 40          # a numerical value indicating the line number of the last line of the section, or null if the section continues to the end of the document
+      heading_path: [guide, api reference] # a list value indicating the normalized heading content of each heading containing the section, outermost first, followed by that of the heading itself
+    ```
+    
+    A section continues up to the next heading with the same or a lower heading number. The index is created in a single pass over the headings in order, using a stack of the headings whose sections are not yet ended, and heading content is normalized with `normalize_link_label`.
+    """
+    
+    line_numbers_containing_headings = document_markup_entire["heading"]["line_numbers_containing_headings"]
+    heading_interval_index = {}
+    # Assignment to hold `(heading_line_number, heading_number)` tuples for the headings whose sections contain the current heading, outermost first
+    enclosing_headings = []
+    for heading_line_number in sorted(line_numbers_containing_headings):
+        heading_number = line_numbers_containing_headings[heading_line_number]["line_beginning_number_sign_count"]
+        # Ending the sections of headings with the same or a higher heading number
+        while bool(enclosing_headings) == True and enclosing_headings[-1][1] >= heading_number:
+            heading_interval_index[enclosing_headings.pop()[0]]["section_end_line_number"] = heading_line_number - 1
+        heading_path = []
+        if bool(enclosing_headings) == True:
+            heading_path = list(heading_interval_index[enclosing_headings[-1][0]]["heading_path"])
+        heading_path.append(normalize_link_label(line_numbers_containing_headings[heading_line_number].get("heading_content", ""), encoding_information["encoding"], encoding_information["byte_transparent"]))
+        heading_interval_index[heading_line_number] = {"section_end_line_number": None, "heading_path": heading_path}
+        enclosing_headings.append((heading_line_number, heading_number))
+    return heading_interval_index
+
+def restrict_markup_to_sections(document_markup_entire, section_heading_path, encoding_information):
+    """Restrict the information on headings and hard line breaks in `document_markup_entire` to the sections matching a heading path, returning the number of matching sections.
+    
+    A section matches if the heading path given ends with its heading path in the heading-interval index (see `create_heading_interval_index`). The line ranges of the matching sections are found with the index, and the line-level information on headings and hard line breaks outside them is removed, with the document-level information on headings determined again from the headings that remain. Modifications made by `markup_modification` are thereby restricted to the matching sections, with maximum amounts determined by the headings within them, without any other change. The anchors of all headings are created first and kept with the key `heading_anchors`, so that a table of contents of the matching sections links to the same anchors as a table of contents of the whole document.
+    """
+    
+    import bisect
+    
+    # Normalizing the heading content of each heading in the heading path in the same way as the heading content in the file
+    normalized_section_heading_path = [ normalize_link_label(convert_shared_link_reference_definition_text(section_heading_content, encoding_information, False), encoding_information["encoding"], encoding_information["byte_transparent"]) for section_heading_content in section_heading_path ]
+    heading_interval_index = create_heading_interval_index(document_markup_entire, encoding_information)
+    # Assignment to hold `(first_line_number, last_line_number)` tuples for the line ranges of the matching sections, in order, with a section contained in another section left out
+    section_line_ranges = []
+    for heading_line_number in sorted(heading_interval_index):
+        if heading_interval_index[heading_line_number]["heading_path"][-len(normalized_section_heading_path):] != normalized_section_heading_path:
+            continue
+        section_end_line_number = heading_interval_index[heading_line_number]["section_end_line_number"]
+        if section_end_line_number == None:
+            section_end_line_number = float("inf")
+        if bool(section_line_ranges) == True and heading_line_number <= section_line_ranges[-1][1]:
+            continue
+        section_line_ranges.append((heading_line_number, section_end_line_number))
+    section_first_line_numbers = [ first_line_number for first_line_number, last_line_number in section_line_ranges ]
+    
+    def line_is_within_sections(line_number):
+        "Determine if a line is within one of the matching sections."
+        section_index = bisect.bisect_right(section_first_line_numbers, line_number) - 1
+        return section_index >= 0 and line_number <= section_line_ranges[section_index][1]
+    
+    # Creating the anchors of the headings before headings outside the matching sections are removed, so that anchors in a table of contents are kept unique across the whole document
+    document_markup_entire["heading"]["heading_anchors"] = create_heading_anchors(document_markup_entire["heading"]["line_numbers_containing_headings"], encoding_information)
+    line_numbers_containing_headings = { heading_line_number: heading_information for heading_line_number, heading_information in document_markup_entire["heading"]["line_numbers_containing_headings"].items() if line_is_within_sections(heading_line_number) }
+    document_markup_entire["heading"]["line_numbers_containing_headings"] = line_numbers_containing_headings
+    document_markup_entire["break"]["line_numbers_containing_hard_line_breaks"] = { hard_line_break_line_number: hard_line_break_information for hard_line_break_line_number, hard_line_break_information in document_markup_entire["break"]["line_numbers_containing_hard_line_breaks"].items() if line_is_within_sections(hard_line_break_line_number) }
+    document_markup_entire["break"]["at_least_one_hard_line_break_exists"] = bool(document_markup_entire["break"]["line_numbers_containing_hard_line_breaks"])
+    document_markup_entire["heading"]["at_least_one_heading_exists"] = bool(line_numbers_containing_headings)
+    for document_level_key in ("total_heading_count", "highest_heading_number", "lowest_heading_number"):
+        document_markup_entire["heading"].pop(document_level_key, None)
+    if bool(line_numbers_containing_headings) == True:
+        document_markup_entire["heading"]["total_heading_count"] = len(line_numbers_containing_headings)
+        document_markup_entire["heading"]["highest_heading_number"] = max( heading_information["line_beginning_number_sign_count"] for heading_information in line_numbers_containing_headings.values() )
+        document_markup_entire["heading"]["lowest_heading_number"] = min( heading_information["line_beginning_number_sign_count"] for heading_information in line_numbers_containing_headings.values() )
+    
+    return len(section_line_ranges)
+
+def determine_table_of_contents_heading_text(heading_content):
+    "Determine the text of a heading for a table of contents, replacing inline links and images in heading content with their text."
+    
+    return re.sub(r'!?\[([^\]]*)\]\([^)]*\)', r'\1', heading_content).strip()
+
+def create_heading_anchors(line_numbers_containing_headings, encoding_information):
+    """Create the GitHub-style anchor of each heading (see `generate_heading_slug`), in a single pass over the headings in order, returning a dictionary mapping the line number of each heading with content to its anchor.
+    
+    Anchors are kept unique with a hash set of the anchors already in use: a colliding anchor is given the lowest unused numerical suffix, such as `-1` or `-2`, in the same way as GitHub. Headings without content are left out.
+    """
+    
+    heading_anchors = {}
+    # Assignment to hold the anchors already in use
+    heading_slugs_in_use = set()
+    # Assignment to hold the most recent numerical suffix given to each colliding anchor
+    heading_slug_suffix_numbers = defaultdict(int)
+    for current_line_number in sorted(line_numbers_containing_headings):
+        heading_text = determine_table_of_contents_heading_text(line_numbers_containing_headings[current_line_number].get("heading_content", ""))
+        if heading_text == "":
+            continue
+        heading_slug = generate_heading_slug(heading_text, encoding_information["encoding"], encoding_information["byte_transparent"])
+        unique_heading_slug = heading_slug
+        while unique_heading_slug in heading_slugs_in_use:
+            heading_slug_suffix_numbers[heading_slug] += 1
+            unique_heading_slug = "{}-{}".format(heading_slug, heading_slug_suffix_numbers[heading_slug])
+        heading_slugs_in_use.add(unique_heading_slug)
+        heading_anchors[current_line_number] = unique_heading_slug
+    return heading_anchors
+
+def create_table_of_contents(document_markup_entire, information_from_command_line_input, encoding_information):
+    """Create the lines of a nested table of contents from the headings found by `markup_analysis`, in a single pass over the headings in order, returning a list of lines in the same representation as the rest of the file's text.
+    
+    Each line is a list item linking to a heading with its GitHub-style anchor (see `create_heading_anchors`), indented two spaces for each level below the lowest heading number. Inline links and images in heading content are replaced with their text. Headings without content are left out. If the headings have been restricted to sections (see `restrict_markup_to_sections`), the anchors created from all headings of the document are used.
+    
+    Since an increase or decrease of the overall heading level (`+H` or `-H`) shifts every heading by the same amount, the nesting is unaffected and the table of contents matches the modified headings. No table of contents is created if all heading markup is stripped.
+    """
+    
+    table_of_contents_lines = []
+    if information_from_command_line_input["strip_all_heading_markup"] == True or document_markup_entire["heading"]["at_least_one_heading_exists"] == False:
+        return table_of_contents_lines
+    heading_anchors = document_markup_entire["heading"].get("heading_anchors")
+    if heading_anchors == None:
+        heading_anchors = create_heading_anchors(document_markup_entire["heading"]["line_numbers_containing_headings"], encoding_information)
+    for current_line_number in sorted(document_markup_entire["heading"]["line_numbers_containing_headings"]):
+        if current_line_number not in heading_anchors:
+            continue
+        heading_information = document_markup_entire["heading"]["line_numbers_containing_headings"][current_line_number]
+        heading_text = determine_table_of_contents_heading_text(heading_information.get("heading_content", ""))
+        table_of_contents_lines.append("{}- [{}](#{})".format("  " * (heading_information["line_beginning_number_sign_count"] - document_markup_entire["heading"]["lowest_heading_number"]), heading_text, heading_anchors[current_line_number]))
+    return table_of_contents_lines
+
+def create_footnote_index(input_filename, document_markup_entire, encoding_information):
+    """Create an index of the footnotes found by `markup_analysis`, reading only the lines containing footnote link labels or footnote link reference definitions in a single pass, and returning a dictionary in the following way:
+    
+    ```yaml
+    footnote_link_label_lines:                   # a key containing the footnote link labels on each line, including the link labels of footnote link reference definitions, in order of position
+      3:                                         # a key with an identifier indicating the line number of a line containing footnote link labels
+        - left_bracket_index: 8                  # a numerical value indicating the position of the left bracket
+          right_bracket_index: 14                # a numerical value indicating the position of the right bracket
+          normalized_link_label: ^note           # a string value indicating the normalized link label
+    footnote_link_reference_definition_lines:    # a key containing the normalized link label of the footnote link reference definition on each line
+      12: ^note
+    footnote_link_reference_definitions:         # a key mapping each normalized link label to the line number of the footnote link reference definition taking precedence, which is the first
+      ^note: 12
+    first_footnote_link_label_lines:             # a key mapping each normalized link label to the line number of its first use as a footnote link label
+      ^note: 3
+    footnote_numbers:                            # a key mapping each normalized link label to its number, in order of first use, followed by the link labels of unused footnote link reference definitions in order of position
+      ^note: 1
+    ```
+    
+    Each footnote link label can then be matched with its footnote link reference definition and its number with constant-time lookups, rather than by searching the document again. Link labels are matched by their normalized link labels (see `normalize_link_label`). Every link label is numbered, including those of undefined footnotes and unused footnote link reference definitions, so that renumbered link labels cannot match link labels that are not renumbered. Footnote link labels within inline code spans (see `determine_code_span_ranges`) are code rather than footnote link labels, and are left out.
+    """
+    
+    footnote_index = {}
+    footnote_index["footnote_link_label_lines"] = {}
+    footnote_index["footnote_link_reference_definition_lines"] = {}
+    footnote_index["footnote_link_reference_definitions"] = {}
+    footnote_index["first_footnote_link_label_lines"] = {}
+    footnote_index["footnote_numbers"] = {}
+    
+    with open_input_file(input_filename, encoding_information) as opened_file:
+        # Assignment to hold the current line number
+        current_line_number = 0
+        for current_line_string in opened_file:
+            # Incrementing to keep track of the current line number
+            current_line_number += 1
+            # Determining the link label of a footnote link reference definition
+            if current_line_number in document_markup_entire["link"]["footnote_link_reference_definition_lines"]:
+                footnote_link_reference_definition_indexes = document_markup_entire["link"]["footnote_link_reference_definition_lines"][current_line_number]["footnote_link_reference_definition_indexes"]
+                normalized_link_label = normalize_link_label(current_line_string[footnote_link_reference_definition_indexes["left_bracket_index"] + 1:footnote_link_reference_definition_indexes["right_bracket_index"]], encoding_information["encoding"], encoding_information["byte_transparent"])
+                footnote_index["footnote_link_label_lines"][current_line_number] = [{"left_bracket_index": footnote_link_reference_definition_indexes["left_bracket_index"], "right_bracket_index": footnote_link_reference_definition_indexes["right_bracket_index"], "normalized_link_label": normalized_link_label}]
+                footnote_index["footnote_link_reference_definition_lines"][current_line_number] = normalized_link_label
+                footnote_index["footnote_link_reference_definitions"].setdefault(normalized_link_label, current_line_number)
+            # Determining the link labels of footnote link labels, numbering each link label when first used
+            elif current_line_number in document_markup_entire["link"]["potential_footnote_link_label_lines"]:
+                # Determining the ranges of the line within inline code spans, where footnote link label syntax is code rather than a footnote link label
+                code_span_ranges = []
+                if "`" in current_line_string:
+                    code_span_ranges = determine_code_span_ranges(current_line_string)
+                footnote_index["footnote_link_label_lines"][current_line_number] = []
+                for potential_footnote_link_label_indexes in sorted(document_markup_entire["link"]["potential_footnote_link_label_lines"][current_line_number]["potential_footnote_link_label_indexes"], key=lambda potential_footnote_link_label_indexes: potential_footnote_link_label_indexes["left_bracket_index"]):
+                    if index_is_within_code_spans(potential_footnote_link_label_indexes["left_bracket_index"], code_span_ranges) == True:
+                        continue
+                    normalized_link_label = normalize_link_label(current_line_string[potential_footnote_link_label_indexes["left_bracket_index"] + 1:potential_footnote_link_label_indexes["right_bracket_index"]], encoding_information["encoding"], encoding_information["byte_transparent"])
+                    footnote_index["footnote_link_label_lines"][current_line_number].append({"left_bracket_index": potential_footnote_link_label_indexes["left_bracket_index"], "right_bracket_index": potential_footnote_link_label_indexes["right_bracket_index"], "normalized_link_label": normalized_link_label})
+                    if normalized_link_label not in footnote_index["first_footnote_link_label_lines"]:
+                        footnote_index["first_footnote_link_label_lines"][normalized_link_label] = current_line_number
+                        footnote_index["footnote_numbers"][normalized_link_label] = len(footnote_index["footnote_numbers"]) + 1
+    
+    # Numbering the link labels of unused footnote link reference definitions
+    for normalized_link_label in footnote_index["footnote_link_reference_definitions"]:
+        if normalized_link_label not in footnote_index["footnote_numbers"]:
+            footnote_index["footnote_numbers"][normalized_link_label] = len(footnote_index["footnote_numbers"]) + 1
+    
+    return footnote_index
+
+def markup_modification(input_filename, temporary_file, information_from_command_line_input, document_markup_entire, encoding_information, shared_link_reference_definitions=None, resource_limits=None, memory_report=None):
+    """Modify any existing markup in the contents of an input file, writing the results to a temporary file.
+    
+    The following things can be accomplished:
+    
+    - decrease overall heading level maximally
+    - decrease overall heading level by a numerical amount
+    - increase overall heading level maximally
+    - equalize heading trailing number sign count with heading level
+    - increase overall heading level by a numerical amount
+    - strip all heading markup
+    - strip trailing number signs and any post-number-sign space characters that exist from headings
+    - make all reference-style links inline-style, resolving link labels with link reference definitions in the file or, failing that, with shared link reference definitions (see `load_shared_link_reference_definitions`)
+    - make all inline links reference-style, using a hash map from link destination to link label so that each distinct link destination receives exactly one link reference definition
+    - insert a table of contents (see `create_table_of_contents`) after each `<!-- toc -->` line, replacing the lines up to a following `<!-- tocstop -->` line, or adding a `<!-- tocstop -->` line if there is none
+    - renumber footnotes sequentially in order of first use, remove unused and duplicate footnote definitions, and move footnote definitions to the end of the document, using a footnote index (see `create_footnote_index`)
+    - apply transforms provided by plugins (see `load_transform_plugins`)
+    
+    Reference-style links are indexed by line and by position within a line, so that matching them with link texts, with `[]`, and with the line being modified takes constant time. A footnote definition that is removed or moved includes any following lines indented by at least four spaces or a tab, along with blank lines between them.
+    
+    Transforms provided by plugins are applied using a dispatch table built once from the line-level information on each element type with registered transforms, so that each line calls only the transforms for the elements it contains, and element types without transforms are never examined. Transforms for links, link reference definitions, and footnotes are applied after the other modifications of links and footnotes, with positions adjusted by the changes in line length from those modifications, and transforms for headings and hard line breaks are applied before the other modifications of headings and line breaks. Resource limits, if given (see `create_resource_limits`), are checked for each line, raising a `ResourceLimitError` once the time allowed has ended. If a memory report is given (see `create_memory_report`), the *footnote_index* phase is begun before the footnote index is created, and the *rewrite* phase before the first line is modified.
+    
+    The command line information and the analysis of the document are only read. Working state, such as the combined information on reference-style links and the heading information changed by modifications, is held locally, so that a single analysis can be modified by concurrent calls from multiple threads.
+    """
+
+    with open_input_file(input_filename, encoding_information) as opened_file:
+        # Assignment to hold the current line number
+        current_line_number = 0
+        # Checking if any headings should be modified, which is not the case for a document without headings even if other markup is modified
+        if (information_from_command_line_input["modification_to_be_made_to_heading"] == True and
+                document_markup_entire["heading"]["at_least_one_heading_exists"] == True):
+            # Assignments to hold default values
+            number_of_heading_levels_to_decrease_in_either_case = 0
+            number_of_heading_levels_to_increase_in_either_case = 0
+            decrease_overall_heading_level_in_either_case = False
+            increase_overall_heading_level_in_either_case = False
+            # Determining how many levels to increase or decrease all headings
+            if (information_from_command_line_input["decrease_overall_heading_level_maximally"] == True) or (information_from_command_line_input["decrease_overall_heading_level_numerically"] == True and document_markup_entire["heading"]["lowest_heading_number"] - information_from_command_line_input["number_of_heading_levels_to_decrease_numerically"] < 1):
+                number_of_heading_levels_to_decrease_in_either_case = document_markup_entire["heading"]["lowest_heading_number"] - 1
+                decrease_overall_heading_level_in_either_case = True
+            elif (information_from_command_line_input["increase_overall_heading_level_maximally"] == True) or (information_from_command_line_input["increase_overall_heading_level_numerically"] == True and document_markup_entire["heading"]["highest_heading_number"] + information_from_command_line_input["number_of_heading_levels_to_increase_numerically"] > 6):
+                number_of_heading_levels_to_increase_in_either_case = 6 - document_markup_entire["heading"]["highest_heading_number"]
+                increase_overall_heading_level_in_either_case = True
+            elif information_from_command_line_input["decrease_overall_heading_level_numerically"] == True:
+                number_of_heading_levels_to_decrease_in_either_case = information_from_command_line_input["number_of_heading_levels_to_decrease_numerically"]
+                decrease_overall_heading_level_in_either_case = True
+            elif information_from_command_line_input["increase_overall_heading_level_numerically"] == True:
+                number_of_heading_levels_to_increase_in_either_case = information_from_command_line_input["number_of_heading_levels_to_increase_numerically"]
+                increase_overall_heading_level_in_either_case = True
+        # Assignment to hold combined information on each reference-style link and its link reference definition, by the position of its link label. This and all other working state is held locally, so that the analysis of the document is left unchanged and can be shared by concurrent calls.
+        reference_style_links = {}
+        # Assignments to hold the keys of reference-style links by line number, and by line number and bracket index
+        reference_style_link_keys_by_line = defaultdict(list)
+        reference_style_link_keys_by_left_bracket_position = {}
+        reference_style_link_keys_by_right_bracket_position = {}
+        # Checking if any links should be made inline-style
+        if information_from_command_line_input["make_all_links_inline_style"] == True:
+            # Determining if any reference-style links exist
+            # Creating a label-resolution index mapping each normalized link label to the line of its link reference definition. CommonMark gives precedence to the first of multiple link reference definitions with matching link labels.
+            link_reference_definition_lines_by_normalized_link_label = {}
+            # Storing the label-resolution index on disk beyond the same number held in memory if link reference definitions are stored on disk
+            if isinstance(document_markup_entire["link"]["link_reference_definition_lines"], SpillingDictionary) == True:
+                link_reference_definition_lines_by_normalized_link_label = SpillingDictionary(document_markup_entire["link"]["link_reference_definition_lines"].maximum_item_count_in_memory)
+            # Skipping the label-resolution index if no potential link labels exist, in which case normalized link labels are not kept (see `merge_chunk_markup_analyses`) and there is nothing to resolve
+            for link_reference_definition_line in (document_markup_entire["link"]["link_reference_definition_lines"] if bool(document_markup_entire["link"]["potential_link_label_lines"]) == True else ()):
+                link_reference_definition_lines_by_normalized_link_label.setdefault(document_markup_entire["link"]["link_reference_definition_lines"][link_reference_definition_line]["link_reference_definition_indexes"]["normalized_link_label"], link_reference_definition_line)
+            # Determining if any shortcut reference links exist by looking up each normalized potential link label in the label-resolution index, and then in the shared link reference definitions
+            if bool(link_reference_definition_lines_by_normalized_link_label) == True or bool(shared_link_reference_definitions) == True:
+                for potential_link_label_line in document_markup_entire["link"]["potential_link_label_lines"]:
+                    for potential_link_label_indexes in document_markup_entire["link"]["potential_link_label_lines"][potential_link_label_line]["potential_link_label_indexes"]:
+                        if (potential_link_label_indexes["normalized_potential_link_label"] not in link_reference_definition_lines_by_normalized_link_label and
+                                bool(shared_link_reference_definitions) == True):
+                            shared_normalized_link_label = convert_shared_link_reference_definition_text(potential_link_label_indexes["normalized_potential_link_label"], encoding_information, True)
+                            if shared_normalized_link_label in shared_link_reference_definitions:
+                                # In this situation, a normalized potential link label matches only a shared link reference definition, which has no line in the file
+                                reference_style_links[str(potential_link_label_line) + "," + str(potential_link_label_indexes["left_bracket_index"]) + "," + str(potential_link_label_indexes["right_bracket_index"])] = (
+                                {"normalized_link_label": potential_link_label_indexes["normalized_potential_link_label"],
+                                "link_reference_definition_line": None,
+                                "link_reference_definition_inter_colon_uri_space_character_count": 0,
+                                "link_uri": convert_shared_link_reference_definition_text(shared_link_reference_definitions[shared_normalized_link_label], encoding_information, False)})
+                        elif potential_link_label_indexes["normalized_potential_link_label"] in link_reference_definition_lines_by_normalized_link_label:
+                            # In this situation, a normalized potential link label matches a normalized link reference definition link label
+                            link_reference_definition_line = link_reference_definition_lines_by_normalized_link_label[potential_link_label_indexes["normalized_potential_link_label"]]
+                            # Data is stored as comma-separated string instead of tuple for JSON compatibility
+                            reference_style_links[str(potential_link_label_line) + "," + str(potential_link_label_indexes["left_bracket_index"]) + "," + str(potential_link_label_indexes["right_bracket_index"])] = (
+                            {"normalized_link_label": potential_link_label_indexes["normalized_potential_link_label"],
+                            "link_reference_definition_line": link_reference_definition_line,
+                            "link_reference_definition_inter_colon_uri_space_character_count": document_markup_entire["link"]["link_reference_definition_lines"][link_reference_definition_line]["link_reference_definition_indexes"].get("inter_colon_uri_space_character_count", 0),
+                            "link_uri": document_markup_entire["link"]["link_reference_definition_lines"][link_reference_definition_line]["link_reference_definition_indexes"]["uri"]})
+            # Determining if any shortcut reference links exist
+            if bool(reference_style_links) == True:
+                # Indexing the link labels of reference-style links by their line numbers, and by the positions of their brackets within each line
+                for link_label_position_key in reference_style_links:
+                    current_link_label_position = get_link_label_position(link_label_position_key)
+                    reference_style_link_keys_by_line[current_link_label_position[0]].append(link_label_position_key)
+                    reference_style_link_keys_by_left_bracket_position[(current_link_label_position[0], current_link_label_position[1])] = link_label_position_key
+                    reference_style_link_keys_by_right_bracket_position[(current_link_label_position[0], current_link_label_position[2])] = link_label_position_key
+                # Determining if any shortcut reference links are actually collapsed reference links
+                for current_line_string in opened_file:
+                    # Stripping newlines
+                    current_line_string = current_line_string.rstrip('\n')
+                    # Incrementing to keep track of the current line number
+                    current_line_number += 1
+                    # Determining if any lines contain the string `[]` that is required for a collapsed reference link, and if any shortcut reference links exist on the line
+                    if current_line_number in reference_style_link_keys_by_line and "[]" in current_line_string:
+                        # Iterating through all found occurrences of `[]` on the line
+                        required_string_position = current_line_string.find("[]")
+                        while required_string_position >= 0:
+                            # Determining if the right bracket of the link label in a shortcut reference link on the same line is followed by `[]`
+                            if (current_line_number, required_string_position - 1) in reference_style_link_keys_by_right_bracket_position:
+                                # In this situation, a collapsed reference link has been found
+                                reference_style_links[reference_style_link_keys_by_right_bracket_position[(current_line_number, required_string_position - 1)]]["is_collapsed_reference_link"] = True
+                            required_string_position = current_line_string.find("[]", required_string_position + 1)
+                # Resetting file object position to beginning of file
+                rewind_input_file(opened_file, encoding_information)
+                # Resetting assignment to hold the current line number
+                current_line_number = 0
+                # Determining if any shortcut reference links are actually full reference links
+                for potential_link_label_line in document_markup_entire["link"]["potential_link_label_lines"]:
+                    for potential_link_label_indexes in document_markup_entire["link"]["potential_link_label_lines"][potential_link_label_line]["potential_link_label_indexes"]:
+                        # Determining if the right bracket of the potential link label is immediately followed by the left bracket of the link label of a shortcut reference link on the same line
+                        if (potential_link_label_line, potential_link_label_indexes["right_bracket_index"] + 1) in reference_style_link_keys_by_left_bracket_position:
+                            link_label_position_key = reference_style_link_keys_by_left_bracket_position[(potential_link_label_line, potential_link_label_indexes["right_bracket_index"] + 1)]
+                            # In this situation, a full reference link has been found
+                            reference_style_links[link_label_position_key]["link_text"] = potential_link_label_indexes["normalized_potential_link_label"]
+                            reference_style_links[link_label_position_key]["link_text_left_bracket_index"] = potential_link_label_indexes["left_bracket_index"]
+                            reference_style_links[link_label_position_key]["link_text_right_bracket_index"] = potential_link_label_indexes["right_bracket_index"]
+        
+        # Checking if any links should be made reference-style
+        if information_from_command_line_input["make_all_links_reference_style"] == True:
+            # Assignment to hold a hash map from each link destination to the link label of its link reference definition, so that each distinct link destination has exactly one link reference definition
+            link_labels_by_link_destination = {}
+            # Assignment to hold normalized versions of all link labels already in use, which generated link labels must not match
+            link_labels_in_use = set()
+            # Assignment to hold normalized versions of the link labels of link reference definitions already found, so that only the first of multiple link reference definitions with matching link labels is reused
+            defined_link_labels = set()
+            # Assignment to hold the most recently generated numerical link label
+            generated_link_label_number = 0
+            # Assignment to hold generated link reference definitions that have not yet been written
+            pending_link_reference_definitions = []
+            # Collecting existing link labels and link reference definitions, so that existing link reference definitions are reused instead of duplicated, and generated link labels do not match existing link labels
+            # Warning: CommonMark gives precedence to the first of multiple link reference definitions with matching link labels
+            if bool(document_markup_entire["link"]["link_reference_definition_lines"]) == True or bool(document_markup_entire["link"]["potential_link_label_lines"]) == True:
+                for current_line_string in opened_file:
+                    # Stripping newlines
+                    current_line_string = current_line_string.rstrip('\n')
+                    # Incrementing to keep track of the current line number
+                    current_line_number += 1
+                    if current_line_number in document_markup_entire["link"]["link_reference_definition_lines"]:
+                        link_reference_definition_indexes = document_markup_entire["link"]["link_reference_definition_lines"][current_line_number]["link_reference_definition_indexes"]
+                        link_label = current_line_string[link_reference_definition_indexes["left_bracket_index"] + 1:link_reference_definition_indexes["right_bracket_index"]]
+                        normalized_link_label = normalize_link_label(link_label, encoding_information["encoding"], encoding_information["byte_transparent"])
+                        link_destination = current_line_string[link_reference_definition_indexes["uri_start_index"]:link_reference_definition_indexes["uri_end_index"] + 1]
+                        # Reusing only link reference definitions that take precedence, since a link label of a later definition with a matching link label resolves to the destination of the first
+                        if normalized_link_label not in defined_link_labels and link_destination not in link_labels_by_link_destination:
+                            link_labels_by_link_destination[link_destination] = link_label
+                        defined_link_labels.add(normalized_link_label)
+                        link_labels_in_use.add(normalized_link_label)
+                    elif current_line_number in document_markup_entire["link"]["potential_link_label_lines"]:
+                        for potential_link_label_indexes in document_markup_entire["link"]["potential_link_label_lines"][current_line_number]["potential_link_label_indexes"]:
+                            link_labels_in_use.add(normalize_link_label(current_line_string[potential_link_label_indexes["left_bracket_index"] + 1:potential_link_label_indexes["right_bracket_index"]], encoding_information["encoding"], encoding_information["byte_transparent"]))
+                # Resetting file object position to beginning of file
+                rewind_input_file(opened_file, encoding_information)
+                # Resetting assignment to hold the current line number
+                current_line_number = 0
+        
+        def write_link_reference_definitions(temporary_file, pending_link_reference_definitions, previous_line_string, blank_line_after):
+            """Write generated link reference definitions to a temporary file, emptying the list of pending link reference definitions.
+            
+            A blank line is written first unless the previously written line is blank, since a link reference definition cannot interrupt a paragraph.
+            """
+            if previous_line_string.strip() != "":
+                temporary_file.write("\n")
+            for link_label, link_destination in pending_link_reference_definitions:
+                temporary_file.write("[{}]: {}\n".format(link_label, link_destination))
+            if blank_line_after == True:
+                temporary_file.write("\n")
+            pending_link_reference_definitions.clear()
+        
+        # Assignment to hold the most recently written line
+        previous_line_string = ""
+        
+        # Checking if a table of contents should be inserted
+        if information_from_command_line_input["insert_table_of_contents"] == True:
+            # Creating the table of contents before any heading is modified
+            table_of_contents_lines = create_table_of_contents(document_markup_entire, information_from_command_line_input, encoding_information)
+            # Assignment to hold the line number of the stop marker ending each existing table of contents, or `None` if a start marker has no following stop marker, for each start marker
+            table_of_contents_stop_line_numbers = {}
+            start_marker_line_number = None
+            for marker_line_number in sorted(document_markup_entire["heading"]["table_of_contents_marker_lines"]):
+                if document_markup_entire["heading"]["table_of_contents_marker_lines"][marker_line_number]["table_of_contents_marker"] == "start":
+                    start_marker_line_number = marker_line_number
+                    table_of_contents_stop_line_numbers[start_marker_line_number] = None
+                elif start_marker_line_number != None:
+                    table_of_contents_stop_line_numbers[start_marker_line_number] = marker_line_number
+                    start_marker_line_number = None
+            # Assignment to hold the line number of the stop marker ending the table of contents being replaced
+            replaced_table_of_contents_stop_line_number = None
+        
+        # Checking if any footnotes should be modified
+        if information_from_command_line_input["modification_to_be_made_to_footnote"] == True:
+            record_memory_report_phase(memory_report, "footnote_index")
+            footnote_index = create_footnote_index(input_filename, document_markup_entire, encoding_information)
+            # Assignment to hold the lines of the footnote definition being removed or moved, or `None` if no such footnote definition is being written
+            footnote_definition_lines = None
+            # Assignment to hold blank lines following the footnote definition being removed or moved, which belong to it only if an indented line follows them
+            footnote_definition_blank_lines = []
+            # Assignment to hold `(sort_key, footnote_definition_lines)` tuples for footnote definitions to be moved to the end of the document
+            moved_footnote_definitions = []
+
+        def is_shortcut_reference_link(dictionary_item):
+            """Determine if a dictionary item refers to a [shortcut reference link](https://spec.commonmark.org/0.29/#shortcut-reference-link).
+            
+            Warning: this does not follow CommonMark spec, and uses CommonMark terminology differently than CommonMark itself does.
+            """
+            if ("is_collapsed_reference_link" not in dictionary_item and
+                "link_text" not in dictionary_item):
+                is_shortcut_reference_link = True
+            else:
+                is_shortcut_reference_link = False
+            return is_shortcut_reference_link
+        
+        def is_full_reference_link(dictionary_item):
+            """Determine if a dictionary item refers to a [full reference link](https://spec.commonmark.org/0.29/#full-reference-link).
+            """
+            if "link_text" in dictionary_item:
+                is_full_reference_link = True
+            else:
+                is_full_reference_link = False
+            return is_full_reference_link
+        
+        # Building a dispatch table from each line number to the element types with registered transforms found on the line, in the order in which transforms are applied
+        transform_handlers = load_transform_plugins(tuple(information_from_command_line_input["plugin_names"]))
+        transform_dispatch_table = defaultdict(list)
+        # Every line with an element of each type is included, such as every link reference definition whether used or unused
+        for element_type in transform_handlers:
+            for line_number in document_markup_entire[transform_element_types[element_type][0]][transform_element_types[element_type][1]]:
+                # Skipping document-level information stored alongside line-level information
+                if isinstance(line_number, int):
+                    transform_dispatch_table[line_number].append(element_type)
+        
+        def apply_transform_handlers(element_type, element_text):
+            "Apply the transforms registered for an element type to the text of an element, in order of registration, converting the text to and from the Unicode representation given to transforms."
+            element_text = convert_shared_link_reference_definition_text(element_text, encoding_information, True)
+            for transform_handler in transform_handlers[element_type]:
+                element_text = transform_handler(element_text)
+                if isinstance(element_text, str) == False:
+                    raise TypeError("a transform for the *{}* element type returned {!r} instead of a string".format(element_type, element_text))
+            return convert_shared_link_reference_definition_text(element_text, encoding_information, False)
+        
+        def transform_line_ranges(current_line_string, element_type, line_ranges, line_length_differences):
+            """Apply the transforms registered for an element type to the ranges of a line given as `(start_index, end_index)` tuples, returning the modified line.
+            
+            The ranges are positions within the line as it was read, in order of position, and are adjusted by the changes in line length in `line_length_differences`. The changes in line length from the transforms are then added to `line_length_differences`.
+            """
+            current_line_string_pieces = []
+            previous_end_index = 0
+            line_length_difference_index = 0
+            total_line_length_difference = 0
+            transform_line_length_differences = []
+            for start_index, end_index in line_ranges:
+                while line_length_difference_index < len(line_length_differences) and line_length_differences[line_length_difference_index][0] <= start_index:
+                    total_line_length_difference += line_length_differences[line_length_difference_index][1]
+                    line_length_difference_index += 1
+                adjusted_start_index = start_index + total_line_length_difference
+                while line_length_difference_index < len(line_length_differences) and line_length_differences[line_length_difference_index][0] <= end_index:
+                    total_line_length_difference += line_length_differences[line_length_difference_index][1]
+                    line_length_difference_index += 1
+                adjusted_end_index = end_index + total_line_length_difference
+                element_text = current_line_string[adjusted_start_index:adjusted_end_index]
+                transformed_element_text = apply_transform_handlers(element_type, element_text)
+                current_line_string_pieces.append(current_line_string[previous_end_index:adjusted_start_index])
+                current_line_string_pieces.append(transformed_element_text)
+                previous_end_index = adjusted_end_index
+                transform_line_length_differences.append((end_index, len(transformed_element_text) - len(element_text)))
+            current_line_string_pieces.append(current_line_string[previous_end_index:])
+            line_length_differences.extend(transform_line_length_differences)
+            line_length_differences.sort()
+            return "".join(current_line_string_pieces)
+
+        record_memory_report_phase(memory_report, "rewrite")
+        for current_line_string in opened_file:
+            # Stripping newlines
+            current_line_string = current_line_string.rstrip('\n')
+            # Incrementing to keep track of the current line number
+            current_line_number += 1
+            if resource_limits != None:
+                check_resource_limits(resource_limits)
+            if information_from_command_line_input["insert_table_of_contents"] == True:
+                # Skipping the lines of an existing table of contents, up to its stop marker
+                if replaced_table_of_contents_stop_line_number != None:
+                    if current_line_number < replaced_table_of_contents_stop_line_number:
+                        continue
+                    replaced_table_of_contents_stop_line_number = None
+                # Writing the table of contents after a start marker
+                if current_line_number in table_of_contents_stop_line_numbers:
+                    temporary_file.write("{}\n".format(current_line_string))
+                    previous_line_string = current_line_string
+                    if bool(table_of_contents_lines) == True:
+                        temporary_file.write("\n")
+                        for table_of_contents_line in table_of_contents_lines:
+                            temporary_file.write("{}\n".format(table_of_contents_line))
+                        temporary_file.write("\n")
+                        previous_line_string = ""
+                    replaced_table_of_contents_stop_line_number = table_of_contents_stop_line_numbers[current_line_number]
+                    if replaced_table_of_contents_stop_line_number == None:
+                        temporary_file.write("<!-- tocstop -->\n")
+                        previous_line_string = "<!-- tocstop -->"
+                    continue
+            # Assignments to hold default values for maximizing output consistency
+            remove_current_line = False
+            # Assignment to hold the reference-style links on the current line
+            reference_style_links_on_current_line = {}
+            # Assignment to hold a copy of the heading information of the current line once it is needed, which is modified in place of the analysis of the document
+            heading_information = None
+            # Assignment to hold `(end_index, line_length_difference)` tuples for the ranges of the line replaced when modifying links, in order of position, so that later positions within the line can be adjusted
+            line_length_differences = []
+            # Checking if the current line contains a link to be modified
+            if information_from_command_line_input["modification_to_be_made_to_link"] == True:
+                if information_from_command_line_input["make_all_links_inline_style"] == True and bool(reference_style_links) == True:
+                    # Any link matches on the current line are collected in a dictionary that exists during modification of the current line.
+                    for link_label_position_key in reference_style_link_keys_by_line.get(current_line_number, ()):
+                        # Collecting information on relevant reference-style links
+                        reference_style_links_on_current_line[link_label_position_key] = reference_style_links[link_label_position_key]
+                    # Determining if the current line has any reference-style links to be made into inline-style links.
+                    if bool(reference_style_links_on_current_line) == True:
+                        # Changing reference-style links to inline-style links by rebuilding the line from slices in a single pass, since rebuilding the whole line for each link takes time proportional to the length of the line for each link
+                        # Each link replaces a range of the line between a start index and an end index with its link destination in parentheses, and links are in order of position
+                        current_line_string_pieces = []
+                        previous_end_index = 0
+                        for link_label_position_key in reference_style_links_on_current_line:
+                            current_link_label_position = get_link_label_position(link_label_position_key)
+                            # Determining if the link is a shortcut reference link, for which the link destination is inserted after the link label
+                            if is_shortcut_reference_link(reference_style_links_on_current_line[link_label_position_key]):
+                                start_index = current_link_label_position[2] + 1
+                                end_index = current_link_label_position[2] + 1
+                            # Determining if the link is a full reference link, for which the link label following the link text is replaced
+                            elif is_full_reference_link(reference_style_links_on_current_line[link_label_position_key]):
+                                start_index = reference_style_links_on_current_line[link_label_position_key]["link_text_right_bracket_index"] + 1
+                                end_index = current_link_label_position[2] + 1
+                            # Determining if the link is a collapsed reference link, for which the `[]` following the link label is replaced
+                            elif "is_collapsed_reference_link" in reference_style_links_on_current_line[link_label_position_key]:
+                                start_index = current_link_label_position[2] + 1
+                                end_index = current_link_label_position[2] + 3
+                            else:
+                                continue
+                            current_line_string_pieces.append(current_line_string[previous_end_index:start_index])
+                            link_uri = reference_style_links_on_current_line[link_label_position_key]["link_uri"]
+                            # Applying the transforms for link reference definitions to the link destination taken from one, so that a used link reference definition is transformed whether it is kept or made inline-style
+                            if "link_reference_definition" in transform_handlers:
+                                link_uri = apply_transform_handlers("link_reference_definition", link_uri)
+                            if "link" in transform_handlers:
+                                link_uri = apply_transform_handlers("link", link_uri)
+                            current_line_string_pieces.append("(" + link_uri + ")")
+                            line_length_differences.append((end_index, len(current_line_string_pieces[-1]) - (end_index - start_index)))
+                            previous_end_index = end_index
+                        current_line_string_pieces.append(current_line_string[previous_end_index:])
+                        current_line_string = "".join(current_line_string_pieces)
+                    # Determining if the current line has any link reference definitions that should be removed
+                    if information_from_command_line_input["preserve_reference_style_links"] == False and current_line_number in document_markup_entire["link"]["link_reference_definition_lines"]:
+                        remove_current_line = True
+                if information_from_command_line_input["make_all_links_reference_style"] == True:
+                    # Writing link reference definitions generated for the previous section before the heading that begins the current section
+                    if (information_from_command_line_input["place_link_reference_definitions_per_section"] == True and
+                            current_line_number in document_markup_entire["heading"]["line_numbers_containing_headings"] and
+                            bool(pending_link_reference_definitions) == True):
+                        write_link_reference_definitions(temporary_file, pending_link_reference_definitions, previous_line_string, True)
+                    # Determining if the current line has any inline links to be made into reference-style links
+                    if current_line_number in document_markup_entire["link"]["inline_link_lines"]:
+                        # The line is rebuilt from slices in a single pass, replacing each inline link destination (including its parentheses) with a link label in brackets
+                        current_line_string_pieces = []
+                        previous_right_parenthesis_index = -1
+                        # Determining the ranges of the line within inline code spans, where link syntax is code rather than a link
+                        code_span_ranges = []
+                        if "`" in current_line_string:
+                            code_span_ranges = determine_code_span_ranges(current_line_string)
+                        for inline_link_indexes in sorted(document_markup_entire["link"]["inline_link_lines"][current_line_number]["inline_link_indexes"], key=lambda inline_link_indexes: inline_link_indexes["left_parenthesis_index"]):
+                            link_destination = current_line_string[inline_link_indexes["left_parenthesis_index"] + 1:inline_link_indexes["right_parenthesis_index"]]
+                            # Skipping empty link destinations, which cannot be used in a link reference definition, and links within inline code spans
+                            if link_destination.strip() == "" or index_is_within_code_spans(inline_link_indexes["left_bracket_index"], code_span_ranges) == True:
+                                continue
+                            if "link" in transform_handlers:
+                                link_destination = apply_transform_handlers("link", link_destination)
+                            if link_destination not in link_labels_by_link_destination:
+                                # Generating the lowest unused numerical link label
+                                generated_link_label_number += 1
+                                while str(generated_link_label_number) in link_labels_in_use:
+                                    generated_link_label_number += 1
+                                link_labels_by_link_destination[link_destination] = str(generated_link_label_number)
+                                pending_link_reference_definitions.append((str(generated_link_label_number), link_destination))
+                            current_line_string_pieces.append(current_line_string[previous_right_parenthesis_index + 1:inline_link_indexes["left_parenthesis_index"]])
+                            current_line_string_pieces.append("[" + link_labels_by_link_destination[link_destination] + "]")
+                            line_length_differences.append((inline_link_indexes["right_parenthesis_index"] + 1, len(current_line_string_pieces[-1]) - (inline_link_indexes["right_parenthesis_index"] + 1 - inline_link_indexes["left_parenthesis_index"])))
+                            previous_right_parenthesis_index = inline_link_indexes["right_parenthesis_index"]
+                        current_line_string_pieces.append(current_line_string[previous_right_parenthesis_index + 1:])
+                        current_line_string = "".join(current_line_string_pieces)
+                    
+            # Checking if the current line contains footnote link labels to be renumbered
+            if information_from_command_line_input["renumber_footnotes"] == True and current_line_number in footnote_index["footnote_link_label_lines"]:
+                # The line is rebuilt from slices in a single pass, replacing each link label with its number. Positions are adjusted by the changes in line length from modified links preceding each footnote link label, which never overlap footnote link labels.
+                current_line_string_pieces = []
+                previous_end_index = 0
+                line_length_difference_index = 0
+                total_line_length_difference = 0
+                renumbered_line_length_differences = []
+                for footnote_link_label_indexes in footnote_index["footnote_link_label_lines"][current_line_number]:
+                    while line_length_difference_index < len(line_length_differences) and line_length_differences[line_length_difference_index][0] <= footnote_link_label_indexes["left_bracket_index"]:
+                        total_line_length_difference += line_length_differences[line_length_difference_index][1]
+                        line_length_difference_index += 1
+                    current_line_string_pieces.append(current_line_string[previous_end_index:footnote_link_label_indexes["left_bracket_index"] + 1 + total_line_length_difference])
+                    current_line_string_pieces.append("^" + str(footnote_index["footnote_numbers"][footnote_link_label_indexes["normalized_link_label"]]))
+                    previous_end_index = footnote_link_label_indexes["right_bracket_index"] + total_line_length_difference
+                    renumbered_line_length_differences.append((footnote_link_label_indexes["right_bracket_index"], len(current_line_string_pieces[-1]) - (footnote_link_label_indexes["right_bracket_index"] - footnote_link_label_indexes["left_bracket_index"] - 1)))
+                current_line_string_pieces.append(current_line_string[previous_end_index:])
+                current_line_string = "".join(current_line_string_pieces)
+                line_length_differences.extend(renumbered_line_length_differences)
+                line_length_differences.sort()
+            # Applying transforms for the elements found on the current line, other than hard line breaks, which are transformed after line breaks are modified
+            if current_line_number in transform_dispatch_table:
+                for element_type in transform_dispatch_table[current_line_number]:
+                    if element_type == "link" and information_from_command_line_input["make_all_links_reference_style"] == False:
+                        current_line_string = transform_line_ranges(current_line_string, element_type, sorted( (inline_link_indexes["left_parenthesis_index"] + 1, inline_link_indexes["right_parenthesis_index"]) for inline_link_indexes in document_markup_entire["link"]["inline_link_lines"][current_line_number]["inline_link_indexes"] ), line_length_differences)
+                    elif element_type == "link_reference_definition" and remove_current_line == False:
+                        link_reference_definition_indexes = document_markup_entire["link"]["link_reference_definition_lines"][current_line_number]["link_reference_definition_indexes"]
+                        current_line_string = transform_line_ranges(current_line_string, element_type, [(link_reference_definition_indexes["uri_start_index"], link_reference_definition_indexes["uri_end_index"] + 1)], line_length_differences)
+                    elif element_type == "footnote":
+                        footnote_link_reference_definition_indexes = document_markup_entire["link"]["footnote_link_reference_definition_lines"][current_line_number]["footnote_link_reference_definition_indexes"]
+                        # Leaving out leading space characters of the footnote body
+                        footnote_body_start_index = footnote_link_reference_definition_indexes["footnote_body_start_index"]
+                        while footnote_body_start_index < footnote_link_reference_definition_indexes["footnote_body_end_index"] and current_line_string[footnote_body_start_index:footnote_body_start_index + 1] in (" ", "\t"):
+                            footnote_body_start_index += 1
+                        current_line_string = transform_line_ranges(current_line_string, element_type, [(footnote_body_start_index, footnote_link_reference_definition_indexes["footnote_body_end_index"])], line_length_differences)
+                    elif element_type == "heading":
+                        heading_information = dict(document_markup_entire["heading"]["line_numbers_containing_headings"][current_line_number])
+                        # Determining the heading content from the number sign and space character counts, which are unaffected by earlier modifications
+                        heading_content_start_index = heading_information.get("line_beginning_space_character_count", 0) + heading_information["line_beginning_number_sign_count"] + 1
+                        heading_content_end_index = len(current_line_string)
+                        if "line_ending_number_sign_count" in heading_information:
+                            heading_content_end_index -= heading_information["line_ending_number_sign_count"] + 1 + heading_information.get("line_ending_space_character_count", 0)
+                        # Skipping headings without content
+                        if heading_content_start_index < heading_content_end_index:
+                            heading_information["heading_content"] = apply_transform_handlers(element_type, current_line_string[heading_content_start_index:heading_content_end_index])
+                            current_line_string = current_line_string[:heading_content_start_index] + heading_information["heading_content"] + current_line_string[heading_content_end_index:]
+            # Checking if the current line contains a heading to be modified
+            if (current_line_number in document_markup_entire["heading"]["line_numbers_containing_headings"] and
+                    information_from_command_line_input["modification_to_be_made_to_heading"] == True):
+                if heading_information == None:
+                    heading_information = dict(document_markup_entire["heading"]["line_numbers_containing_headings"][current_line_number])
+                # Removing leading space characters temporarily, if any exist
+                if "line_beginning_space_character_count" in heading_information:
+                    current_line_string = current_line_string[heading_information["line_beginning_space_character_count"]:]
+                # Decreasing or increasing overall heading levels
+                if decrease_overall_heading_level_in_either_case == True:
+                    heading_information["line_beginning_number_sign_count"] -= number_of_heading_levels_to_decrease_in_either_case
+                    # Writing a slice of a line excluding the first *N* characters, where *N* is specified in the `number_of_heading_levels_to_decrease_in_either_case` identifier
+                    current_line_string = current_line_string[number_of_heading_levels_to_decrease_in_either_case:]
+                elif increase_overall_heading_level_in_either_case == True:
+                    heading_information["line_beginning_number_sign_count"] += number_of_heading_levels_to_increase_in_either_case
+                    # Writing a string of number signs of *N* length, where *N* is specified in the `number_of_heading_levels_to_increase_in_either_case` identifier
+                    current_line_string = ('#' * number_of_heading_levels_to_increase_in_either_case) + current_line_string
+                # Reintroducing temporarily-removed leading space characters, if any exist
+                if "line_beginning_space_character_count" in heading_information:
+                    current_line_string = (' ' * heading_information["line_beginning_space_character_count"]) + current_line_string
+                # Removing trailing space characters temporarily, if any exist
+                if "line_ending_space_character_count" in heading_information:
+                    current_line_string = current_line_string[:-heading_information["line_ending_space_character_count"]]
+                # Equalizing heading trailing number sign count with heading level
+                if information_from_command_line_input["equalize_heading_trailing_number_sign_count_with_heading_level"] == True and "line_ending_number_sign_count" in heading_information:
+                    if heading_information["line_ending_number_sign_count"] > heading_information["line_beginning_number_sign_count"]:
+                        number_of_trailing_number_signs_to_remove = heading_information["line_ending_number_sign_count"] - heading_information["line_beginning_number_sign_count"]
+                        # Removing a number of characters of *N* length, where *N* is specified in the `number_of_trailing_number_signs_to_remove` identifier
+                        current_line_string = current_line_string[:-number_of_trailing_number_signs_to_remove]
+                    elif heading_information["line_ending_number_sign_count"] < heading_information["line_beginning_number_sign_count"]:
+                        number_of_trailing_number_signs_to_add = heading_information["line_beginning_number_sign_count"] - heading_information["line_ending_number_sign_count"]
+                        # Writing a string of number signs of *N* length, where *N* is specified in the `number_of_trailing_number_signs_to_add` identifier
+                        current_line_string = current_line_string + ('#' * number_of_trailing_number_signs_to_add)
+                # Reintroducing temporarily-removed trailing space characters, if any exist
+                if "line_ending_space_character_count" in heading_information:
+                    current_line_string = current_line_string + (' ' * heading_information["line_ending_space_character_count"])
+                # Annotating heading by replacing a line with explanatory text followed by heading content
+                if information_from_command_line_input["annotate_headings"] == True:
+                    current_line_string = "Level " + str(heading_information["line_beginning_number_sign_count"]) + " heading. " + heading_information["heading_content"]
+                # Stripping trailing number signs and any post-number-sign space characters that exist from headings
+                if information_from_command_line_input["strip_trailing_number_signs_from_headings"] == True and "line_ending_number_sign_count" in heading_information:
+                    # Determining the number of trailing characters to strip. At minimum this will be a number equal to the trailing number sign count plus 1 for the required space character.
+                    number_of_trailing_characters_to_strip = heading_information["line_ending_number_sign_count"] + 1
+                    # Determining if any post-number-sign space characters exist, and adding their count to the number of trailing characters to strip if they do exist
+                    if "line_ending_space_character_count" in heading_information:
+                        number_of_trailing_characters_to_strip += heading_information["line_ending_space_character_count"]
+                    # Stripping a number of characters of *N* length, where *N* is specified in the `number_of_trailing_characters_to_strip` identifier
+                    current_line_string = current_line_string[:-number_of_trailing_characters_to_strip]
+                # Stripping all heading markup by replacing a line with the heading content
+                if information_from_command_line_input["strip_all_heading_markup"] == True:
+                    current_line_string = heading_information["heading_content"]
+            # Checking if the current line contains a line break to be modified
+            if (current_line_number in document_markup_entire["break"]["line_numbers_containing_hard_line_breaks"] and
+                    information_from_command_line_input["modification_to_be_made_to_line_break"] == True):
+                # Stripping all line breaks
+                if information_from_command_line_input["strip_all_line_breaks"] == True:
+                    # Determining the number of trailing characters to strip
+                    number_of_trailing_characters_to_strip = document_markup_entire["break"]["line_numbers_containing_hard_line_breaks"][current_line_number]["consecutive_trailing_space_character_count"]
+                    # Stripping a number of characters of *N* length, where *N* is specified in the `number_of_trailing_characters_to_strip` identifier
+                    current_line_string = current_line_string[:-number_of_trailing_characters_to_strip]
+            # Applying transforms for a hard line break that has not been stripped
+            if "hard_line_break" in transform_dispatch_table.get(current_line_number, ()) and information_from_command_line_input["strip_all_line_breaks"] == False:
+                number_of_trailing_characters_to_transform = document_markup_entire["break"]["line_numbers_containing_hard_line_breaks"][current_line_number]["consecutive_trailing_space_character_count"]
+                if current_line_string[-number_of_trailing_characters_to_transform:].strip(" ") == "":
+                    current_line_string = current_line_string[:-number_of_trailing_characters_to_transform] + apply_transform_handlers("hard_line_break", current_line_string[-number_of_trailing_characters_to_transform:])
+            # Checking if the current line belongs to a footnote definition to be removed or moved
+            if remove_current_line == False and (information_from_command_line_input["remove_unused_footnote_definitions"] == True or information_from_command_line_input["move_footnote_definitions_to_end"] == True):
+                if footnote_definition_lines != None:
+                    # Holding blank lines until it is known whether an indented line continuing the footnote definition follows them
+                    if current_line_string.strip() == "":
+                        footnote_definition_blank_lines.append(current_line_string)
+                        remove_current_line = True
+                    elif current_line_string[:4] == "    " or current_line_string[:1] == "\t":
+                        footnote_definition_lines.extend(footnote_definition_blank_lines)
+                        footnote_definition_blank_lines = []
+                        footnote_definition_lines.append(current_line_string)
+                        remove_current_line = True
+                    else:
+                        # Ending the footnote definition, and writing the blank lines following it in place unless the line preceding it is blank
+                        footnote_definition_lines = None
+                        if previous_line_string.strip() != "":
+                            for footnote_definition_blank_line in footnote_definition_blank_lines:
+                                temporary_file.write("{}\n".format(footnote_definition_blank_line))
+                                previous_line_string = footnote_definition_blank_line
+                        footnote_definition_blank_lines = []
+                if footnote_definition_lines == None and current_line_number in footnote_index["footnote_link_reference_definition_lines"]:
+                    normalized_link_label = footnote_index["footnote_link_reference_definition_lines"][current_line_number]
+                    # Removing a footnote definition that is unused, or that is preceded by a footnote definition with a matching link label
+                    if information_from_command_line_input["remove_unused_footnote_definitions"] == True and (normalized_link_label not in footnote_index["first_footnote_link_label_lines"] or footnote_index["footnote_link_reference_definitions"][normalized_link_label] != current_line_number):
+                        footnote_definition_lines = []
+                    # Moving a footnote definition, in order of number if footnotes are renumbered and otherwise in order of position
+                    elif information_from_command_line_input["move_footnote_definitions_to_end"] == True:
+                        footnote_definition_lines = []
+                        if information_from_command_line_input["renumber_footnotes"] == True:
+                            moved_footnote_definitions.append((footnote_index["footnote_numbers"][normalized_link_label], footnote_definition_lines))
+                        else:
+                            moved_footnote_definitions.append((len(moved_footnote_definitions), footnote_definition_lines))
+                    if footnote_definition_lines != None:
+                        footnote_definition_lines.append(current_line_string)
+                        remove_current_line = True
+            # Writing the line to a temporary file
+            if remove_current_line == False:
+                temporary_file.write("{}\n".format(current_line_string))
+                previous_line_string = current_line_string
+        
+        # Writing any remaining generated link reference definitions at the end of the document
+        if information_from_command_line_input["make_all_links_reference_style"] == True and bool(pending_link_reference_definitions) == True:
+            last_link_reference_definition_line_string = "[{}]: {}".format(*pending_link_reference_definitions[-1])
+            write_link_reference_definitions(temporary_file, pending_link_reference_definitions, previous_line_string, False)
+            previous_line_string = last_link_reference_definition_line_string
+        
+        if information_from_command_line_input["modification_to_be_made_to_footnote"] == True:
+            # Writing blank lines following a footnote definition at the end of the document in place unless the line preceding it is blank
+            if previous_line_string.strip() != "":
+                for footnote_definition_blank_line in footnote_definition_blank_lines:
+                    temporary_file.write("{}\n".format(footnote_definition_blank_line))
+                    previous_line_string = footnote_definition_blank_line
+            # Writing moved footnote definitions at the end of the document, after a blank line
+            if bool(moved_footnote_definitions) == True:
+                if previous_line_string.strip() != "":
+                    temporary_file.write("\n")
+                for sort_key, footnote_definition_lines in sorted(moved_footnote_definitions, key=lambda moved_footnote_definition: moved_footnote_definition[0]):
+                    for footnote_definition_line in footnote_definition_lines:
+                        temporary_file.write("{}\n".format(footnote_definition_line))
+
+def diagnostic_display(input_filename, document_markup_entire, encoding_information):
+    "Display diagnostic information about the contents of the file, which is the analysis of the file before any modification, decoding any text taken from the file."
+    
+    import json
+    
+    def decode_dictionary_text(dictionary_item):
+        "Create a copy of a dictionary item in which every string value is decoded with `decode_markup_text`."
+        if isinstance(dictionary_item, (dict, SpillingDictionary)):
+            return { dictionary_key: decode_dictionary_text(dictionary_value) for dictionary_key, dictionary_value in dictionary_item.items() }
+        elif isinstance(dictionary_item, list):
+            return [ decode_dictionary_text(list_item) for list_item in dictionary_item ]
+        elif isinstance(dictionary_item, str):
+            return decode_markup_text(dictionary_item, encoding_information)
+        return dictionary_item
+    
+    if encoding_information["byte_transparent"] == True:
+        document_markup_entire = decode_dictionary_text(document_markup_entire)
+    # Link reference definitions stored on disk (see `SpillingDictionary`) are displayed as a dictionary
+    print(json.dumps(document_markup_entire, indent=4, default=dict))
+    
+    ## Assignment to hold the current line number
+    #current_line_number = 0
+    #print("\nDiagnostic information:\n".upper())
+    #if document_markup_entire["heading"]["at_least_one_heading_exists"] == True:
+        ## Summarizing heading-related information.
+        ## Appending information on the highest and lowest heading numbers to a dictionary
+        #with open(input_filename, "r") as opened_file:
+            #print("The total heading count is ",document_markup_entire["heading"]["total_heading_count"],".", sep='')
+            #print("The highest heading level is ",document_markup_entire["heading"]["highest_heading_number"],".", sep='')
+            #print("The lowest heading level is ",document_markup_entire["heading"]["lowest_heading_number"],".", sep='')
+            #for current_line_string in opened_file:
+                ## Incrementing to keep track of the current line number
+                #current_line_number += 1
+                #if current_line_number in document_markup_entire["heading"]["line_numbers_containing_headings"]:
+                    #print("Line",current_line_number,"contains a heading.")
+                    #if "line_ending_number_sign_count" in document_markup_entire["heading"]["line_numbers_containing_headings"][current_line_number]:
+                        #print("The beginning number sign count is ",document_markup_entire["heading"]["line_numbers_containing_headings"][current_line_number]["line_beginning_number_sign_count"],", and the ending number sign count is ",document_markup_entire["heading"]["line_numbers_containing_headings"][current_line_number]["line_ending_number_sign_count"],".", sep='')
+                    #else:
+                        #print("The beginning number sign count is ",document_markup_entire["heading"]["line_numbers_containing_headings"][current_line_number]["line_beginning_number_sign_count"],".", sep='')
+                #else:
+                    #print("Line",current_line_number,"does not contain a heading.")
+    #elif at_least_one_heading_exists == False:
+        #print("No headings were found.")
+
+def link_lint(input_filename, document_markup_entire, encoding_information, displayed_input_filename=None, shared_link_reference_definitions=None):
+    """Find problems with reference-style links and footnotes, returning a list of dictionaries describing each problem, ordered by position.
+    
+    The file is read in a single pass, during which link labels and link reference definitions are collected into dictionaries and sets keyed by link label. Problems are then determined with constant-time lookups, so that the time taken is proportional to the size of the file. The following problems are found:
+    
+    - `undefined_link_label`: the link label of a full reference link (`[foo][bar]`) or a collapsed reference link (`[bar][]`) matches no link reference definition. Shortcut reference links (`[bar]`) are not reported, since they cannot be distinguished from text in brackets.
+    - `unused_link_reference_definition`: no potential link label matches the link label of a link reference definition.
+    - `duplicate_link_reference_definition`: the link label of a link reference definition matches an earlier one. CommonMark gives precedence to the first link reference definition, so the later one is ignored.
+    - `undefined_footnote`: a footnote link label matches no footnote link reference definition.
+    - `unused_footnote_definition`: no footnote link label matches a footnote link reference definition.
+    - `duplicate_footnote_definition`: the link label of a footnote link reference definition matches an earlier one.
+    
+    Each problem is described in the following way:
+    
+    ```yaml
+    input_filename: foo.md            # a string value indicating the filename of the file containing the problem
+    line_number: 3                    # a numerical value indicating the line number of the problem
+    column_number: 5                  # a numerical value indicating the position of the left bracket within the line, starting at 1
+    problem: undefined_link_label     # a string value indicating the kind of problem
+    link_label: bar                   # a string value indicating the link label involved
+    first_line_number: 1              # a numerical value indicating the line number of the link reference definition taking precedence, for duplicate link reference definitions only
+    ```
+    
+    Link labels are matched by their normalized link labels (see `normalize_link_label`), while the link label of the first occurrence is reported. A link label matching a shared link reference definition (see `load_shared_link_reference_definitions`) is not undefined. The displayed input filename, if given, is reported in place of the input file.
+    """
+    
+    if displayed_input_filename == None:
+        displayed_input_filename = input_filename
+    
+    def normalized(link_label):
+        "Normalize a link label from the file."
+        return normalize_link_label(link_label, encoding_information["encoding"], encoding_information["byte_transparent"])
+    
+    # Assignments to hold normalized link labels, with each normalized link label mapped to a list of `(line_number, column_number, link_label)` positions
+    link_reference_definition_positions = {}
+    footnote_link_reference_definition_positions = {}
+    footnote_link_label_positions = {}
+    # Assignment to hold `(link_label, line_number, column_number)` tuples for link labels of full reference links and collapsed reference links
+    reference_link_labels = []
+    # Assignment to hold all normalized potential link labels, any of which may use a link reference definition
+    potential_link_labels = set()
+    
+    with open_input_file(input_filename, encoding_information) as opened_file:
+        # Assignment to hold the current line number
+        current_line_number = 0
+        for current_line_string in opened_file:
+            # Stripping newlines
+            current_line_string = current_line_string.rstrip('\n')
+            # Incrementing to keep track of the current line number
+            current_line_number += 1
+            # Collecting link reference definitions
+            if current_line_number in document_markup_entire["link"]["link_reference_definition_lines"]:
+                link_reference_definition_indexes = document_markup_entire["link"]["link_reference_definition_lines"][current_line_number]["link_reference_definition_indexes"]
+                link_label = current_line_string[link_reference_definition_indexes["left_bracket_index"] + 1:link_reference_definition_indexes["right_bracket_index"]]
+                link_reference_definition_positions.setdefault(normalized(link_label), []).append((current_line_number, link_reference_definition_indexes["left_bracket_index"] + 1, link_label))
+            # Collecting potential link labels, and determining which of them are link labels of full reference links or collapsed reference links
+            if current_line_number in document_markup_entire["link"]["potential_link_label_lines"]:
+                potential_link_label_indexes_list = document_markup_entire["link"]["potential_link_label_lines"][current_line_number]["potential_link_label_indexes"]
+                # Assignment to hold the right bracket index of every potential link label on the line, so that adjacent brackets can be found with constant-time lookups
+                right_bracket_indexes = { potential_link_label_indexes["right_bracket_index"] for potential_link_label_indexes in potential_link_label_indexes_list }
+                for potential_link_label_indexes in potential_link_label_indexes_list:
+                    link_label = current_line_string[potential_link_label_indexes["left_bracket_index"] + 1:potential_link_label_indexes["right_bracket_index"]]
+                    potential_link_labels.add(normalized(link_label))
+                    # Determining if the potential link label immediately follows another potential link label, or is immediately followed by `[]`
+                    if (potential_link_label_indexes["left_bracket_index"] - 1 in right_bracket_indexes or
+                            current_line_string[potential_link_label_indexes["right_bracket_index"] + 1:potential_link_label_indexes["right_bracket_index"] + 3] == "[]"):
+                        reference_link_labels.append((link_label, current_line_number, potential_link_label_indexes["left_bracket_index"] + 1))
+            # Collecting footnote link labels
+            if current_line_number in document_markup_entire["link"]["potential_footnote_link_label_lines"]:
+                for potential_footnote_link_label_indexes in document_markup_entire["link"]["potential_footnote_link_label_lines"][current_line_number]["potential_footnote_link_label_indexes"]:
+                    link_label = current_line_string[potential_footnote_link_label_indexes["left_bracket_index"] + 1:potential_footnote_link_label_indexes["right_bracket_index"]]
+                    footnote_link_label_positions.setdefault(normalized(link_label), []).append((current_line_number, potential_footnote_link_label_indexes["left_bracket_index"] + 1, link_label))
+            # Collecting footnote link reference definitions
+            if current_line_number in document_markup_entire["link"]["footnote_link_reference_definition_lines"]:
+                footnote_link_reference_definition_indexes = document_markup_entire["link"]["footnote_link_reference_definition_lines"][current_line_number]["footnote_link_reference_definition_indexes"]
+                link_label = current_line_string[footnote_link_reference_definition_indexes["left_bracket_index"] + 1:footnote_link_reference_definition_indexes["right_bracket_index"]]
+                footnote_link_reference_definition_positions.setdefault(normalized(link_label), []).append((current_line_number, footnote_link_reference_definition_indexes["left_bracket_index"] + 1, link_label))
+    
+    problems = []
+    
+    def add_problem(line_number, column_number, problem, link_label):
+        "Append a dictionary describing a problem to the list of problems."
+        problems.append({"input_filename": displayed_input_filename, "line_number": line_number, "column_number": column_number, "problem": problem, "link_label": decode_markup_text(link_label, encoding_information)})
+    
+    for link_label, line_number, column_number in reference_link_labels:
+        # Determining if the link label matches neither a link reference definition in the file nor a shared link reference definition
+        if normalized(link_label) not in link_reference_definition_positions and (bool(shared_link_reference_definitions) == False or
+                convert_shared_link_reference_definition_text(normalized(link_label), encoding_information, True) not in shared_link_reference_definitions):
+            add_problem(line_number, column_number, "undefined_link_label", link_label)
+    for normalized_link_label, positions in link_reference_definition_positions.items():
+        if normalized_link_label not in potential_link_labels:
+            add_problem(positions[0][0], positions[0][1], "unused_link_reference_definition", positions[0][2])
+        for line_number, column_number, link_label in positions[1:]:
+            add_problem(line_number, column_number, "duplicate_link_reference_definition", link_label)
+            problems[-1]["first_line_number"] = positions[0][0]
+    for normalized_link_label, positions in footnote_link_label_positions.items():
+        if normalized_link_label not in footnote_link_reference_definition_positions:
+            for line_number, column_number, link_label in positions:
+                add_problem(line_number, column_number, "undefined_footnote", link_label)
+    for normalized_link_label, positions in footnote_link_reference_definition_positions.items():
+        if normalized_link_label not in footnote_link_label_positions:
+            add_problem(positions[0][0], positions[0][1], "unused_footnote_definition", positions[0][2])
+        for line_number, column_number, link_label in positions[1:]:
+            add_problem(line_number, column_number, "duplicate_footnote_definition", link_label)
+            problems[-1]["first_line_number"] = positions[0][0]
+    
+    problems.sort(key=lambda problem: (problem["line_number"], problem["column_number"]))
+    return problems
+
+def write_file_contents(opened_file, encoding_information, output_binary_file):
+    "Write the lines of a file opened in text mode to a file opened in binary mode using the processing encoding, beginning with any byte order mark found in the input file. The output file is left open."
+    
+    output_file = open_output_file(output_binary_file, encoding_information)
+    for current_line_string in opened_file:
+        output_file.write(current_line_string)
+    output_file.flush()
+    # Detaching so that the output file is not closed along with the wrapper
+    output_file.detach()
+
+def display_file_contents(opened_file, encoding_information):
+    "Display the lines of a file opened in text mode, writing them to standard output using the processing encoding so that the bytes displayed are the bytes that would be written to a file."
+    
+    sys.stdout.flush()
+    write_file_contents(opened_file, encoding_information, sys.stdout.buffer)
+
+def process_document(input_filename, information_from_command_line_input, output_destination=None, displayed_input_filename=None, shared_link_reference_definitions=None):
+    """Analyze and modify a single document, writing or displaying the results as specified with command line input, and returning an exit status.
+    
+    The input file may be any input source accepted by `open_binary_input_file`. The output destination is either:
+    
+    - `None`, to display the contents of the document unless diagnostic information or problems are displayed instead,
+    - a filename, which is opened with `open_binary_output_file` only after the document has been modified, so that the input file can be overwritten, or
+    - a file opened in binary mode, such as an archive member, which is left open.
+    
+    The displayed input filename is used in place of the input file when reporting problems, which is needed for archive members. Shared link reference definitions, if any, are used to resolve link labels (see `load_shared_link_reference_definitions`).
+    
+    A `ResourceLimitError` is raised if the document exceeds a resource limit (see `create_resource_limits`). Analysis and modification are finished before anything is written, so the output destination is left untouched in that case.
+    
+    All state is local to each call, so documents can be processed concurrently from multiple threads with the same command line information, as long as each output destination is used by a single call and nothing is displayed.
+    """
+    
+    if displayed_input_filename == None:
+        displayed_input_filename = input_filename
+    resource_limits = create_resource_limits(information_from_command_line_input)
+    memory_report = create_memory_report(information_from_command_line_input)
+    
+    encoding_information = determine_encoding_information(input_filename, information_from_command_line_input["encoding"])
+    
+    def write_document(opened_file):
+        "Write the lines of a file opened in text mode to the output destination, or display them if there is no output destination."
+        if isinstance(output_destination, str):
+            with open_binary_output_file(output_destination) as output_binary_file:
+                write_file_contents(opened_file, encoding_information, output_binary_file)
+        elif output_destination != None:
+            write_file_contents(opened_file, encoding_information, output_destination)
+        else:
+            display_file_contents(opened_file, encoding_information)
+    
+    # Writing or displaying the contents of the document without analyzing it if no modification, diagnostic information, or problems are needed
+    if (information_from_command_line_input["modification_to_be_made"] == False and
+            information_from_command_line_input["diagnostic"] == False and
+            information_from_command_line_input["lint_links"] == False and
+            information_from_command_line_input["display_table_of_contents"] == False):
+        if output_destination != None or information_from_command_line_input["display_file_contents"] == True:
+            record_memory_report_phase(memory_report, "output")
+            with open_input_file(input_filename, encoding_information) as opened_file:
+                write_document(opened_file)
+        display_memory_report(memory_report, input_filename, displayed_input_filename, encoding_information)
+        return 0
+    
+    record_memory_report_phase(memory_report, "analysis")
+    document_markup_entire = markup_analysis(input_filename, encoding_information, information_from_command_line_input["number_of_worker_processes"], bool(shared_link_reference_definitions), resource_limits)
+    
+    # Restricting modifications to the sections matching a heading path, if specified, leaving the document unmodified if no section matches
+    if information_from_command_line_input["section_heading_path"] != None:
+        if restrict_markup_to_sections(document_markup_entire, information_from_command_line_input["section_heading_path"], encoding_information) == 0:
+            print("\nSection not found:".upper(), "*{}* has no section matching *{}*.\n".format(displayed_input_filename, " > ".join(information_from_command_line_input["section_heading_path"])), file=sys.stderr)
+    
+    # Assignments to hold default values for maximizing output consistency
+    file_contents_written = False
+    modifications_have_markup_to_modify = False
+
+    # Checking if specified modifications have any markup to modify
+    if ((information_from_command_line_input["modification_to_be_made_to_heading"] == True and
+            document_markup_entire["heading"]["at_least_one_heading_exists"] == True) or
+            (information_from_command_line_input["modification_to_be_made_to_line_break"] == True and
+            document_markup_entire["break"]["at_least_one_hard_line_break_exists"] == True) or
+            (information_from_command_line_input["modification_to_be_made_to_link"] == True and
+            document_markup_entire["link"]["at_least_one_link_exists"] == True) or
+            (information_from_command_line_input["make_all_links_inline_style"] == True and
+            bool(shared_link_reference_definitions) == True and
+            bool(document_markup_entire["link"]["potential_link_label_lines"]) == True) or
+            (information_from_command_line_input["insert_table_of_contents"] == True and
+            bool(document_markup_entire["heading"]["table_of_contents_marker_lines"]) == True) or
+            (information_from_command_line_input["modification_to_be_made_to_footnote"] == True and
+            (bool(document_markup_entire["link"]["potential_footnote_link_label_lines"]) == True or
+            document_markup_entire["link"]["footnote_link_reference_definition_lines"]["at_least_one_footnote_link_reference_definition_exists"] == True)) or
+            any( isinstance(line_number, int) for element_type in load_transform_plugins(tuple(information_from_command_line_input["plugin_names"])) for line_number in document_markup_entire[transform_element_types[element_type][0]][transform_element_types[element_type][1]] )):
+        modifications_have_markup_to_modify = True
+
+    # Determining if the contents of the document should be written or displayed
+    if output_destination != None:
+        write_or_display_file_contents = True
+        # Leaving a file that would be written in place untouched when there is nothing to modify
+        if output_destination == input_filename and modifications_have_markup_to_modify == False:
+            write_or_display_file_contents = False
+    else:
+        write_or_display_file_contents = information_from_command_line_input["display_file_contents"]
+
+    if modifications_have_markup_to_modify == True:
+        import tempfile
+        # Creating temporary file to hold intermediate modifications. The temporary file is created before calling a function so that the temporary file will still exist after exiting the function.
+        with tempfile.TemporaryFile('w+', encoding=encoding_information["processing_encoding"]) as temporary_file:
+            record_memory_report_phase(memory_report, "reference_resolution")
+            markup_modification(input_filename, temporary_file, information_from_command_line_input, document_markup_entire, encoding_information, shared_link_reference_definitions, resource_limits, memory_report)
+            if write_or_display_file_contents == True:
+                record_memory_report_phase(memory_report, "output")
+                # Resetting file object position to beginning of file
+                temporary_file.seek(0)
+                file_contents_written = True
+                write_document(temporary_file)
+
+    # Writing or displaying the unmodified contents of the document
+    if write_or_display_file_contents == True and file_contents_written == False:
+        record_memory_report_phase(memory_report, "output")
+        with open_input_file(input_filename, encoding_information) as opened_file:
+            write_document(opened_file)
+
+    if information_from_command_line_input["diagnostic"] == True:
+        record_memory_report_phase(memory_report, "diagnostic")
+        diagnostic_display(input_filename, document_markup_entire, encoding_information)
+
+    if information_from_command_line_input["display_table_of_contents"] == True:
+        record_memory_report_phase(memory_report, "table_of_contents")
+        for table_of_contents_line in create_table_of_contents(document_markup_entire, information_from_command_line_input, encoding_information):
+            print(decode_markup_text(table_of_contents_line, encoding_information))
+
+    # Assignment to hold the exit status
+    exit_status = 0
+    if information_from_command_line_input["lint_links"] == True:
+        import json
+        record_memory_report_phase(memory_report, "lint")
+        problems = link_lint(input_filename, document_markup_entire, encoding_information, displayed_input_filename, shared_link_reference_definitions)
+        # Reporting only problems on changed lines if requested, which is only possible for files rather than archive members
+        if information_from_command_line_input["changed_line_ranges"] != None and isinstance(input_filename, str):
+            changed_line_ranges = information_from_command_line_input["changed_line_ranges"].get(os.path.abspath(input_filename))
+            if changed_line_ranges != None:
+                problems = [ problem for problem in problems if any( first_line_number <= problem["line_number"] <= last_line_number for first_line_number, last_line_number in changed_line_ranges ) ]
+        for problem in problems:
+            print(json.dumps(problem))
+        if bool(problems) == True:
+            exit_status = 1
+    
+    display_memory_report(memory_report, input_filename, displayed_input_filename, encoding_information)
+    
+    return exit_status
+
+def process_archive(input_filename, information_from_command_line_input, output_filename=None, shared_link_reference_definitions=None):
+    """Process every Markdown member of a tar or zip archive with `process_document`, writing a new archive to the output file if one is specified, and returning an exit status.
+    
+    The archive is read one member at a time, and nothing is extracted to disk. Tar archives are read in streaming mode, so that a compressed tar archive is decompressed in a single sequential pass, and a new tar archive is likewise written as a stream. Each Markdown member is read into memory and processed, and its results are written to the new archive in place of the original member. All other members are copied unchanged. Without an output file, Markdown members are displayed, diagnosed, or linted in turn, and problems are reported with filenames in the form `archive.tar.gz:member.md`.
+    """
+    
+    import shutil
+    import tarfile
+    import zipfile
+    
+    archive_format = determine_archive_format(input_filename)[0]
+    # Assignment to hold the exit status
+    exit_status = 0
+    
+    if archive_format == "tar":
+        with tarfile.open(input_filename, "r|*") as input_archive:
+            output_archive = None
+            if output_filename != None:
+                output_archive = tarfile.open(output_filename, "w|" + determine_archive_format(output_filename)[1])
+            for archive_member in input_archive:
+                displayed_input_filename = "{}:{}".format(input_filename, archive_member.name)
+                if archive_member.isfile() and archive_member.name.lower().endswith(markdown_filename_extensions):
+                    archive_member_contents = input_archive.extractfile(archive_member).read()
+                    if output_archive != None:
+                        # The size of a tar archive member is written before its contents, so the processed contents are held in memory
+                        output_archive_member_file = io.BytesIO()
+                        exit_status = max(exit_status, process_document(archive_member_contents, information_from_command_line_input, output_archive_member_file, displayed_input_filename, shared_link_reference_definitions))
+                        archive_member.size = output_archive_member_file.tell()
+                        output_archive_member_file.seek(0)
+                        output_archive.addfile(archive_member, output_archive_member_file)
+                    else:
+                        exit_status = max(exit_status, process_document(archive_member_contents, information_from_command_line_input, None, displayed_input_filename, shared_link_reference_definitions))
+                elif output_archive != None:
+                    if archive_member.isfile():
+                        output_archive.addfile(archive_member, input_archive.extractfile(archive_member))
+                    else:
+                        output_archive.addfile(archive_member)
+            if output_archive != None:
+                output_archive.close()
+    elif archive_format == "zip":
+        with zipfile.ZipFile(input_filename) as input_archive:
+            output_archive = None
+            if output_filename != None:
+                output_archive = zipfile.ZipFile(output_filename, "w")
+            for archive_member in input_archive.infolist():
+                displayed_input_filename = "{}:{}".format(input_filename, archive_member.filename)
+                if archive_member.is_dir() == False and archive_member.filename.lower().endswith(markdown_filename_extensions):
+                    archive_member_contents = input_archive.read(archive_member)
+                    if output_archive != None:
+                        with output_archive.open(archive_member, "w") as output_archive_member_file:
+                            exit_status = max(exit_status, process_document(archive_member_contents, information_from_command_line_input, output_archive_member_file, displayed_input_filename, shared_link_reference_definitions))
+                    else:
+                        exit_status = max(exit_status, process_document(archive_member_contents, information_from_command_line_input, None, displayed_input_filename, shared_link_reference_definitions))
+                elif output_archive != None:
+                    if archive_member.is_dir() == True:
+                        output_archive.writestr(archive_member, b"")
+                    else:
+                        with input_archive.open(archive_member) as input_archive_member_file, output_archive.open(archive_member, "w", force_zip64=archive_member.file_size >= zipfile.ZIP64_LIMIT) as output_archive_member_file:
+                            shutil.copyfileobj(input_archive_member_file, output_archive_member_file)
+            if output_archive != None:
+                output_archive.close()
+    
+    return exit_status
+
+def determine_content_hash(input_filename):
+    "Determine the SHA-256 hash of the contents of a file, returning a hexadecimal string. The file is read in fixed-size blocks so that large files are not held in memory."
+    
+    import hashlib
+    
+    content_hash = hashlib.sha256()
+    with open(input_filename, "rb") as opened_file:
+        for file_block in iter(functools.partial(opened_file.read, 1048576), b""):
+            content_hash.update(file_block)
+    return content_hash.hexdigest()
+
+def find_markdown_files(directory_name):
+    "Find every Markdown file within a directory and its subdirectories, including compressed Markdown files, returning a sorted list of absolute filenames."
+    
+    markdown_filenames = []
+    for current_directory_name, subdirectory_names, filenames in os.walk(os.path.abspath(directory_name)):
+        for filename in filenames:
+            uncompressed_filename = filename
+            if determine_compression_module(filename) != None:
+                uncompressed_filename = os.path.splitext(filename)[0]
+            if uncompressed_filename.lower().endswith(markdown_filename_extensions):
+                markdown_filenames.append(os.path.join(current_directory_name, filename))
+    markdown_filenames.sort()
+    return markdown_filenames
+
+def determine_changed_files(revision, determine_changed_lines=False):
+    """Determine the files changed since a revision of the git repository containing the current directory, including uncommitted changes, returning a dictionary mapping the absolute filename of each changed file that still exists to a list of `(first_line_number, last_line_number)` tuples indicating its changed lines, or to `None` if changed lines are not determined.
+    
+    Changed lines are read from the hunk headers of *git diff* without context lines, in which `@@ -3,2 +4,5 @@` indicates that lines 4 through 8 are new or changed. Lines that were only removed leave no changed lines behind. Filenames in the diff are read as git writes them, with a tab following a filename containing a space, and with filenames containing special characters quoted in the way of C strings. A changed file whose filename is not found in the diff is mapped to `None`, so that every line of it is treated as changed rather than none. A `ValueError` is raised if git reports an error, such as for an unknown revision.
+    """
+    
+    import subprocess
+    
+    def git_output(git_arguments):
+        "Run git with arguments, returning its output, and raising a `ValueError` with its error output if it fails."
+        completed_process = subprocess.run(["git", "-c", "core.quotepath=false"] + git_arguments, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if completed_process.returncode != 0:
+            raise ValueError(os.fsdecode(completed_process.stderr))
+        return completed_process.stdout
+    
+    def unquote_git_filename(git_filename):
+        "Remove the tab git writes after a filename containing a space, and the quotes and backslash escape sequences git writes for a filename containing special characters, returning the filename as bytes."
+        if git_filename.endswith(b"\t"):
+            git_filename = git_filename[:-1]
+        if len(git_filename) >= 2 and git_filename.startswith(b'"') and git_filename.endswith(b'"'):
+            # Assignment to hold the character represented by each escape sequence other than octal ones
+            escaped_characters = {b"a": b"\a", b"b": b"\b", b"t": b"\t", b"n": b"\n", b"v": b"\v", b"f": b"\f", b"r": b"\r", b'"': b'"', b"\\": b"\\"}
+            git_filename = re.sub(rb'\\([0-7]{3}|.)', lambda escape_sequence_match: bytes([int(escape_sequence_match.group(1), 8)]) if len(escape_sequence_match.group(1)) == 3 else escaped_characters.get(escape_sequence_match.group(1), escape_sequence_match.group(1)), git_filename[1:-1])
+        return git_filename
+    
+    repository_directory_name = os.fsdecode(git_output(["rev-parse", "--show-toplevel"]).rstrip(b"\n"))
+    # Listing changed files separated by null characters, so that filenames are not quoted, and leaving out deleted files
+    changed_files = { os.path.join(repository_directory_name, os.fsdecode(changed_filename)): None for changed_filename in git_output(["-C", repository_directory_name, "diff", "--name-only", "-z", "--no-renames", "--diff-filter=d", revision, "--"]).split(b"\0") if changed_filename != b"" }
+    
+    if determine_changed_lines == True:
+        for changed_filename in changed_files:
+            changed_files[changed_filename] = []
+        # Assignment to hold the changed files whose filenames are found in the diff
+        changed_files_found_in_diff = set()
+        changed_filename = None
+        for current_line_string in git_output(["-C", repository_directory_name, "diff", "--unified=0", "--no-color", "--no-ext-diff", "--no-renames", "--diff-filter=d", "--no-prefix", revision, "--"]).split(b"\n"):
+            if current_line_string.startswith(b"+++ "):
+                changed_filename = os.path.join(repository_directory_name, os.fsdecode(unquote_git_filename(current_line_string[len(b"+++ "):])))
+                changed_files_found_in_diff.add(changed_filename)
+            elif current_line_string.startswith(b"@@ ") and changed_filename in changed_files:
+                # Reading the start and length of the new lines from a hunk header, where a missing length indicates a single line
+                new_line_numbers = current_line_string.split(b" ")[2][1:].split(b",")
+                first_line_number = int(new_line_numbers[0])
+                number_of_lines = 1
+                if len(new_line_numbers) > 1:
+                    number_of_lines = int(new_line_numbers[1])
+                if number_of_lines > 0:
+                    changed_files[changed_filename].append((first_line_number, first_line_number + number_of_lines - 1))
+            elif current_line_string.startswith(b"diff "):
+                changed_filename = None
+        for changed_filename in changed_files:
+            if changed_filename not in changed_files_found_in_diff:
+                changed_files[changed_filename] = None
+    
+    return changed_files
+
+def split_document(input_filename, information_from_command_line_input):
+    """Split a document into one file per section as specified with command line input, displaying the filename of each file written, and returning an exit status.
+    
+    A section begins at each heading with a heading level up to the one given with *--split-at*, and continues up to the next such heading. Any lines before the first such heading form section 0, unless they are all blank, so that sections beginning at headings are numbered from 1. Sections are written to the output directory, which is created if needed, or else to the directory containing the input file, with filenames in the form `manual-03-installation.md`.
+    
+    Headings are found with `markup_analysis`, so that headings within code blocks and HTML blocks do not begin sections. The document is then read once, with each line written to the file of its section as it is read, so that the text of the document is never held in memory. A link reference definition is copied to the end of a section if a link label in the section matches it, and the section has no link reference definition of its own with a matching link label. The link reference definitions to copy are determined with a label-resolution index, as with *-k i*, and only their lines are read in a first pass over the document. If the overall heading level should be decreased maximally, this is done for each section separately, so that each section begins at level 1.
+    """
+    
+    import bisect
+    
+    resource_limits = create_resource_limits(information_from_command_line_input)
+    encoding_information = determine_encoding_information(input_filename, information_from_command_line_input["encoding"])
+    document_markup_entire = markup_analysis(input_filename, encoding_information, information_from_command_line_input["number_of_worker_processes"], True, resource_limits)
+    line_numbers_containing_headings = document_markup_entire["heading"]["line_numbers_containing_headings"]
+    link_reference_definition_lines = document_markup_entire["link"]["link_reference_definition_lines"]
+    
+    # Assignment to hold the line number at which each section begins, beginning with any lines before the first heading at which the document is split
+    section_start_line_numbers = [ heading_line_number for heading_line_number in sorted(line_numbers_containing_headings) if line_numbers_containing_headings[heading_line_number]["line_beginning_number_sign_count"] <= information_from_command_line_input["split_heading_level"] ]
+    section_start_line_numbers.insert(0, 1)
+    
+    def determine_section_index(line_number):
+        "Determine the index of the section containing a line."
+        return bisect.bisect_right(section_start_line_numbers, line_number) - 1
+    
+    # Determining the number of heading levels to decrease in each section, if the overall heading level of each section should be decreased maximally
+    numbers_of_heading_levels_to_decrease_by_section = defaultdict(int)
+    if information_from_command_line_input["decrease_overall_heading_level_maximally"] == True:
+        lowest_heading_numbers_by_section = {}
+        for heading_line_number, heading_information in line_numbers_containing_headings.items():
+            section_index = determine_section_index(heading_line_number)
+            lowest_heading_numbers_by_section[section_index] = min(lowest_heading_numbers_by_section.get(section_index, 6), heading_information["line_beginning_number_sign_count"])
+        for section_index, lowest_heading_number in lowest_heading_numbers_by_section.items():
+            numbers_of_heading_levels_to_decrease_by_section[section_index] = lowest_heading_number - 1
+    
+    # Creating a label-resolution index mapping each normalized link label to the line of its link reference definition, giving precedence to the first of multiple link reference definitions with matching link labels, along with the normalized link labels defined within each section
+    link_reference_definition_lines_by_normalized_link_label = {}
+    normalized_link_labels_defined_by_section = defaultdict(set)
+    for link_reference_definition_line in link_reference_definition_lines:
+        normalized_link_label = link_reference_definition_lines[link_reference_definition_line]["link_reference_definition_indexes"]["normalized_link_label"]
+        link_reference_definition_lines_by_normalized_link_label.setdefault(normalized_link_label, link_reference_definition_line)
+        normalized_link_labels_defined_by_section[determine_section_index(link_reference_definition_line)].add(normalized_link_label)
+    # Determining the link reference definitions to copy to each section, by looking up each normalized potential link label outside of link reference definitions in the label-resolution index
+    copied_link_reference_definition_lines_by_section = defaultdict(set)
+    for potential_link_label_line in document_markup_entire["link"]["potential_link_label_lines"]:
+        if potential_link_label_line in link_reference_definition_lines:
+            continue
+        section_index = determine_section_index(potential_link_label_line)
+        for potential_link_label_indexes in document_markup_entire["link"]["potential_link_label_lines"][potential_link_label_line]["potential_link_label_indexes"]:
+            normalized_potential_link_label = potential_link_label_indexes["normalized_potential_link_label"]
+            if normalized_potential_link_label in link_reference_definition_lines_by_normalized_link_label and normalized_potential_link_label not in normalized_link_labels_defined_by_section[section_index]:
+                copied_link_reference_definition_lines_by_section[section_index].add(link_reference_definition_lines_by_normalized_link_label[normalized_potential_link_label])
+    
+    # Determining the filename of each section
+    input_filename_stem = os.path.basename(input_filename)
+    if determine_compression_module(input_filename_stem) != None:
+        input_filename_stem = os.path.splitext(input_filename_stem)[0]
+    input_filename_stem, input_filename_extension = os.path.splitext(input_filename_stem)
+    output_directory_name = information_from_command_line_input["output_filename"]
+    if output_directory_name == None:
+        output_directory_name = os.path.dirname(input_filename)
+    section_number_width = max(2, len(str(len(section_start_line_numbers))))
+    section_filenames = []
+    for section_index, section_start_line_number in enumerate(section_start_line_numbers):
+        section_filename = "{}-{}".format(input_filename_stem, str(section_index).zfill(section_number_width))
+        if section_start_line_number in line_numbers_containing_headings:
+            heading_slug = generate_heading_slug(line_numbers_containing_headings[section_start_line_number].get("heading_content", ""), encoding_information["encoding"], encoding_information["byte_transparent"])
+            heading_slug = decode_markup_text(heading_slug, encoding_information)[:60].strip("-")
+            if heading_slug != "":
+                section_filename += "-" + heading_slug
+        section_filenames.append(os.path.join(output_directory_name, section_filename + (input_filename_extension or ".md")))
+    if output_directory_name != "":
+        os.makedirs(output_directory_name, exist_ok=True)
+    
+    with open_input_file(input_filename, encoding_information) as opened_file:
+        # Reading the lines of the link reference definitions to copy in a first pass
+        copied_link_reference_definition_lines = set().union(*copied_link_reference_definition_lines_by_section.values())
+        link_reference_definition_line_strings = {}
+        if bool(copied_link_reference_definition_lines) == True:
+            for current_line_number, current_line_string in enumerate(opened_file, 1):
+                if current_line_number in copied_link_reference_definition_lines:
+                    link_reference_definition_line_strings[current_line_number] = current_line_string.rstrip("\n")
+            rewind_input_file(opened_file, encoding_information)
+        
+        # Assignments to hold the section being written, its output files, and the last line written to it
+        section_index = None
+        output_binary_file = None
+        output_file = None
+        previous_line_string = "\n"
+        # Assignment to hold blank lines before the first section, which are only written if a line that is not blank follows them
+        leading_blank_line_strings = []
+        
+        def close_section():
+            "Write the link reference definitions to copy to the end of the section being written, and close its output files."
+            if section_index in copied_link_reference_definition_lines_by_section:
+                if previous_line_string.endswith("\n") == False:
+                    output_file.write("\n")
+                if previous_line_string.strip(" \t\n") != "":
+                    output_file.write("\n")
+                for link_reference_definition_line in sorted(copied_link_reference_definition_lines_by_section[section_index]):
+                    output_file.write(link_reference_definition_line_strings[link_reference_definition_line] + "\n")
+            output_file.flush()
+            output_file.detach()
+            output_binary_file.close()
+        
+        for current_line_number, current_line_string in enumerate(opened_file, 1):
+            if resource_limits != None:
+                check_resource_limits(resource_limits, current_line_string)
+            # Determining if the line begins a section, which is begun only once a line that is not blank is found
+            current_section_index = determine_section_index(current_line_number)
+            if current_section_index != section_index:
+                if current_line_string.strip(" \t\n") == "" and section_index == None:
+                    leading_blank_line_strings.append(current_line_string)
+                    continue
+                if section_index != None:
+                    close_section()
+                section_index = current_section_index
+                output_binary_file = open_binary_output_file(section_filenames[section_index])
+                output_file = open_output_file(output_binary_file, encoding_information)
+                print(section_filenames[section_index])
+                # Writing blank lines before the first heading only if they are followed by other lines before it
+                if section_index == 0:
+                    for leading_blank_line_string in leading_blank_line_strings:
+                        output_file.write(leading_blank_line_string)
+            # Decreasing the heading level of a heading by the number of heading levels to decrease in its section
+            if current_line_number in line_numbers_containing_headings and numbers_of_heading_levels_to_decrease_by_section[section_index] > 0:
+                line_beginning_space_character_count = line_numbers_containing_headings[current_line_number].get("line_beginning_space_character_count", 0)
+                current_line_string = current_line_string[:line_beginning_space_character_count] + current_line_string[line_beginning_space_character_count + numbers_of_heading_levels_to_decrease_by_section[section_index]:]
+            output_file.write(current_line_string)
+            previous_line_string = current_line_string
+        if section_index != None:
+            close_section()
+    
+    return 0
+
+def corpus_index_rows(input_filename, specified_encoding=None):
+    """Analyze a file for the corpus index, returning a dictionary holding a list of rows for each table in `corpus_index_row_tables`, without the file identifier of each row.
+    
+    The file is analyzed with `markup_analysis`, and then read in a single pass to collect the text of links and link labels. Column numbers indicate the position of the left bracket within the line, starting at 1, in the same way as `link_lint`. Text is decoded (see `decode_markup_text`), and normalized link labels are stored so that link labels are matched in the same way as within a single file. This function runs in worker processes when multiple files are indexed concurrently.
+    """
+    
+    encoding_information = determine_encoding_information(input_filename, specified_encoding)
+    document_markup_entire = markup_analysis(input_filename, encoding_information)
+    
+    def decoded(markup_text):
+        "Decode text from the file."
+        return decode_markup_text(markup_text, encoding_information)
+    
+    def normalized(link_label):
+        "Normalize and decode a link label from the file."
+        return decoded(normalize_link_label(link_label, encoding_information["encoding"], encoding_information["byte_transparent"]))
+    
+    corpus_index_rows_entire = { corpus_index_row_table: [] for corpus_index_row_table in corpus_index_row_tables }
+    
+    for current_line_number, heading_information in document_markup_entire["heading"]["line_numbers_containing_headings"].items():
+        corpus_index_rows_entire["headings"].append((current_line_number, heading_information["line_beginning_number_sign_count"], decoded(heading_information["heading_content"])))
+    for current_line_number in document_markup_entire["break"]["line_numbers_containing_hard_line_breaks"]:
+        corpus_index_rows_entire["hard_line_breaks"].append((current_line_number,))
+    
+    with open_input_file(input_filename, encoding_information) as opened_file:
+        # Assignment to hold the current line number
+        current_line_number = 0
+        for current_line_string in opened_file:
+            # Stripping newlines
+            current_line_string = current_line_string.rstrip('\n')
+            # Incrementing to keep track of the current line number
+            current_line_number += 1
+            if current_line_number in document_markup_entire["link"]["inline_link_lines"]:
+                for inline_link_indexes in document_markup_entire["link"]["inline_link_lines"][current_line_number]["inline_link_indexes"]:
+                    link_text = current_line_string[inline_link_indexes["left_bracket_index"] + 1:inline_link_indexes["right_bracket_index"]]
+                    link_destination = current_line_string[inline_link_indexes["left_parenthesis_index"] + 1:inline_link_indexes["right_parenthesis_index"]]
+                    corpus_index_rows_entire["inline_links"].append((current_line_number, inline_link_indexes["left_bracket_index"] + 1, decoded(link_text), decoded(link_destination)))
+            if current_line_number in document_markup_entire["link"]["link_reference_definition_lines"]:
+                link_reference_definition_indexes = document_markup_entire["link"]["link_reference_definition_lines"][current_line_number]["link_reference_definition_indexes"]
+                link_label = current_line_string[link_reference_definition_indexes["left_bracket_index"] + 1:link_reference_definition_indexes["right_bracket_index"]]
+                link_destination = current_line_string[link_reference_definition_indexes["uri_start_index"]:link_reference_definition_indexes["uri_end_index"] + 1]
+                corpus_index_rows_entire["link_reference_definitions"].append((current_line_number, link_reference_definition_indexes["left_bracket_index"] + 1, decoded(link_label), normalized(link_label), decoded(link_destination)))
+            if current_line_number in document_markup_entire["link"]["potential_footnote_link_label_lines"]:
+                for potential_footnote_link_label_indexes in document_markup_entire["link"]["potential_footnote_link_label_lines"][current_line_number]["potential_footnote_link_label_indexes"]:
+                    link_label = current_line_string[potential_footnote_link_label_indexes["left_bracket_index"] + 1:potential_footnote_link_label_indexes["right_bracket_index"]]
+                    corpus_index_rows_entire["footnote_link_labels"].append((current_line_number, potential_footnote_link_label_indexes["left_bracket_index"] + 1, decoded(link_label), normalized(link_label)))
+            if current_line_number in document_markup_entire["link"]["footnote_link_reference_definition_lines"]:
+                footnote_link_reference_definition_indexes = document_markup_entire["link"]["footnote_link_reference_definition_lines"][current_line_number]["footnote_link_reference_definition_indexes"]
+                link_label = current_line_string[footnote_link_reference_definition_indexes["left_bracket_index"] + 1:footnote_link_reference_definition_indexes["right_bracket_index"]]
+                corpus_index_rows_entire["footnote_link_reference_definitions"].append((current_line_number, footnote_link_reference_definition_indexes["left_bracket_index"] + 1, decoded(link_label), normalized(link_label)))
+    
+    return corpus_index_rows_entire
+
+def open_corpus_index_database(database_filename):
+    "Open a corpus index database, creating its tables and indexes if needed and rebuilding it if it was created with a different schema version, returning a `sqlite3` connection."
+    
+    import sqlite3
+    
+    connection = sqlite3.connect(database_filename)
+    # Enabling foreign keys so that deleting a file also deletes its rows in other tables
+    connection.execute("PRAGMA foreign_keys = ON")
+    if connection.execute("PRAGMA user_version").fetchone()[0] != corpus_index_schema_version:
+        with connection:
+            for corpus_index_table in corpus_index_row_tables + ("files",):
+                connection.execute("DROP TABLE IF EXISTS {}".format(corpus_index_table))
+            connection.execute("PRAGMA user_version = {}".format(corpus_index_schema_version))
+    connection.executescript(corpus_index_schema)
+    return connection
+
+def corpus_index_input():
+    """Get user input for the `index` command in the form of command line arguments, storing provided information in a dictionary.
+    
+    The `cli_ctrlflw` dictionary holds command-line-related information in the following way:
+    
+    ```yaml
+    directory_name: docs                   # an item with a string value indicating the directory containing the Markdown files to be indexed
+    database_filename: .intramark.sqlite   # an item with a string value indicating the filename of the corpus index database
+    encoding: null                         # an item with a string value indicating the encoding of the Markdown files, if specified
+    number_of_worker_processes: 1          # an item with a numerical value indicating the number of worker processes used to analyze files
+    ```
+    """
+    
+    def specify_arguments():
+        "Specify allowed command-line arguments using *argparse* module."
+        
+        import argparse
+        import textwrap
+        
+        parser = argparse.ArgumentParser(prog="intramark.py index", description="Store the analysis of every Markdown file in a directory in a corpus index database, for answering corpus-wide questions with *intramark.py query*. Only files that have changed since they were last indexed are analyzed again, and files that no longer exist are removed.", formatter_class=argparse.RawTextHelpFormatter)
+        parser.add_argument("directory", help="Directory containing the Markdown files to be indexed, including those in subdirectories.")
+        parser.add_argument("--database", help="Filename of the corpus index database. The default is *.intramark.sqlite* in the current directory.", default=".intramark.sqlite")
+        parser.add_argument("--encoding", help="Encoding of the Markdown files, which is otherwise determined from a byte order mark or assumed to be UTF-8.", default=None)
+        parser.add_argument("-j", "--jobs", help=textwrap.dedent("""\
+                                                Analyze files concurrently using multiple worker processes. Use either:
+                                                - a number of worker processes from 1 upward, or
+                                                - *max* for one worker process per processor core."""), default=None)
+        args = parser.parse_args(sys.argv[2:])
+        return args, parser
+    
+    args, parser = specify_arguments()
+    
+    def assess_arguments(args, parser):
+        "Determine if values provided by the user are valid, and assign values to control-variables."
+        
+        cli_ctrlflw = {} # dictionary to hold command-line-related, control-flow-affecting information
+        
+        if os.path.isdir(args.directory) == False:
+            print("\nInvalid input:".upper(),"*directory* must be an existing directory.\n")
+            parser.print_help()
+            exit()
+        cli_ctrlflw["directory_name"] = args.directory
+        cli_ctrlflw["database_filename"] = args.database
+        
+        cli_ctrlflw["encoding"] = None
+        if args.encoding != None:
+            try:
+                cli_ctrlflw["encoding"] = codecs.lookup(args.encoding).name
+            except LookupError:
+                print("\nInvalid input:".upper(),"*--encoding* must be the name of an encoding known to Python, such as *utf-8* or *cp1252*.\n")
+                parser.print_help()
+                exit()
+        
+        cli_ctrlflw["number_of_worker_processes"] = 1
+        if args.jobs == "max":
+            cli_ctrlflw["number_of_worker_processes"] = os.cpu_count() or 1
+        elif args.jobs != None:
+            if args.jobs.isdigit() and int(args.jobs) >= 1:
+                cli_ctrlflw["number_of_worker_processes"] = int(args.jobs)
+            else:
+                print("\nInvalid input:".upper(),"acceptable values for *-j/--jobs* are *max* or a number from *1* upward.\n")
+                parser.print_help()
+                exit()
+        
+        return cli_ctrlflw
+    
+    cli_ctrlflw = assess_arguments(args, parser)
+    
+    return cli_ctrlflw
+
+def corpus_index_command():
+    """Index every Markdown file in a directory as specified with command line input, displaying a summary as JSON and returning an exit status.
+    
+    Refreshing the corpus index is incremental. A file whose modification time and size match those stored in the corpus index is not read at all. Otherwise, the SHA-256 hash of its contents is compared with the stored hash, and only a file whose contents have changed is analyzed again, replacing its rows. Files within the directory that were indexed previously but no longer exist are removed. All changes are made in a single transaction.
+    """
+    
+    import json
+    
+    information_from_command_line_input = corpus_index_input()
+    markdown_filenames = find_markdown_files(information_from_command_line_input["directory_name"])
+    
+    connection = open_corpus_index_database(information_from_command_line_input["database_filename"])
+    # Assignment to hold the stored `(file_id, modification_time_ns, file_size, content_hash)` of each indexed file
+    indexed_files = { filename: (file_id, modification_time_ns, file_size, content_hash) for file_id, filename, modification_time_ns, file_size, content_hash in connection.execute("SELECT file_id, filename, modification_time_ns, file_size, content_hash FROM files") }
+    
+    # Assignment to hold a summary of the changes made to the corpus index
+    corpus_index_summary = {"analyzed_file_count": 0, "unchanged_file_count": 0, "removed_file_count": 0}
+    # Assignment to hold the `(filename, modification_time_ns, file_size, content_hash)` of each file to be analyzed
+    files_to_be_analyzed = []
+    
+    with connection:
+        for markdown_filename in markdown_filenames:
+            file_status = os.stat(markdown_filename)
+            if markdown_filename in indexed_files:
+                file_id, modification_time_ns, file_size, content_hash = indexed_files[markdown_filename]
+                if modification_time_ns == file_status.st_mtime_ns and file_size == file_status.st_size:
+                    corpus_index_summary["unchanged_file_count"] += 1
+                    continue
+                current_content_hash = determine_content_hash(markdown_filename)
+                if current_content_hash == content_hash:
+                    # Updating only the modification time and size of a file that was touched without its contents changing
+                    connection.execute("UPDATE files SET modification_time_ns = ?, file_size = ? WHERE file_id = ?", (file_status.st_mtime_ns, file_status.st_size, file_id))
+                    corpus_index_summary["unchanged_file_count"] += 1
+                    continue
+            else:
+                current_content_hash = determine_content_hash(markdown_filename)
+            files_to_be_analyzed.append((markdown_filename, file_status.st_mtime_ns, file_status.st_size, current_content_hash))
+        
+        # Analyzing files in worker processes if requested, while only this process writes to the corpus index database
+        analyzed_filenames = [ file_to_be_analyzed[0] for file_to_be_analyzed in files_to_be_analyzed ]
+        specified_encodings = [information_from_command_line_input["encoding"]] * len(files_to_be_analyzed)
+        executor = None
+        if information_from_command_line_input["number_of_worker_processes"] > 1 and len(files_to_be_analyzed) > 1:
+            import concurrent.futures
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=information_from_command_line_input["number_of_worker_processes"])
+            corpus_index_rows_of_files = executor.map(corpus_index_rows, analyzed_filenames, specified_encodings, chunksize=16)
+        else:
+            corpus_index_rows_of_files = map(corpus_index_rows, analyzed_filenames, specified_encodings)
+        
+        for (markdown_filename, modification_time_ns, file_size, content_hash), corpus_index_rows_entire in zip(files_to_be_analyzed, corpus_index_rows_of_files):
+            # Deleting the previous rows of the file, if any
+            connection.execute("DELETE FROM files WHERE filename = ?", (markdown_filename,))
+            file_id = connection.execute("INSERT INTO files (filename, modification_time_ns, file_size, content_hash) VALUES (?, ?, ?, ?)", (markdown_filename, modification_time_ns, file_size, content_hash)).lastrowid
+            for corpus_index_row_table in corpus_index_row_tables:
+                if bool(corpus_index_rows_entire[corpus_index_row_table]) == True:
+                    number_of_columns = len(corpus_index_rows_entire[corpus_index_row_table][0]) + 1
+                    connection.executemany("INSERT INTO {} VALUES ({})".format(corpus_index_row_table, ", ".join(["?"] * number_of_columns)), [ (file_id,) + corpus_index_row for corpus_index_row in corpus_index_rows_entire[corpus_index_row_table] ])
+            corpus_index_summary["analyzed_file_count"] += 1
+        if executor != None:
+            executor.shutdown()
+        
+        # Removing files within the directory that no longer exist
+        directory_prefix = os.path.join(os.path.abspath(information_from_command_line_input["directory_name"]), "")
+        markdown_filenames_found = set(markdown_filenames)
+        for indexed_filename in indexed_files:
+            if indexed_filename.startswith(directory_prefix) and indexed_filename not in markdown_filenames_found:
+                connection.execute("DELETE FROM files WHERE filename = ?", (indexed_filename,))
+                corpus_index_summary["removed_file_count"] += 1
+    
+    connection.close()
+    print(json.dumps(corpus_index_summary))
+    
+    return 0
+
+def corpus_query_input():
+    """Get user input for the `query` command in the form of command line arguments, storing provided information in a dictionary.
+    
+    The `cli_ctrlflw` dictionary holds command-line-related information in the following way:
+    
+    ```yaml
+    database_filename: .intramark.sqlite   # an item with a string value indicating the filename of the corpus index database
+    heading_level: 1                       # an item with a numerical value indicating the heading level of headings to be found, if specified
+    link_destination: null                 # an item with a string value indicating the link destination of links and link reference definitions to be found, if specified
+    link_label: null                       # an item with a string value indicating the link label of link reference definitions to be found, if specified
+    footnote: null                         # an item with a string value indicating the link label of footnotes and footnote definitions to be found, if specified
+    ```
+    """
+    
+    def specify_arguments():
+        "Specify allowed command-line arguments using *argparse* module."
+        
+        import argparse
+        
+        parser = argparse.ArgumentParser(prog="intramark.py query", description="Answer a corpus-wide question using a corpus index database created with *intramark.py index*, displaying each result as JSON Lines and exiting with status 1 if nothing is found.", formatter_class=argparse.RawTextHelpFormatter)
+        parser.add_argument("--database", help="Filename of the corpus index database. The default is *.intramark.sqlite* in the current directory.", default=".intramark.sqlite")
+        question_group = parser.add_mutually_exclusive_group(required=True)
+        question_group.add_argument("--heading-level", help="Find headings with a heading level from 1 to 6.", default=None)
+        question_group.add_argument("--link-destination", help="Find inline links and link reference definitions with a link destination.", default=None)
+        question_group.add_argument("--link-label", help="Find link reference definitions with a link label, matched in the same way as link labels within a file.", default=None)
+        question_group.add_argument("--footnote", help="Find footnotes and footnote definitions with a link label, such as *^1*.", default=None)
+        args = parser.parse_args(sys.argv[2:])
+        return args, parser
+    
+    args, parser = specify_arguments()
+    
+    def assess_arguments(args, parser):
+        "Determine if values provided by the user are valid, and assign values to control-variables."
+        
+        cli_ctrlflw = {} # dictionary to hold command-line-related, control-flow-affecting information
+        
+        if os.path.isfile(args.database) == False:
+            print("\nInvalid input:".upper(),"the corpus index database does not exist. Create it with *intramark.py index*.\n")
+            parser.print_help()
+            exit()
+        cli_ctrlflw["database_filename"] = args.database
+        
+        cli_ctrlflw["heading_level"] = None
+        if args.heading_level != None:
+            if args.heading_level.isdigit() and int(args.heading_level) >= 1 and int(args.heading_level) <= 6:
+                cli_ctrlflw["heading_level"] = int(args.heading_level)
+            else:
+                print("\nInvalid input:".upper(),"acceptable values for *--heading-level* are *1-6*.\n")
+                parser.print_help()
+                exit()
+        cli_ctrlflw["link_destination"] = args.link_destination
+        cli_ctrlflw["link_label"] = args.link_label
+        cli_ctrlflw["footnote"] = args.footnote
+        
+        return cli_ctrlflw
+    
+    cli_ctrlflw = assess_arguments(args, parser)
+    
+    return cli_ctrlflw
+
+def corpus_query_command():
+    """Answer a corpus-wide question as specified with command line input, displaying each result as JSON Lines ordered by filename and position, and returning an exit status of 1 if nothing is found.
+    
+    Every question is answered using the indexes of the corpus index database, without reading any Markdown file. Link labels are normalized (see `normalize_link_label`) before they are looked up.
+    """
+    
+    import json
+    
+    information_from_command_line_input = corpus_query_input()
+    connection = open_corpus_index_database(information_from_command_line_input["database_filename"])
+    
+    def query_results(query, parameters):
+        "Run a query, returning a list of dictionaries keyed by column name."
+        query_cursor = connection.execute(query, parameters)
+        column_names = [ column_description[0] for column_description in query_cursor.description ]
+        return [ dict(zip(column_names, query_row)) for query_row in query_cursor ]
+    
+    results = []
+    if information_from_command_line_input["heading_level"] != None:
+        results = query_results("SELECT filename, line_number, heading_level, heading_content FROM headings JOIN files USING (file_id) WHERE heading_level = ?", (information_from_command_line_input["heading_level"],))
+    elif information_from_command_line_input["link_destination"] != None:
+        results = query_results("SELECT filename, line_number, column_number, 'inline_link' AS kind, link_text, link_destination FROM inline_links JOIN files USING (file_id) WHERE link_destination = ?", (information_from_command_line_input["link_destination"],))
+        results += query_results("SELECT filename, line_number, column_number, 'link_reference_definition' AS kind, link_label, link_destination FROM link_reference_definitions JOIN files USING (file_id) WHERE link_destination = ?", (information_from_command_line_input["link_destination"],))
+    elif information_from_command_line_input["link_label"] != None:
+        normalized_link_label = normalize_link_label(information_from_command_line_input["link_label"], "utf-8", False)
+        results = query_results("SELECT filename, line_number, column_number, link_label, link_destination FROM link_reference_definitions JOIN files USING (file_id) WHERE normalized_link_label = ?", (normalized_link_label,))
+    elif information_from_command_line_input["footnote"] != None:
+        normalized_link_label = normalize_link_label(information_from_command_line_input["footnote"], "utf-8", False)
+        results = query_results("SELECT filename, line_number, column_number, 'footnote' AS kind, link_label FROM footnote_link_labels JOIN files USING (file_id) WHERE normalized_link_label = ?", (normalized_link_label,))
+        results += query_results("SELECT filename, line_number, column_number, 'footnote_definition' AS kind, link_label FROM footnote_link_reference_definitions JOIN files USING (file_id) WHERE normalized_link_label = ?", (normalized_link_label,))
+    connection.close()
+    
+    results.sort(key=lambda result: (result["filename"], result["line_number"], result.get("column_number", 0)))
+    for result in results:
+        print(json.dumps(result))
+    
+    exit_status = 0
+    if bool(results) == False:
+        exit_status = 1
+    return exit_status
+
+# Assignments to hold the inotify event flags used when watching directories (see `man 7 inotify`)
+inotify_event_flags = {"IN_CLOSE_WRITE": 0x8, "IN_MOVED_FROM": 0x40, "IN_MOVED_TO": 0x80, "IN_CREATE": 0x100, "IN_DELETE": 0x200, "IN_DELETE_SELF": 0x400, "IN_Q_OVERFLOW": 0x4000, "IN_IGNORED": 0x8000, "IN_ISDIR": 0x40000000}
+inotify_watch_mask = inotify_event_flags["IN_CLOSE_WRITE"] | inotify_event_flags["IN_MOVED_FROM"] | inotify_event_flags["IN_MOVED_TO"] | inotify_event_flags["IN_CREATE"] | inotify_event_flags["IN_DELETE"] | inotify_event_flags["IN_DELETE_SELF"]
+
+def create_inotify_watcher(directory_names):
+    """Watch directories and their subdirectories for changes with inotify, returning a dictionary in the following way, or `None` if inotify is unavailable, such as on systems other than Linux:
+    
+    ```yaml
+    libc: <ctypes.CDLL>                          # an item with the C library, through which inotify is used since the standard library has no binding for it
+    file_descriptor: 3                           # an item with a numerical value indicating the inotify file descriptor
+    directory_names_by_watch_descriptor:         # a key containing the directory watched by each watch descriptor
+      1: /home/user/docs
+    ```
+    """
+    
+    import ctypes
+    import ctypes.util
+    
+    if sys.platform.startswith("linux") == False:
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        file_descriptor = libc.inotify_init1(os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if file_descriptor < 0:
+        return None
+    
+    inotify_watcher = {"libc": libc, "file_descriptor": file_descriptor, "directory_names_by_watch_descriptor": {}}
+    for directory_name in directory_names:
+        add_inotify_watches(inotify_watcher, directory_name)
+    return inotify_watcher
+
+def add_inotify_watches(inotify_watcher, directory_name):
+    "Add an inotify watch for a directory and each of its subdirectories, since inotify does not watch subdirectories on its own."
+    
+    for current_directory_name, subdirectory_names, filenames in os.walk(os.path.abspath(directory_name)):
+        watch_descriptor = inotify_watcher["libc"].inotify_add_watch(inotify_watcher["file_descriptor"], os.fsencode(current_directory_name), inotify_watch_mask)
+        if watch_descriptor >= 0:
+            inotify_watcher["directory_names_by_watch_descriptor"][watch_descriptor] = current_directory_name
+
+def read_inotify_events(inotify_watcher, timeout):
+    """Wait up to a number of seconds for inotify events, returning a set of the filenames that may have changed, and whether every file must be checked again because events were lost.
+    
+    New subdirectories are watched as they appear, and every file within them is treated as changed, since files may have been created in them before they were watched.
+    """
+    
+    import select
+    import struct
+    
+    changed_filenames = set()
+    events_were_lost = False
+    readable_file_descriptors = select.select([inotify_watcher["file_descriptor"]], [], [], timeout)[0]
+    if bool(readable_file_descriptors) == False:
+        return changed_filenames, events_were_lost
+    
+    inotify_events = os.read(inotify_watcher["file_descriptor"], 65536)
+    # Assignment to hold the position of the current event, each of which is a `struct inotify_event` followed by a null-padded filename
+    event_position = 0
+    while event_position < len(inotify_events):
+        watch_descriptor, event_mask, event_cookie, filename_length = struct.unpack_from("iIII", inotify_events, event_position)
+        event_position += struct.calcsize("iIII")
+        filename = os.fsdecode(inotify_events[event_position:event_position + filename_length].rstrip(b"\0"))
+        event_position += filename_length
+        if event_mask & inotify_event_flags["IN_Q_OVERFLOW"]:
+            events_were_lost = True
+            continue
+        if event_mask & inotify_event_flags["IN_IGNORED"]:
+            inotify_watcher["directory_names_by_watch_descriptor"].pop(watch_descriptor, None)
+            continue
+        if watch_descriptor not in inotify_watcher["directory_names_by_watch_descriptor"] or filename == "":
+            continue
+        changed_filename = os.path.join(inotify_watcher["directory_names_by_watch_descriptor"][watch_descriptor], filename)
+        if event_mask & inotify_event_flags["IN_ISDIR"]:
+            if event_mask & (inotify_event_flags["IN_CREATE"] | inotify_event_flags["IN_MOVED_TO"]):
+                add_inotify_watches(inotify_watcher, changed_filename)
+                changed_filenames.update(find_markdown_files(changed_filename))
+            elif event_mask & inotify_event_flags["IN_MOVED_FROM"]:
+                # Checking every file again, since the files within a directory moved away are no longer where they were
+                events_were_lost = True
+        else:
+            changed_filenames.add(changed_filename)
+    return changed_filenames, events_were_lost
+
+def determine_markdown_file_statuses(directory_names):
+    "Determine the modification time and size of every Markdown file within directories, returning a dictionary mapping each filename to a `(modification_time_ns, file_size)` tuple. This is used to find changed files when inotify is unavailable."
+    
+    markdown_file_statuses = {}
+    for directory_name in directory_names:
+        for markdown_filename in find_markdown_files(directory_name):
+            try:
+                file_status = os.stat(markdown_filename)
+            except OSError:
+                continue
+            markdown_file_statuses[markdown_filename] = (file_status.st_mtime_ns, file_status.st_size)
+    return markdown_file_statuses
+
+def watch_command():
+    """Watch directories as specified with command line input, applying the specified modifications to each Markdown file within them in place whenever it changes, displaying each processed file as JSON Lines, and returning an exit status when interrupted.
+    
+    Changes are found with inotify where it is available, and otherwise by checking the modification time and size of every Markdown file at the polling interval. Changes are collected until none have been found for the debounce interval, so that a burst of saves, such as those made by an editor writing a file in several steps, is processed once. A file is only analyzed and modified if the SHA-256 hash of its contents differs from the hash recorded when it was last processed, which also keeps the changes written by this command from being processed again.
+    """
+    
+    import json
+    import time
+    
+    information_from_command_line_input = initial_input(sys.argv[2:])
+    directory_names = information_from_command_line_input["input_directory_names"]
+    
+    # Checking if the watch command is given what it needs, since it uses the same command line arguments as the rest of the program
+    markdown_filenames_in_directories = set()
+    for directory_name in directory_names:
+        markdown_filenames_in_directories.update(find_markdown_files(directory_name))
+    if bool(directory_names) == False or set(information_from_command_line_input["input_filenames"]).issubset(markdown_filenames_in_directories) == False:
+        print("\nInvalid input:".upper(), "*intramark.py watch* is only used with directories.\n")
+        exit()
+    if information_from_command_line_input["modification_to_be_made"] == False and information_from_command_line_input["lint_links"] == False:
+        print("\nInvalid input:".upper(), "*intramark.py watch* is used with at least one modification argument or *--lint links*.\n")
+        exit()
+    if information_from_command_line_input["output_filename"] != None:
+        print("\nInvalid input:".upper(), "*intramark.py watch* modifies files in place, so *-o* cannot be used.\n")
+        exit()
+    
+    # Loading shared link reference definitions once for all files
+    shared_link_reference_definitions = None
+    if bool(information_from_command_line_input["definitions_filenames"]) == True:
+        shared_link_reference_definitions = load_shared_link_reference_definitions(information_from_command_line_input["definitions_filenames"], information_from_command_line_input["encoding"])
+    
+    # Assignment to hold the SHA-256 hash of the contents of each file when it was last processed
+    content_hashes = {}
+    
+    def process_changed_file(markdown_filename):
+        "Process a file in place if its contents have changed since it was last processed, displaying the result as JSON."
+        
+        if os.path.isfile(markdown_filename) == False:
+            content_hashes.pop(markdown_filename, None)
+            return
+        try:
+            content_hash = determine_content_hash(markdown_filename)
+            if content_hashes.get(markdown_filename) == content_hash:
+                return
+            exit_status = process_document(markdown_filename, information_from_command_line_input, markdown_filename, None, shared_link_reference_definitions)
+            content_hashes[markdown_filename] = determine_content_hash(markdown_filename)
+        except (OSError, UnicodeError, ValueError, ResourceLimitError) as error:
+            print(json.dumps({"input_filename": markdown_filename, "error": str(error)}), flush=True)
+            return
+        print(json.dumps({"input_filename": markdown_filename, "rewritten": content_hashes[markdown_filename] != content_hash, "exit_status": exit_status}), flush=True)
+    
+    def process_changed_files(markdown_filenames):
+        "Process each Markdown file among changed files, in order."
+        for markdown_filename in sorted(markdown_filenames):
+            uncompressed_filename = markdown_filename
+            if determine_compression_module(markdown_filename) != None:
+                uncompressed_filename = os.path.splitext(markdown_filename)[0]
+            if uncompressed_filename.lower().endswith(markdown_filename_extensions):
+                process_changed_file(markdown_filename)
+    
+    inotify_watcher = create_inotify_watcher(directory_names)
+    markdown_file_statuses = determine_markdown_file_statuses(directory_names)
+    process_changed_files(information_from_command_line_input["input_filenames"])
+    
+    # Assignments to hold the files changed since they were last processed, and the time the latest change was found
+    changed_filenames = set()
+    latest_change_time = None
+    try:
+        while True:
+            if inotify_watcher != None:
+                new_changed_filenames, events_were_lost = read_inotify_events(inotify_watcher, information_from_command_line_input["polling_interval"] if latest_change_time == None else information_from_command_line_input["debounce_interval"])
+                if events_were_lost == True:
+                    for directory_name in directory_names:
+                        new_changed_filenames.update(find_markdown_files(directory_name))
+            else:
+                time.sleep(information_from_command_line_input["polling_interval"] if latest_change_time == None else min(information_from_command_line_input["polling_interval"], information_from_command_line_input["debounce_interval"]))
+                current_markdown_file_statuses = determine_markdown_file_statuses(directory_names)
+                new_changed_filenames = { markdown_filename for markdown_filename in current_markdown_file_statuses.keys() | markdown_file_statuses.keys() if current_markdown_file_statuses.get(markdown_filename) != markdown_file_statuses.get(markdown_filename) }
+                markdown_file_statuses = current_markdown_file_statuses
+            
+            if bool(new_changed_filenames) == True:
+                changed_filenames.update(new_changed_filenames)
+                latest_change_time = time.monotonic()
+            elif latest_change_time != None and time.monotonic() - latest_change_time >= information_from_command_line_input["debounce_interval"]:
+                process_changed_files(changed_filenames)
+                changed_filenames = set()
+                latest_change_time = None
+    except KeyboardInterrupt:
+        pass
+    
+    if inotify_watcher != None:
+        os.close(inotify_watcher["file_descriptor"])
+    return 0
+
+def concat_input():
+    """Get user input for the `concat` command in the form of command line arguments, storing provided information in a dictionary.
+    
+    The `cli_ctrlflw` dictionary holds command-line-related information in the following way:
+    
+    ```yaml
+    input_filenames: [ch1.md, ch2.md]      # an item with a list value indicating the input files to be concatenated, in order, with directories replaced by the Markdown files within them
+    output_filename: book.md               # an item with a string value indicating the output file, or null to display the concatenated document
+    number_of_heading_levels_to_shift: 1   # an item with a numerical value indicating the number of heading levels to increase every input file by, which is negative to decrease them
+    numbers_of_heading_levels_to_shift_by_input_filename: {}   # an item with a dictionary value mapping the absolute filename of an input file to the number of heading levels to shift it by, in addition to the number for every input file
+    make_all_links_inline_style: false     # an item with a boolean value indicating if all reference-style links should be made inline-style
+    encoding: null                         # an item with a string value indicating the encoding of the input files, if specified
+    ```
+    """
+    
+    def specify_arguments():
+        "Specify allowed command-line arguments using *argparse* module."
+        
+        import argparse
+        import textwrap
+        
+        parser = argparse.ArgumentParser(prog="intramark.py concat", description="Concatenate Markdown files into a single document in one pass, shifting the heading levels of each file, and renaming the link labels of link reference definitions that collide with those of an earlier file.", formatter_class=argparse.RawTextHelpFormatter)
+        parser.add_argument("input_filenames", nargs="+", help="Input files to be concatenated, in order. A directory is replaced by the Markdown files within it and its subdirectories, in sorted order.")
+        parser.add_argument("-o", "--output", help="Output file, which is compressed with gzip, bzip2, or xz as determined by filename extension. The concatenated document is otherwise displayed.", default=None)
+        parser.add_argument("--shift", help="Number of heading levels to increase every input file by, such as *1*, or to decrease every input file by, such as *-1*. As with *+H* and *-H*, the heading levels of a file are shifted by as much as possible without going beyond level 1 or level 6.", default="0")
+        parser.add_argument("--shift-for", nargs=2, action="append", metavar=("FILE", "N"), help="Number of heading levels to shift a single input file by, in addition to *--shift*. Can be given more than once.", default=[])
+        parser.add_argument("-k", help=textwrap.dedent("""\
+                                                Convert links. Use:
+                                                - *i* to make all reference-style links inline-style, resolving link labels with link reference definitions in the same input file or, failing that, in any input file."""), default=None)
+        parser.add_argument("--encoding", help="Encoding of the input files, which is otherwise determined from a byte order mark or assumed to be UTF-8.", default=None)
+        args = parser.parse_args(sys.argv[2:])
+        return args, parser
+    
+    args, parser = specify_arguments()
+    
+    def assess_arguments(args, parser):
+        "Determine if values provided by the user are valid, and assign values to control-variables."
+        
+        cli_ctrlflw = {} # dictionary to hold command-line-related, control-flow-affecting information
+        
+        cli_ctrlflw["input_filenames"] = []
+        for input_filename in args.input_filenames:
+            if os.path.isdir(input_filename) == True:
+                cli_ctrlflw["input_filenames"].extend(find_markdown_files(input_filename))
+            elif os.path.isfile(input_filename) == True and determine_archive_format(input_filename) == None:
+                cli_ctrlflw["input_filenames"].append(input_filename)
+            else:
+                print("\nInvalid input:".upper(),"*{}* must be an existing Markdown file or directory.\n".format(input_filename))
+                parser.print_help()
+                exit()
+        if bool(cli_ctrlflw["input_filenames"]) == False:
+            print("\nInvalid input:".upper(),"no Markdown files were found to be concatenated.\n")
+            parser.print_help()
+            exit()
+        
+        cli_ctrlflw["output_filename"] = args.output
+        # Checking if the output file is an input file, which would be overwritten while it is still to be read
+        if args.output != None and os.path.abspath(args.output) in [ os.path.abspath(input_filename) for input_filename in cli_ctrlflw["input_filenames"] ]:
+            print("\nInvalid input:".upper(),"*-o/--output* cannot be one of the input files.\n")
+            parser.print_help()
+            exit()
+        
+        if re.fullmatch(r"[+-]?[0-9]+", args.shift) == None:
+            print("\nInvalid input:".upper(),"*--shift* must be a whole number, such as *1* or *-1*.\n")
+            parser.print_help()
+            exit()
+        cli_ctrlflw["number_of_heading_levels_to_shift"] = int(args.shift)
+        
+        cli_ctrlflw["numbers_of_heading_levels_to_shift_by_input_filename"] = {}
+        absolute_input_filenames = set( os.path.abspath(input_filename) for input_filename in cli_ctrlflw["input_filenames"] )
+        for shifted_input_filename, number_of_heading_levels_to_shift in args.shift_for:
+            if os.path.abspath(shifted_input_filename) not in absolute_input_filenames or re.fullmatch(r"[+-]?[0-9]+", number_of_heading_levels_to_shift) == None:
+                print("\nInvalid input:".upper(),"*--shift-for* must be given one of the input files and a whole number, such as *ch1.md 1*.\n")
+                parser.print_help()
+                exit()
+            cli_ctrlflw["numbers_of_heading_levels_to_shift_by_input_filename"][os.path.abspath(shifted_input_filename)] = int(number_of_heading_levels_to_shift)
+        
+        cli_ctrlflw["make_all_links_inline_style"] = False
+        if args.k == "i":
+            cli_ctrlflw["make_all_links_inline_style"] = True
+        elif args.k != None:
+            print("\nInvalid input:".upper(),"the only acceptable value for *-k* is *i*.\n")
+            parser.print_help()
+            exit()
+        
+        cli_ctrlflw["encoding"] = None
+        if args.encoding != None:
+            try:
+                cli_ctrlflw["encoding"] = codecs.lookup(args.encoding).name
+            except LookupError:
+                print("\nInvalid input:".upper(),"*--encoding* must be the name of an encoding known to Python, such as *utf-8* or *cp1252*.\n")
+                parser.print_help()
+                exit()
+        
+        return cli_ctrlflw
+    
+    cli_ctrlflw = assess_arguments(args, parser)
+    
+    return cli_ctrlflw
+
+def concat_command():
+    """Concatenate Markdown files as specified with command line input, writing or displaying the concatenated document, and returning an exit status.
+    
+    The input files are read in order and each line is written to a single output file as it is read, so that neither the concatenated document nor any intermediate file is held on disk or in memory. A blank line is written between input files, unless one is already there. The output file uses the encoding and byte order mark of the first input file, and the lines of an input file with a different encoding are converted.
+    
+    The heading levels of each input file are shifted by the number given with *--shift* plus any number given for that file with *--shift-for*, by as much as possible without going beyond level 1 or level 6, as with *+H* and *-H*.
+    
+    A global label index maps each normalized link label defined so far to its link destination. A link reference definition whose link label is already in the global label index with a different link destination is renamed, by appending the number of its input file to its normalized link label, and each reference-style link in the same input file using the link label is changed to use the new link label. Shortcut and collapsed reference links become full reference links, so that their link text is unchanged. With *-k i*, reference-style links are made inline-style instead, resolving link labels with link reference definitions in the same input file or, failing that, in any input file, and the results for each input file are held in a temporary file until they are written.
+    """
+    
+    information_from_command_line_input = concat_input()
+    input_filenames = information_from_command_line_input["input_filenames"]
+    
+    # Assignments to hold the command line information given to `markup_modification` for making reference-style links inline-style, along with the link reference definitions of every input file, if reference-style links should be made inline-style
+    link_modification_information = None
+    shared_link_reference_definitions = None
+    if information_from_command_line_input["make_all_links_inline_style"] == True:
+        import tempfile
+        link_modification_information = initial_input(["-k", "i", input_filenames[0]])
+        shared_link_reference_definitions = load_shared_link_reference_definitions(input_filenames, information_from_command_line_input["encoding"])
+    
+    # Assignment to hold the global label index, mapping each normalized link label defined so far to its link destination, both stored as Unicode strings (see `load_shared_link_reference_definitions`)
+    link_destinations_by_normalized_link_label = {}
+    
+    # Assignments to hold the output files, which use the encoding of the first input file, and the last line written
+    output_encoding_information = determine_encoding_information(input_filenames[0], information_from_command_line_input["encoding"])
+    if information_from_command_line_input["output_filename"] != None:
+        output_binary_file = open_binary_output_file(information_from_command_line_input["output_filename"])
+    else:
+        sys.stdout.flush()
+        output_binary_file = sys.stdout.buffer
+    output_file = open_output_file(output_binary_file, output_encoding_information)
+    previous_line_string = None
+    
+    for input_file_number, input_filename in enumerate(input_filenames, 1):
+        encoding_information = determine_encoding_information(input_filename, information_from_command_line_input["encoding"])
+        document_markup_entire = markup_analysis(input_filename, encoding_information, keep_normalized_link_labels=True)
+        line_numbers_containing_headings = document_markup_entire["heading"]["line_numbers_containing_headings"]
+        link_reference_definition_lines = document_markup_entire["link"]["link_reference_definition_lines"]
+        
+        # Determining the number of heading levels to shift the input file by, limited so that no heading goes beyond level 1 or level 6
+        number_of_heading_levels_to_shift = information_from_command_line_input["number_of_heading_levels_to_shift"] + information_from_command_line_input["numbers_of_heading_levels_to_shift_by_input_filename"].get(os.path.abspath(input_filename), 0)
+        if document_markup_entire["heading"]["at_least_one_heading_exists"] == False:
+            number_of_heading_levels_to_shift = 0
+        elif number_of_heading_levels_to_shift > 0:
+            number_of_heading_levels_to_shift = min(number_of_heading_levels_to_shift, 6 - document_markup_entire["heading"]["highest_heading_number"])
+        elif number_of_heading_levels_to_shift < 0:
+            number_of_heading_levels_to_shift = max(number_of_heading_levels_to_shift, 1 - document_markup_entire["heading"]["lowest_heading_number"])
+        
+        # Assignment to hold the positions of the link labels to rename on each line, as `(left_bracket_index, right_bracket_index, new_link_label)`
+        renamed_link_label_positions_by_line = defaultdict(list)
+        
+        if link_modification_information != None:
+            # Making reference-style links inline-style and shifting heading levels with `markup_modification`, reading its results in place of the input file
+            input_file_modification_information = dict(link_modification_information)
+            input_file_modification_information["modification_to_be_made_to_heading"] = number_of_heading_levels_to_shift != 0
+            input_file_modification_information["increase_overall_heading_level_numerically"] = number_of_heading_levels_to_shift > 0
+            input_file_modification_information["number_of_heading_levels_to_increase_numerically"] = max(number_of_heading_levels_to_shift, 0)
+            input_file_modification_information["decrease_overall_heading_level_numerically"] = number_of_heading_levels_to_shift < 0
+            input_file_modification_information["number_of_heading_levels_to_decrease_numerically"] = max(-number_of_heading_levels_to_shift, 0)
+            number_of_heading_levels_to_shift = 0
+            opened_file = tempfile.TemporaryFile('w+', encoding=encoding_information["processing_encoding"])
+            markup_modification(input_filename, opened_file, input_file_modification_information, document_markup_entire, encoding_information, shared_link_reference_definitions)
+            opened_file.seek(0)
+        else:
+            # Determining the link reference definitions to rename, which have link labels already in the global label index with different link destinations. CommonMark gives precedence to the first of multiple link reference definitions with matching link labels.
+            link_destinations_defined_in_input_file = {}
+            for link_reference_definition_line in sorted(link_reference_definition_lines):
+                link_reference_definition_indexes = link_reference_definition_lines[link_reference_definition_line]["link_reference_definition_indexes"]
+                link_destinations_defined_in_input_file.setdefault(convert_shared_link_reference_definition_text(link_reference_definition_indexes["normalized_link_label"], encoding_information, True), convert_shared_link_reference_definition_text(link_reference_definition_indexes["uri"], encoding_information, True))
+            new_link_labels_by_normalized_link_label = {}
+            for shared_normalized_link_label, link_destination in link_destinations_defined_in_input_file.items():
+                if link_destinations_by_normalized_link_label.get(shared_normalized_link_label, link_destination) != link_destination:
+                    # Generating a new link label that matches no link label in the global label index or in the input file
+                    new_link_label = "{}-{}".format(shared_normalized_link_label, input_file_number)
+                    duplicate_number = 1
+                    while new_link_label in link_destinations_by_normalized_link_label or new_link_label in link_destinations_defined_in_input_file:
+                        duplicate_number += 1
+                        new_link_label = "{}-{}-{}".format(shared_normalized_link_label, input_file_number, duplicate_number)
+                    new_link_labels_by_normalized_link_label[convert_shared_link_reference_definition_text(shared_normalized_link_label, encoding_information, False)] = convert_shared_link_reference_definition_text(new_link_label, encoding_information, False)
+                    shared_normalized_link_label = new_link_label
+                link_destinations_by_normalized_link_label.setdefault(shared_normalized_link_label, link_destination)
+            # Determining the positions of the link labels to rename, in link reference definitions and in reference-style links
+            if bool(new_link_labels_by_normalized_link_label) == True:
+                for link_reference_definition_line in link_reference_definition_lines:
+                    link_reference_definition_indexes = link_reference_definition_lines[link_reference_definition_line]["link_reference_definition_indexes"]
+                    if link_reference_definition_indexes["normalized_link_label"] in new_link_labels_by_normalized_link_label:
+                        renamed_link_label_positions_by_line[link_reference_definition_line].append((link_reference_definition_indexes["left_bracket_index"], link_reference_definition_indexes["right_bracket_index"], new_link_labels_by_normalized_link_label[link_reference_definition_indexes["normalized_link_label"]]))
+                for potential_link_label_line in document_markup_entire["link"]["potential_link_label_lines"]:
+                    for potential_link_label_indexes in document_markup_entire["link"]["potential_link_label_lines"][potential_link_label_line]["potential_link_label_indexes"]:
+                        if potential_link_label_indexes["normalized_potential_link_label"] in new_link_labels_by_normalized_link_label:
+                            renamed_link_label_positions_by_line[potential_link_label_line].append((potential_link_label_indexes["left_bracket_index"], potential_link_label_indexes["right_bracket_index"], new_link_labels_by_normalized_link_label[potential_link_label_indexes["normalized_potential_link_label"]]))
+            opened_file = open_input_file(input_filename, encoding_information)
+        
+        # Determining if the lines of the input file are converted to the encoding of the output file
+        convert_line_strings = (encoding_information["encoding"], encoding_information["processing_encoding"]) != (output_encoding_information["encoding"], output_encoding_information["processing_encoding"])
+        
+        with opened_file:
+            for current_line_number, current_line_string in enumerate(opened_file, 1):
+                # Renaming link labels from the end of the line backward, so that earlier positions are unaffected
+                if current_line_number in renamed_link_label_positions_by_line:
+                    for left_bracket_index, right_bracket_index, new_link_label in sorted(renamed_link_label_positions_by_line[current_line_number], reverse=True):
+                        # Determining if the link label is that of a link reference definition or of a full reference link, which is replaced, that of a collapsed reference link, whose `[]` is filled in, or that of a shortcut reference link, which is followed by the new link label. A link label followed by another link label is link text, which is left unchanged.
+                        if current_line_number in link_reference_definition_lines or current_line_string[left_bracket_index - 1:left_bracket_index] == "]":
+                            current_line_string = current_line_string[:left_bracket_index + 1] + new_link_label + current_line_string[right_bracket_index:]
+                        elif current_line_string[right_bracket_index + 1:right_bracket_index + 3] == "[]":
+                            current_line_string = current_line_string[:right_bracket_index + 2] + new_link_label + current_line_string[right_bracket_index + 2:]
+                        elif current_line_string[right_bracket_index + 1:right_bracket_index + 2] != "[":
+                            current_line_string = current_line_string[:right_bracket_index + 1] + "[" + new_link_label + "]" + current_line_string[right_bracket_index + 1:]
+                # Shifting the heading level of a heading by inserting or removing number signs after any leading space characters
+                if number_of_heading_levels_to_shift != 0 and current_line_number in line_numbers_containing_headings:
+                    line_beginning_space_character_count = line_numbers_containing_headings[current_line_number].get("line_beginning_space_character_count", 0)
+                    if number_of_heading_levels_to_shift > 0:
+                        current_line_string = current_line_string[:line_beginning_space_character_count] + "#" * number_of_heading_levels_to_shift + current_line_string[line_beginning_space_character_count:]
+                    else:
+                        current_line_string = current_line_string[:line_beginning_space_character_count] + current_line_string[line_beginning_space_character_count - number_of_heading_levels_to_shift:]
+                if convert_line_strings == True:
+                    current_line_string = convert_shared_link_reference_definition_text(convert_shared_link_reference_definition_text(current_line_string, encoding_information, True), output_encoding_information, False)
+                # Separating the input file from the one before it with a blank line
+                if current_line_number == 1 and previous_line_string != None:
+                    if previous_line_string.endswith("\n") == False:
+                        output_file.write("\n")
+                    if previous_line_string.strip(" \t\n") != "":
+                        output_file.write("\n")
+                output_file.write(current_line_string)
+                previous_line_string = current_line_string
+    
+    output_file.flush()
+    # Detaching so that standard output is not closed along with the wrapper
+    output_file.detach()
+    if output_binary_file is not sys.stdout.buffer:
+        output_binary_file.close()
+    
+    return 0
+
+# Assignment to hold the function for each command that can be given in place of an input filename
+command_functions = {"index": corpus_index_command, "query": corpus_query_command, "watch": watch_command, "concat": concat_command}
+
+def process_input_file(input_filename, information_from_command_line_input, shared_link_reference_definitions=None):
+    """Process a single input file as specified with command line input, either as a document or, for tar and zip archives, member by member, returning an exit status.
+    
+    An input file that exceeds a resource limit (see `create_resource_limits`) is skipped with a message, returning an exit status of 2, so that the remaining input files are still processed.
+    """
+    
+    try:
+        if information_from_command_line_input["split_heading_level"] != None:
+            exit_status = split_document(input_filename, information_from_command_line_input)
+        elif determine_archive_format(input_filename) != None:
+            if information_from_command_line_input["write_in_place"] == True:
+                import shutil
+                import tempfile
+                # Writing the new archive alongside the input archive before replacing it, since the input archive is read while the new archive is written
+                temporary_file_descriptor, temporary_output_filename = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(input_filename)), suffix=os.path.basename(input_filename))
+                os.close(temporary_file_descriptor)
+                try:
+                    exit_status = process_archive(input_filename, information_from_command_line_input, temporary_output_filename, shared_link_reference_definitions)
+                    shutil.copymode(input_filename, temporary_output_filename)
+                    os.replace(temporary_output_filename, input_filename)
+                except BaseException:
+                    os.remove(temporary_output_filename)
+                    raise
+            elif information_from_command_line_input["output_filename"] != None:
+                try:
+                    exit_status = process_archive(input_filename, information_from_command_line_input, information_from_command_line_input["output_filename"], shared_link_reference_definitions)
+                except BaseException:
+                    # Removing the incomplete output archive
+                    os.remove(information_from_command_line_input["output_filename"])
+                    raise
+            else:
+                exit_status = process_archive(input_filename, information_from_command_line_input, None, shared_link_reference_definitions)
+        else:
+            output_destination = information_from_command_line_input["output_filename"]
+            if information_from_command_line_input["write_in_place"] == True:
+                output_destination = input_filename
+            exit_status = process_document(input_filename, information_from_command_line_input, output_destination, None, shared_link_reference_definitions)
+    except ResourceLimitError as error:
+        print("\nResource limit exceeded:".upper(), "*{}* was skipped because {}.\n".format(input_filename, error), file=sys.stderr)
+        exit_status = 2
+    
+    return exit_status
+
+# Assignment to hold information given to each worker process when input files are processed concurrently, which is assigned once per worker process by `initialize_input_file_worker`
+input_file_worker_information = {}
+
+def initialize_input_file_worker(information_from_command_line_input, shared_link_reference_definitions):
+    """Prepare a worker process for processing input files concurrently.
+    
+    Information from command line input and shared link reference definitions are received once per worker process, instead of once per input file, and are only read afterward. Each input file is analyzed in a single pass within its worker process.
+    """
+    
+    input_file_worker_information["information_from_command_line_input"] = dict(information_from_command_line_input, number_of_worker_processes=1)
+    input_file_worker_information["shared_link_reference_definitions"] = shared_link_reference_definitions
+
+def process_input_file_in_worker(input_filename):
+    "Process a single input file in a worker process with `process_input_file`, returning the exit status along with everything displayed on standard output and standard error, so that output is displayed in the order of the input files."
+    
+    import contextlib
+    
+    standard_output_file = io.TextIOWrapper(io.BytesIO(), encoding="utf-8", write_through=True)
+    standard_error_file = io.StringIO()
+    with contextlib.redirect_stdout(standard_output_file), contextlib.redirect_stderr(standard_error_file):
+        exit_status = process_input_file(input_filename, input_file_worker_information["information_from_command_line_input"], input_file_worker_information["shared_link_reference_definitions"])
+    return exit_status, standard_output_file.buffer.getvalue(), standard_error_file.getvalue()
+
+def main():
+    "Analyze and modify the files specified with command line input, displaying or writing the results."
+    
+    # Checking if a command is given in place of an input filename, unless a file with the same name exists
+    if len(sys.argv) > 1 and sys.argv[1] in command_functions and os.path.isfile(sys.argv[1]) == False:
+        return command_functions[sys.argv[1]]()
+    
+    # Displaying files without parsing command line arguments if only the filenames of existing files are given, since building the argument parser takes longer than displaying a small file
+    if len(sys.argv) > 1 and all( command_line_argument[:1] not in ("-", "+", "=") and os.path.isfile(command_line_argument) and determine_archive_format(command_line_argument) == None for command_line_argument in sys.argv[1:] ):
+        for input_filename in sys.argv[1:]:
+            encoding_information = determine_encoding_information(input_filename)
+            with open_input_file(input_filename, encoding_information) as opened_file:
+                display_file_contents(opened_file, encoding_information)
+        return 0
+    
+    information_from_command_line_input = initial_input()
+    input_filenames = information_from_command_line_input["input_filenames"]
+    
+    # Loading shared link reference definitions once for all input files
+    shared_link_reference_definitions = None
+    if bool(information_from_command_line_input["definitions_filenames"]) == True:
+        shared_link_reference_definitions = load_shared_link_reference_definitions(information_from_command_line_input["definitions_filenames"], information_from_command_line_input["encoding"])
+    
+    # Assignment to hold the exit status
+    exit_status = 0
+    if information_from_command_line_input["number_of_worker_processes"] > 1 and len(input_filenames) > 1:
+        import concurrent.futures
+        # Processing input files concurrently, with one input file per worker process at a time
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(information_from_command_line_input["number_of_worker_processes"], len(input_filenames)), initializer=initialize_input_file_worker, initargs=(information_from_command_line_input, shared_link_reference_definitions)) as executor:
+            for input_file_exit_status, input_file_output, input_file_error_output in executor.map(process_input_file_in_worker, input_filenames):
+                sys.stdout.flush()
+                sys.stdout.buffer.write(input_file_output)
+                sys.stderr.write(input_file_error_output)
+                exit_status = max(exit_status, input_file_exit_status)
+    else:
+        for input_filename in input_filenames:
+            exit_status = max(exit_status, process_input_file(input_filename, information_from_command_line_input, shared_link_reference_definitions))
+
+    return exit_status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+#!/usr/bin/python3
+import argparse
+import json
+import os.path
+import subprocess
+import sys
+import tempfile
+
+
+# Assignment to hold the filename of the program whose memory use is measured, which is in the same directory as this file
+intramark_filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), "intramark.py")
+# Assignment to hold the command line arguments given to the program for each measured invocation, with `{}` replaced by the filename of a large Markdown file
+invocations = {"diagnostic": ["-d", "{}"], "headings": ["+H", "1", "-s", "b", "{}"], "inline_links": ["-k", "i", "{}"], "reference_links": ["-k", "r", "{}"], "footnotes": ["-f", "nue", "{}"], "table_of_contents": ["--toc", "display", "{}"], "lint": ["--lint", "links", "{}"]}
+# Assignment to hold the lines repeated to form the large Markdown file used for each measured invocation, with `{0}` replaced by the number of the repetition
+large_markdown_file_lines = [
+    "## Heading {0}\n",
+    "\n",
+    "See [link {0}], [link {0}][], [text][link {0}], [inline](http://example.com/inline/{0}) and [^{0}].  \n",
+    "Text with a footnote that is never defined[^missing {0}].\n",
+    "\n",
+    "[link {0}]: http://example.com/reference/{0}\n",
+    "[^{0}]: Footnote {0}.\n",
+    "\n"]
+
+def write_large_markdown_file(large_markdown_filename, line_count):
+    "Write a Markdown file with a number of lines, containing headings, hard line breaks, links of every kind, link reference definitions, and footnotes."
+
+    with open(large_markdown_filename, "w", encoding="utf-8") as opened_file:
+        for written_line_number in range(line_count):
+            opened_file.write(large_markdown_file_lines[written_line_number % len(large_markdown_file_lines)].format(written_line_number // len(large_markdown_file_lines)))
+
+def memory_report_of_invocation(command_line_arguments):
+    "Run the program once with `--memory-report`, returning the memory report displayed on standard error (see `display_memory_report` in intramark_engine.py)."
+
+    completed_process = subprocess.run([sys.executable, intramark_filename, "--memory-report"] + command_line_arguments, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    for current_line_string in reversed(completed_process.stderr.splitlines()):
+        if current_line_string.startswith("{"):
+            return json.loads(current_line_string)
+    raise RuntimeError("no memory report was displayed for *{}*: {}".format(" ".join(command_line_arguments), completed_process.stderr.strip()))
+
+def memory_benchmark(line_count):
+    """Measure each invocation in `invocations` on a Markdown file with a number of lines, returning a dictionary of results in the following way:
+
+    ```yaml
+    inline_links:                      # a key with an identifier indicating the invocation
+      peak_memory_per_line: 1536.0     # a numerical value indicating the peak memory of all phases, in bytes per input line
+      phases:                          # a key containing the peak memory of each phase, in bytes per input line
+        analysis: 1204.5
+      top_allocation_sites:            # a key containing the top allocation sites of each phase
+        analysis: [intramark_engine.py:1460, intramark_engine.py:1433]
+    ```
+
+    Peak memory is traced with *tracemalloc*, which counts the memory allocated by Python rather than the memory used by the process, so results are stable from run to run and a single run of each invocation suffices.
+    """
+
+    benchmark_results = {}
+    with tempfile.TemporaryDirectory() as temporary_directory_name:
+        large_markdown_filename = os.path.join(temporary_directory_name, "large.md")
+        write_large_markdown_file(large_markdown_filename, line_count)
+        for invocation_name, command_line_arguments in invocations.items():
+            memory_report = memory_report_of_invocation([ command_line_argument.format(large_markdown_filename) for command_line_argument in command_line_arguments ])
+            benchmark_results[invocation_name] = {
+                "peak_memory_per_line": memory_report["peak_memory_per_line"],
+                "phases": { phase_name: phase_memory_report["peak_memory_per_line"] for phase_name, phase_memory_report in memory_report["phases"].items() },
+                "top_allocation_sites": { phase_name: [ top_allocation_site["allocation_site"] for top_allocation_site in phase_memory_report["top_allocation_sites"] ] for phase_name, phase_memory_report in memory_report["phases"].items() }}
+    return benchmark_results
+
+def main():
+    "Measure peak memory, displaying the results as JSON, and optionally saving them or checking them against budgets."
+
+    parser = argparse.ArgumentParser(description="Measure the peak memory of intramark.py for each phase of processing a large file with *--memory-report*, so that memory use can be tracked as the program changes and checked against budgets in bytes per input line.")
+    parser.add_argument("--lines", type=int, help="Number of lines in the large Markdown file. The default is 10000.", default=10000)
+    parser.add_argument("--save", help="Save the results to a file.", default=None)
+    parser.add_argument("--budget", type=float, help="Maximum peak memory of every invocation, in bytes per input line, exiting with status 1 if it is exceeded.", default=None)
+    parser.add_argument("--budgets", help="JSON file mapping invocation names to budgets, exiting with status 1 if any budget is exceeded. Each budget is either a maximum peak memory of all phases, or an object mapping phase names to maximum peak memory, in bytes per input line.", default=None)
+    args = parser.parse_args()
+
+    benchmark_results = memory_benchmark(args.lines)
+    print(json.dumps(benchmark_results, indent=4))
+
+    if args.save != None:
+        with open(args.save, "w") as opened_file:
+            json.dump(benchmark_results, opened_file, indent=4)
+
+    # Assignment to hold the budgets for each invocation, as dictionaries mapping phase names to maximum peak memory, with `None` for the peak memory of all phases
+    invocation_budgets = {}
+    if args.budget != None:
+        for invocation_name in benchmark_results:
+            invocation_budgets[invocation_name] = {None: args.budget}
+    if args.budgets != None:
+        with open(args.budgets) as opened_file:
+            for invocation_name, invocation_budget in json.load(opened_file).items():
+                if isinstance(invocation_budget, dict):
+                    invocation_budgets.setdefault(invocation_name, {}).update(invocation_budget)
+                else:
+                    invocation_budgets.setdefault(invocation_name, {})[None] = invocation_budget
+
+    # Assignment to hold the exit status
+    exit_status = 0
+    for invocation_name, invocation_budget in invocation_budgets.items():
+        if invocation_name not in benchmark_results:
+            continue
+        for phase_name, maximum_peak_memory_per_line in invocation_budget.items():
+            if phase_name == None:
+                peak_memory_per_line = benchmark_results[invocation_name]["peak_memory_per_line"]
+                measured_description = "the peak memory"
+            elif phase_name in benchmark_results[invocation_name]["phases"]:
+                peak_memory_per_line = benchmark_results[invocation_name]["phases"][phase_name]
+                measured_description = "the peak memory of the *{}* phase".format(phase_name)
+            else:
+                continue
+            if peak_memory_per_line > maximum_peak_memory_per_line:
+                print("The *{}* invocation has exceeded its memory budget: {} is {} bytes per input line, compared with a budget of {} bytes per input line.".format(invocation_name, measured_description, peak_memory_per_line, maximum_peak_memory_per_line))
+                exit_status = 1
+
+    return exit_status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/python3
+import argparse
+import json
+import os.path
+import subprocess
+import sys
+import tempfile
+import time
+
+
+# Assignment to hold the filename of the program that is tested, which is in the same directory as this file
+intramark_filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), "intramark.py")
+# Assignment to hold the contents of each pathological Markdown file, which would take quadratic time or worse if any scanner revisited parts of a line
+pathological_markdown_file_contents = {
+    "left_brackets": "[" * 200000 + "\n",
+    "inline_link_openings": "[a](" * 50000 + "\n",
+    "right_brackets": "]" * 200000 + "\n",
+    "bracket_pairs": "[]" * 100000 + "\n",
+    "footnote_openings": "[^" * 100000 + "\n",
+    "reference_links": "".join( "See [link {0}], [link {0}][], and [text][link {0}].\n".format(link_number) for link_number in range(20000) ) + "\n" + "".join( "[link {0}]: http://example.com/{0}\n".format(link_number) for link_number in range(20000) ),
+    "collapsed_reference_links_on_one_line": "".join( "[link {0}][] ".format(link_number) for link_number in range(20000) ) + "\n\n" + "".join( "[link {0}]: http://example.com/{0}\n".format(link_number) for link_number in range(20000) ),
+    "code_spans_with_inline_links": "`c` [a](u) " * 23600 + "\n",
+    "code_spans_with_footnote_link_labels": "`c` [^a] " * 26000 + "\n\n[^a]: Footnote.\n",
+    "distinct_backtick_strings": "".join( "`" * backtick_string_length + "x" for backtick_string_length in range(1, 700) ) + " [a](u)\n"}
+# Assignment to hold each tested case as `(file contents name, command line arguments, time limit in seconds, expected exit status)`, with `{}` in the command line arguments replaced by the filename of the pathological Markdown file
+pathological_cases = {
+    "left_brackets_inline_links": ("left_brackets", ["-k", "i", "{}"], 5.0, 0),
+    "left_brackets_lint": ("left_brackets", ["--lint", "links", "{}"], 5.0, 0),
+    "inline_link_openings_inline_links": ("inline_link_openings", ["-k", "i", "{}"], 5.0, 0),
+    "inline_link_openings_reference_links": ("inline_link_openings", ["-k", "r", "{}"], 5.0, 0),
+    "right_brackets_inline_links": ("right_brackets", ["-k", "i", "{}"], 5.0, 0),
+    "bracket_pairs_inline_links": ("bracket_pairs", ["-k", "i", "{}"], 5.0, 0),
+    "footnote_openings_footnotes": ("footnote_openings", ["-f", "nue", "{}"], 5.0, 0),
+    "reference_links_inline_links": ("reference_links", ["-k", "i", "{}"], 10.0, 0),
+    "collapsed_reference_links_inline_links": ("collapsed_reference_links_on_one_line", ["-k", "i", "{}"], 10.0, 0),
+    "code_spans_with_inline_links_reference_links": ("code_spans_with_inline_links", ["-k", "r", "{}"], 5.0, 0),
+    "code_spans_with_footnote_link_labels_footnotes": ("code_spans_with_footnote_link_labels", ["-f", "nue", "{}"], 5.0, 0),
+    "distinct_backtick_strings_reference_links": ("distinct_backtick_strings", ["-k", "r", "{}"], 5.0, 0),
+    "left_brackets_maximum_line_length": ("left_brackets", ["--max-line-length", "1000", "-k", "i", "{}"], 2.0, 2),
+    "reference_links_maximum_link_count": ("reference_links", ["--max-links", "1000", "-k", "i", "{}"], 5.0, 2)}
+
+def run_pathological_case(pathological_markdown_filename, command_line_arguments, time_limit):
+    "Run the program once on a pathological Markdown file, returning the wall-clock time in seconds and the exit status, which is `None` if the program was stopped at the time limit."
+
+    start_time = time.perf_counter()
+    try:
+        completed_process = subprocess.run([sys.executable, intramark_filename] + [ command_line_argument.format(pathological_markdown_filename) for command_line_argument in command_line_arguments ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=time_limit)
+    except subprocess.TimeoutExpired:
+        return time.perf_counter() - start_time, None
+    return time.perf_counter() - start_time, completed_process.returncode
+
+def pathological_benchmark(time_limit_factor):
+    """Run each case in `pathological_cases`, returning a dictionary of results in the following way:
+
+    ```yaml
+    left_brackets_inline_links:    # a key with an identifier indicating the case
+      wall_clock_time: 0.42        # a numerical value indicating the wall-clock time in seconds
+      time_limit: 5.0              # a numerical value indicating the time limit in seconds
+      exit_status: 0               # a numerical value indicating the exit status, or null if the program was stopped at the time limit
+      passed: true                 # an item with a boolean value indicating if the program finished within the time limit with the expected exit status
+    ```
+    """
+
+    benchmark_results = {}
+    with tempfile.TemporaryDirectory() as temporary_directory_name:
+        pathological_markdown_filenames = {}
+        for file_contents_name, file_contents in pathological_markdown_file_contents.items():
+            pathological_markdown_filenames[file_contents_name] = os.path.join(temporary_directory_name, file_contents_name + ".md")
+            with open(pathological_markdown_filenames[file_contents_name], "w") as opened_file:
+                opened_file.write(file_contents)
+        for case_name, (file_contents_name, command_line_arguments, time_limit, expected_exit_status) in pathological_cases.items():
+            time_limit = time_limit * time_limit_factor
+            wall_clock_time, exit_status = run_pathological_case(pathological_markdown_filenames[file_contents_name], command_line_arguments, time_limit)
+            benchmark_results[case_name] = {
+                "wall_clock_time": round(wall_clock_time, 3),
+                "time_limit": time_limit,
+                "exit_status": exit_status,
+                "passed": exit_status == expected_exit_status and wall_clock_time <= time_limit}
+    return benchmark_results
+
+def main():
+    "Run the pathological cases, displaying the results as JSON, and exiting with status 1 if any case fails."
+
+    parser = argparse.ArgumentParser(description="Check that intramark.py processes pathological inputs, such as a line of 200,000 left brackets or 20,000 reference-style links, within a time limit for each case, and that resource limits stop processing with exit status 2, so that any scanner becoming quadratic is detected.")
+    parser.add_argument("--time-limit-factor", type=float, help="Factor by which the time limit of every case is multiplied, for slower machines. The default is 1.", default=1.0)
+    args = parser.parse_args()
+
+    benchmark_results = pathological_benchmark(args.time_limit_factor)
+    print(json.dumps(benchmark_results, indent=4))
+
+    # Assignment to hold the exit status
+    exit_status = 0
+    for case_name, case_result in benchmark_results.items():
+        if case_result["passed"] == False:
+            print("The *{}* case has failed: it took {} seconds with exit status {}, compared with a time limit of {} seconds and exit status {}.".format(case_name, case_result["wall_clock_time"], case_result["exit_status"], case_result["time_limit"], pathological_cases[case_name][3]))
+            exit_status = 1
+
+    return exit_status
+
+if __name__ == "__main__":
+    sys.exit(main())
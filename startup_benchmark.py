@@ -0,0 +1,127 @@
+#!/usr/bin/python3
+import argparse
+import json
+import os.path
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+# Assignment to hold the filename of the program whose startup is measured, which is in the same directory as this file
+intramark_filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), "intramark.py")
+# Assignment to hold the command line arguments given to the program for each measured invocation, with `{}` replaced by the filename of a small Markdown file
+invocations = {"display": ["{}"], "diagnostic": ["-d", "{}"], "modification": ["+H", "1", "{}"], "lint": ["--lint", "links", "{}"]}
+# Assignment to hold the contents of the small Markdown file used for each measured invocation
+small_markdown_file_contents = "# Heading\n\nSee [foo] and [bar](http://example.com/bar).  \nText.\n\n[foo]: http://example.com/foo\n"
+
+def wall_clock_time_of_invocation(command_line_arguments):
+    """Run the program once, returning the wall-clock time in seconds.
+    
+    The wall-clock time includes the time taken to compile the program, which `-X importtime` does not show, since a script run directly is compiled on every run rather than cached in a `.pyc` file.
+    """
+    
+    start_time = time.perf_counter()
+    subprocess.run([sys.executable, intramark_filename] + command_line_arguments, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start_time
+
+def import_time_of_invocation(command_line_arguments):
+    """Run the program once with `-X importtime`, returning the total import time in seconds, and a dictionary mapping each imported module to its own import time in seconds.
+    
+    The total import time is the sum of the cumulative import times of modules imported directly, rather than by other modules, so that no module is counted twice.
+    """
+    
+    completed_process = subprocess.run([sys.executable, "-X", "importtime", intramark_filename] + command_line_arguments, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    
+    total_import_time = 0
+    module_import_times = {}
+    for current_line_string in completed_process.stderr.splitlines():
+        # Lines are in the form `import time:       self |  cumulative | module`, with nested modules indented
+        if current_line_string.startswith("import time:") == False or "|" not in current_line_string:
+            continue
+        self_import_time, cumulative_import_time, module_name = current_line_string[len("import time:"):].split("|")
+        if self_import_time.strip().isdigit() == False:
+            continue
+        module_import_times[module_name.strip()] = int(self_import_time) / 1000000
+        if module_name.startswith("  ") == False:
+            total_import_time += int(cumulative_import_time) / 1000000
+    
+    return total_import_time, module_import_times
+
+def startup_benchmark(number_of_runs):
+    """Measure each invocation in `invocations` a number of times, returning a dictionary of results in the following way:
+    
+    ```yaml
+    display:                              # a key with an identifier indicating the invocation
+      median_wall_clock_time: 0.031       # a numerical value indicating the median wall-clock time in seconds
+      median_total_import_time: 0.012     # a numerical value indicating the median total import time in seconds
+      imported_module_count: 61           # a numerical value indicating the number of modules imported
+      slowest_imported_modules:           # a key containing the modules with the longest median import times, excluding the modules they import, in seconds
+        re: 0.002
+    ```
+    
+    Each invocation is run once before it is measured, so that compiled code is cached as it would be after the first run of an installed program. Wall-clock times are measured in runs of their own, without `-X importtime`, which slows down imports.
+    """
+    
+    benchmark_results = {}
+    with tempfile.TemporaryDirectory() as temporary_directory_name:
+        small_markdown_filename = os.path.join(temporary_directory_name, "small.md")
+        with open(small_markdown_filename, "w") as opened_file:
+            opened_file.write(small_markdown_file_contents)
+        for invocation_name, command_line_arguments in invocations.items():
+            command_line_arguments = [ command_line_argument.format(small_markdown_filename) for command_line_argument in command_line_arguments ]
+            wall_clock_times = []
+            total_import_times = []
+            module_import_times_of_runs = {}
+            wall_clock_time_of_invocation(command_line_arguments)
+            for run_number in range(number_of_runs):
+                wall_clock_times.append(wall_clock_time_of_invocation(command_line_arguments))
+                total_import_time, module_import_times = import_time_of_invocation(command_line_arguments)
+                total_import_times.append(total_import_time)
+                for module_name, module_import_time in module_import_times.items():
+                    module_import_times_of_runs.setdefault(module_name, []).append(module_import_time)
+            median_module_import_times = { module_name: statistics.median(module_import_times) for module_name, module_import_times in module_import_times_of_runs.items() }
+            benchmark_results[invocation_name] = {
+                "median_wall_clock_time": round(statistics.median(wall_clock_times), 4),
+                "median_total_import_time": round(statistics.median(total_import_times), 4),
+                "imported_module_count": len(median_module_import_times),
+                "slowest_imported_modules": { module_name: round(median_module_import_times[module_name], 4) for module_name in sorted(median_module_import_times, key=median_module_import_times.get, reverse=True)[:10] }}
+    return benchmark_results
+
+def main():
+    "Measure startup time, displaying the results as JSON, and optionally saving them or comparing them with saved results."
+    
+    parser = argparse.ArgumentParser(description="Measure the startup time of intramark.py, as wall-clock time and with `python -X importtime`, so that startup time can be tracked as the program changes.")
+    parser.add_argument("-n", "--runs", type=int, help="Number of runs of each invocation, of which the median is used.", default=20)
+    parser.add_argument("--save", help="Save the results to a file, for later comparison.", default=None)
+    parser.add_argument("--compare", help="Compare the results with results saved to a file, exiting with status 1 if the median wall-clock time or the median total import time of any invocation has increased by more than the tolerance.", default=None)
+    parser.add_argument("--tolerance", type=float, help="Allowed relative increase in median wall-clock time and median total import time when comparing, from 0 upward. The default is 0.2.", default=0.2)
+    args = parser.parse_args()
+    
+    benchmark_results = startup_benchmark(args.runs)
+    print(json.dumps(benchmark_results, indent=4))
+    
+    if args.save != None:
+        with open(args.save, "w") as opened_file:
+            json.dump(benchmark_results, opened_file, indent=4)
+    
+    # Assignment to hold the exit status
+    exit_status = 0
+    if args.compare != None:
+        with open(args.compare) as opened_file:
+            saved_benchmark_results = json.load(opened_file)
+        for invocation_name in benchmark_results:
+            if invocation_name not in saved_benchmark_results:
+                continue
+            for measurement_name, measurement_description in (("median_wall_clock_time", "median wall-clock time"), ("median_total_import_time", "median total import time")):
+                saved_measurement = saved_benchmark_results[invocation_name][measurement_name]
+                measurement = benchmark_results[invocation_name][measurement_name]
+                if measurement > saved_measurement * (1 + args.tolerance):
+                    print("Startup of the *{}* invocation has become slower: the {} is {} seconds, compared with {} seconds.".format(invocation_name, measurement_description, measurement, saved_measurement))
+                    exit_status = 1
+    
+    return exit_status
+
+if __name__ == "__main__":
+    sys.exit(main())